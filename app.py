@@ -2,47 +2,23 @@
 
 
 import os
-import logging
-import colorlog
-import matplotlib.pyplot as plt
+import sys
+from datetime import datetime
 
-from flask import Flask, render_template, request, redirect, url_for
+from flask import Flask, render_template, request, redirect, url_for, jsonify, Response, stream_with_context
 from dotenv import load_dotenv
-from utils.database import init_db,print_all_tables
+from utils.database import db, init_db,print_all_tables
 from utils.exceptions import handle_exception
+from utils.profiling import init_request_profiling
+from utils.logging_config import get_logger
 
-from services.event_service import EventService
-from services.wikipedia_service import WikipediaService
-from services.wiki_traffic_service import WikiTrafficService
-from services.peaks_service import PeaksService
-from services.arima_service import ARIMAService
-from services.cross_corr_service import CrossCorrelationService
-from services.auto_correlation_service import AutoCorrelationService
-from services.reset_service import ResetService
-
-from components.update_check_component import has_updated_today, perform_updates
-
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
-
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
-
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
-
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+from services.registry import registry
+from services.research_cache_service import RESEARCH_SECTIONS
+from utils.streaming import gzip_chunks, get_export_spool_cache, iter_file_range, parse_range
+from utils.http_cache import init_static_fingerprints, fingerprinted_url, is_not_modified, make_etag, set_cache_headers
+from utils import metrics
+
+logger = get_logger(__name__)
 
 # Load environment variables from .env file
 load_dotenv()
@@ -69,6 +45,7 @@ except Exception as e:
 # # ================ UPDATE CHECK ==========================
 # # ========================================================
 # try:
+#     from components.update_check_component import has_updated_today, perform_updates
 #     if not has_updated_today():
 #         perform_updates(app)
 # except Exception as e:
@@ -77,11 +54,15 @@ except Exception as e:
 
 
 app.register_error_handler(Exception, handle_exception)
+init_request_profiling(app)
+init_static_fingerprints(app)
 
 @app.teardown_appcontext
 def cleanup_matplotlib(exception=None):
-    """Close all Matplotlib figures at the end of each request."""
-    plt.close('all')
+    """Close all Matplotlib figures at the end of each request, if a service has loaded Matplotlib."""
+    pyplot = sys.modules.get('matplotlib.pyplot')
+    if pyplot is not None:
+        pyplot.close('all')
 
 
 @app.route('/')
@@ -99,10 +80,10 @@ def manage_events():
         event_language = request.form.get('language')
         created_datetime = request.form.get('created_datetime')
         event_code = request.form.get('event_code')
-        EventService.create_event(event_name, event_language, created_datetime, event_code)
+        registry.EventService.create_event(event_name, event_language, created_datetime, event_code)
         logger.info(">> END:: /events")
         return redirect(url_for('manage_events'))
-    events = EventService.get_all_events()
+    events = registry.EventService.get_all_events()
     logger.info(">> END:: /events")
     return render_template('events.html', events=events)
 
@@ -115,74 +96,91 @@ def manage_wikipedia_pages():
         page_views = request.form.get('views')
         event_code = request.form.get('event_code')
         url = request.form.get('url')
-        WikipediaService.create_page(page_title, page_language, page_views, event_code,url)
+        registry.WikipediaService.create_page(page_title, page_language, page_views, event_code,url)
         logger.info(">> END:: /wikipedia")
         return redirect(url_for('manage_wikipedia_pages'))
-    pages = WikipediaService.get_all_pages()
+    pages = registry.WikipediaService.get_all_pages()
     logger.info(">> END:: /wikipedia")
     return render_template('wikipedia.html', pages=pages)
 
+def _research_section(section):
+    """Return (version, items) of a research section, computed at most once per data and result version."""
+    return registry.ResearchCacheService().get_or_compute(
+        section, app.static_folder, lambda: registry.ResearchService().get_section(section, app))
+
+def _figure_urls(item):
+    """Replace an item's figure paths with fingerprinted URLs: the figure, its full-size variant, a thumbnail and a srcset."""
+    if 'figure' not in item:
+        return item
+    item = dict(item, figure=fingerprinted_url(app, item['figure']))
+    variants = item.pop('variants', None) or {'thumbnails': []}
+    item['full'] = fingerprinted_url(app, variants['full']) if 'full' in variants else item['figure']
+    thumbnails = [(width, fingerprinted_url(app, name)) for width, name in variants['thumbnails']]
+    item['thumbnail'] = thumbnails[0][1] if thumbnails else item['full']
+    if thumbnails:
+        item['srcset'] = ', '.join(f"{url} {width}w" for width, url in thumbnails)
+    return item
+
 @app.route('/research', methods=['GET', 'POST'])
+@metrics.timed('research')
 def research():
+    """Route for the research page; its sections are fetched from /api/v1/research/<section> as they are scrolled to."""
     logger.info(">> START:: /research")
-
-    # Initialize instances of services
-    wiki_traffic_service = WikiTrafficService()
-    arima_service = ARIMAService()
-    cross_corr_service = CrossCorrelationService()
-    peaks_service = PeaksService()
-    auto_corr_service = AutoCorrelationService()
-
-    # Check if directories exist
-    peaks_service.peaks_check_directory_existence()
-    arima_service.arima_check_directory_existence()
-    auto_corr_service.auto_corr_check_directory_existence()
-
-    # Get traffic data from Wikipedia API
-    merged_df = wiki_traffic_service.get_traffic_data_as_dataframe()
-    logger.info("=== created merged_df.")
-
-    # ========================================================
-    # ================ PEAKS DETECTION =======================
-    # ========================================================
-
-    # Detect peaks, using existing figures if available
-    peaks_results = peaks_service.run_peak_detection(merged_df)
-
-
-    # ========================================================
-    # ================ AUTO-CORRELATION ======================
-    # ========================================================
-    
-    # Perform auto-correlation
-    auto_corr_results = auto_corr_service.run_auto_cross_correlation(merged_df)
-
-    # ========================================================
-    # ================ CROSS-CORRELATION =====================
-    # ========================================================
-
-    merged_df = wiki_traffic_service.get_traffic_data_as_dataframe()
-
-    # Perform cross-correlation
-    cross_corr_results = cross_corr_service.cross_correlation_test(merged_df,10)
-
-    # ========================================================
-    # ================ ARIMA MODEL ===========================
-    # ========================================================
-    arima_results = arima_service.run_arima_model(app)
-
-    logger.info("=== arima model done.")
-
+    research_cache = registry.ResearchCacheService()
+    version = research_cache.get_version(app.static_folder)
+    if is_not_modified(version):
+        response = Response(status=304)
+    else:
+        response = Response(render_template('research.html'), mimetype='text/html')
     logger.info(">> END:: /research")
-    return render_template('research.html', 
-                        peaks_results=peaks_results, 
-                        arima_results=arima_results, 
-                        cross_corr_results=cross_corr_results,
-                        auto_corr_results=auto_corr_results)
+    return set_cache_headers(response, version, research_cache.max_age)
+
+@app.route('/api/v1/research/<section>')
+@metrics.timed('research_api')
+def research_section_api(section):
+    """
+    One research section as JSON: 'peaks', 'acf', 'ccf' or 'arima'.
+
+    Query parameters: series (comma-separated names), page and per_page. Responses carry
+    the research version as part of their ETag, so unchanged pages revalidate with a 304
+    without running any analysis.
+    """
+    if section not in RESEARCH_SECTIONS:
+        return jsonify({'error': f"Unknown research section '{section}'"}), 404
+    research_cache = registry.ResearchCacheService()
+    version = research_cache.get_version(app.static_folder)
+    etag = make_etag(version, section, request.query_string)
+    if is_not_modified(etag):
+        return set_cache_headers(Response(status=304), etag, research_cache.max_age)
+
+    version, items = _research_section(section)
+    series = request.args.get('series')
+    result = registry.ResearchService.paginate(
+        items,
+        series=series.split(',') if series else None,
+        page=request.args.get('page', 1, type=int),
+        per_page=request.args.get('per_page', 10, type=int)
+    )
+    result['items'] = [_figure_urls(item) for item in result['items']]
+    result['section'] = section
+    result['version'] = version
+    etag = make_etag(version, section, request.query_string)
+    return set_cache_headers(jsonify(result), etag, research_cache.max_age)
+
+@app.route('/api/research')
+def research_api():
+    """Every research section as JSON, cached and revalidated like /research."""
+    research_cache = registry.ResearchCacheService()
+    version = research_cache.get_version(app.static_folder)
+    if is_not_modified(version):
+        return set_cache_headers(Response(status=304), version, research_cache.max_age)
+    results = {section: _research_section(section)[1] for section in RESEARCH_SECTIONS}
+    version = research_cache.get_version(app.static_folder)
+    return set_cache_headers(jsonify(results), version, research_cache.max_age)
 
 @app.route('/print_files')
 def print_files():
-    reset_service = ResetService()
+    reset_service = registry.ResetService()
 
     reset_service.print_files_and_directories()
     print_all_tables(app)
@@ -190,13 +188,194 @@ def print_files():
 
 @app.route('/wiki_traffic')
 def wiki_traffic():
-    wiki_traffic_service = WikiTrafficService()
-    df = wiki_traffic_service.get_traffic_data_as_dataframe()
-    df.fillna(0, inplace=True)
-    df = df.astype(str)
-    columns = df.columns.tolist()
-    data = df.to_dict(orient='records')
-    return render_template('wiki_traffic.html', columns=columns, data=data)
+    """Route for the traffic table view; rows are paged in from /api/wiki_traffic."""
+    columns = registry.WikiTrafficService().get_all_columns()
+    return render_template('wiki_traffic.html', columns=[c for c in columns if c != 'date'])
+
+def _traffic_query_args():
+    """Parse the column and date-range filters shared by the traffic API and export."""
+    columns = request.args.get('columns')
+    start = request.args.get('start')
+    end = request.args.get('end')
+    return {
+        'columns': columns.split(',') if columns else None,
+        'start': datetime.strptime(start, '%Y-%m-%d').date() if start else None,
+        'end': datetime.strptime(end, '%Y-%m-%d').date() if end else None,
+    }
+
+@app.route('/api/wiki_traffic')
+def wiki_traffic_api():
+    """Paginated, column-selectable traffic rows as JSON."""
+    try:
+        query = _traffic_query_args()
+        traffic_page = registry.WikiTrafficService().get_traffic_page(
+            page=request.args.get('page', 1, type=int),
+            per_page=request.args.get('per_page', 100, type=int),
+            **query
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(traffic_page)
+
+@app.route('/api/rollups')
+def rollups_api():
+    """Pre-aggregated weekly, monthly or all-time views per page."""
+    try:
+        query = _traffic_query_args()
+        rollups = registry.TrafficRollupService().get_rollups(
+            series=query['columns'],
+            period=request.args.get('period', 'month'),
+            start=query['start'],
+            end=query['end']
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(rollups)
+
+@app.route('/api/v1/series/<path:name>')
+def series_api(name):
+    """
+    One series as a compact payload for the client-side chart.
+
+    JSON by default: delta-encoded daily values with peak positions (?peaks=N, 0 for none)
+    and an optional forecast from the stored ARIMA model (?forecast=days; left out when none
+    is stored, since models are never fitted here). ?format=binary returns only the values,
+    as the bytes of a little-endian Uint32Array or Float32Array described by the
+    X-Series-Start, X-Series-Dtype and X-Series-Length headers.
+    """
+    series_service = registry.SeriesChartService()
+    try:
+        forecast = request.args.get('format') != 'binary' and request.args.get('forecast', 0, type=int) > 0
+        etag = make_etag(series_service.get_version(name, forecast=forecast), name, request.query_string)
+        if is_not_modified(etag):
+            return set_cache_headers(Response(status=304), etag)
+        if request.args.get('format') == 'binary':
+            data, dtype, start, length = series_service.get_binary(name)
+            response = Response(data, mimetype='application/octet-stream')
+            response.headers['X-Series-Start'] = start.isoformat() if start else ''
+            response.headers['X-Series-Dtype'] = dtype
+            response.headers['X-Series-Length'] = str(length)
+        else:
+            response = jsonify(series_service.get_payload(
+                name,
+                peaks=request.args.get('peaks', 10, type=int),
+                horizon=request.args.get('forecast', 0, type=int)
+            ))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return set_cache_headers(response, etag)
+
+@app.route('/export/<dataset>.<fmt>')
+def export(dataset, fmt):
+    """Stream traffic data or analysis results as CSV or newline-delimited JSON, with gzip and Range support."""
+    export_service = registry.ExportService()
+    try:
+        query = _traffic_query_args() if dataset == 'traffic' else {}
+        factory, version = export_service.open_export(dataset, fmt, **query)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+
+    headers = {
+        'Content-Disposition': f'attachment; filename={dataset}.{fmt}',
+        'Accept-Ranges': 'bytes',
+        'ETag': f'"{version}"',
+    }
+    mimetype = registry.ExportService.FORMATS[fmt]
+
+    # Ranges address the identity encoding; a stale If-Range falls back to a full response
+    range_header = request.headers.get('Range')
+    if_range = request.headers.get('If-Range')
+    if range_header and (not if_range or if_range.strip('"') == version):
+        # The export is spooled once per version; its size and every slice are read back from the spool
+        spool, total = get_export_spool_cache().open(version, factory)
+        byte_range = parse_range(range_header, total)
+        if byte_range is None:
+            spool.close()
+            return Response(status=416, headers={'Content-Range': f'bytes */{total}'})
+        start, end = byte_range
+        headers['Content-Range'] = f'bytes {start}-{end}/{total}'
+        headers['Content-Length'] = str(end - start + 1)
+        return Response(iter_file_range(spool, start, end), status=206, mimetype=mimetype, headers=headers)
+
+    chunks = factory()
+    if request.accept_encodings['gzip']:
+        chunks = gzip_chunks(chunks)
+        headers['Content-Encoding'] = 'gzip'
+        headers['ETag'] = f'"{version}-gzip"'
+        headers['Vary'] = 'Accept-Encoding'
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+
+@app.route('/spikes')
+def spikes():
+    """Route for the spike events emitted by the online detector during ingest."""
+    since = request.args.get('since')
+    try:
+        since = datetime.fromisoformat(since) if since else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    spike_events = registry.SpikeDetectionService().get_recent_spikes(
+        series=request.args.get('series'),
+        since=since,
+        limit=request.args.get('limit', 100, type=int)
+    )
+    return jsonify(spike_events)
+
+@app.route('/forecast')
+def forecast():
+    """Route for N-step-ahead ARIMA forecasts from the stored models; series without one are left out."""
+    series = request.args.get('series')
+    forecasts = registry.ARIMAService().forecast(
+        registry.WikiTrafficService().get_analysis_input(),
+        horizon=request.args.get('horizon', 7, type=int),
+        alpha=request.args.get('alpha', 0.05, type=float),
+        columns=series.split(',') if series else None,
+        fit=False
+    )
+    return jsonify(forecasts)
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Stage timings, frame sizes and cache lookups in the Prometheus text format (METRICS_ENABLED=True)."""
+    if not metrics.ENABLED:
+        return Response('Metrics are disabled; set METRICS_ENABLED=True.\n', status=404, mimetype='text/plain')
+    return Response(metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+
+def create_app():
+    """
+    Return the application for WSGI servers.
+
+    With TRAFFIC_SNAPSHOT=True the stored traffic is published and mapped here, so a
+    server that preloads the app (see gunicorn.conf.py) does it once in the master and
+    every forked worker shares the same read-only pages. Series without rollups are
+    rolled up here as well.
+    """
+    # Imported here: the snapshot module needs numpy and pandas, which CRUD-only workers never load
+    from utils.traffic_snapshot import snapshot_enabled, get_traffic_snapshot
+    from repositories.duckdb_traffic_repository import close_connections
+
+    if snapshot_enabled():
+        with app.app_context():
+            try:
+                registry.WikiTrafficService().publish_traffic_snapshot()
+            except Exception as e:
+                logger.warning(f"Could not publish the traffic snapshot at startup: {e}")
+        get_traffic_snapshot().refresh()
+    # Traffic stored before the rollup table existed is rolled up once, before any worker serves totals
+    with app.app_context():
+        try:
+            registry.TrafficRollupService().backfill()
+        except Exception as e:
+            logger.warning("Could not backfill the traffic rollups at startup: %s", e)
+    # Workers must not inherit the master's pooled connections, whether the snapshot or
+    # anything else at import (such as init_db) opened them; a DuckDB file also stays
+    # locked by the process holding it, so each worker opens its own on first use
+    with app.app_context():
+        db.engine.dispose()
+    close_connections()
+    return app
 
 
 if __name__ == '__main__':
@@ -0,0 +1,67 @@
+"""Measure worker boot cost: import time, peak RSS and which heavy libraries get loaded.
+
+Each scenario runs in a fresh interpreter against a throwaway SQLite database:
+    app          import app only (what a preforking worker pays at boot)
+    crud         import app and serve /events and /wikipedia
+    all          import app and then every registered service (the old eager behaviour)
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+HEAVY_MODULES = ('pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn', 'statsmodels', 'sklearn', 'pmdarima')
+
+CHILD = """
+import json, resource, sys, time
+started = time.perf_counter()
+import app
+scenario = sys.argv[1]
+if scenario == 'crud':
+    client = app.app.test_client()
+    client.get('/events')
+    client.get('/wikipedia')
+elif scenario == 'all':
+    from services.registry import SERVICE_MODULES, registry
+    for name in SERVICE_MODULES:
+        getattr(registry, name)
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    'seconds': elapsed,
+    'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'heavy': [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def run(scenario, database):
+    env = dict(os.environ, DATABASE_URI=f"sqlite:///{database}", LOG_LEVEL='WARNING')
+    output = subprocess.run([sys.executable, '-c', CHILD, scenario], cwd=parent_dir, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per scenario; the best time is shown')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database = os.path.join(workdir, 'bench.db')
+        print(f"{'scenario':<9} {'best (s)':>9} {'rss (MB)':>9}  heavy modules loaded")
+        for scenario in ('app', 'crud', 'all'):
+            runs = [run(scenario, database) for _ in range(args.repeat)]
+            best = min(runs, key=lambda r: r['seconds'])
+            print(f"{scenario:<9} {best['seconds']:>9.3f} {best['rss_mb']:>9.1f}  {', '.join(best['heavy']) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
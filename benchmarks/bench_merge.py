@@ -0,0 +1,67 @@
+"""Benchmark the single-pass traffic merge against the old pairwise reduce merge.
+
+Usage:
+    python benchmarks/bench_merge.py [--sizes 50 500 5000] [--days 3300] [--legacy-limit 500]
+"""
+
+import os
+import sys
+import time
+import argparse
+import warnings
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.traffic_merge import merge_traffic_frames
+
+
+def make_frames(n_articles, n_days, seed=0):
+    """Build per-article frames shaped like get_wikipedia_traffic_data output, with staggered start dates."""
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp('2024-06-30')
+    frames = []
+    for i in range(n_articles):
+        length = int(rng.integers(n_days // 4, n_days + 1))
+        index = pd.date_range(end=end, periods=length, freq='D', name='timestamp')
+        views = rng.poisson(500, size=length).astype(float)
+        frames.append(pd.DataFrame({f"en_page {i}": views}, index=index))
+    return frames
+
+
+def legacy_merge(frames):
+    warnings.simplefilter('ignore', pd.errors.PerformanceWarning)
+    merged_df = reduce(lambda left, right: pd.merge(left, right, on='timestamp', how='outer', suffixes=('', '_y')), frames)
+    merged_df['date'] = pd.to_datetime(merged_df.index).date
+    return merged_df.reset_index(drop=True).sort_values(by='date')
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 500, 5000])
+    parser.add_argument('--days', type=int, default=3300)
+    parser.add_argument('--legacy-limit', type=int, default=500, help='Skip the quadratic legacy merge above this many articles')
+    args = parser.parse_args()
+
+    print(f"{'articles':>9} {'days':>6} {'single-pass (s)':>16} {'pairwise reduce (s)':>20}")
+    for size in args.sizes:
+        frames = make_frames(size, args.days)
+        new_time = time_call(merge_traffic_frames, frames)
+        legacy = f"{time_call(legacy_merge, frames):20.3f}" if size <= args.legacy_limit else f"{'skipped':>20}"
+        print(f"{size:>9} {args.days:>6} {new_time:16.3f} {legacy}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""Measure read latency on the traffic table while an ingest rewrites it, with and without SQLITE_TUNING.
+
+Each mode runs in a fresh interpreter on its own temporary SQLite file. A writer
+thread repeatedly upserts every row the way WikiTrafficService does on ingest,
+while reader threads page through the table with the /api/wiki_traffic query.
+
+Usage:
+    python benchmarks/bench_sqlite.py [--columns 50] [--days 3000] [--readers 4] [--ingests 3]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from datetime import date, timedelta
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] if ordered else float('nan')
+
+
+def run_mode(database, n_columns, n_days, n_readers, n_ingests):
+    """Run one measurement in this process; the tuning mode comes from SQLITE_TUNING."""
+    import random
+    from flask import Flask
+    from utils.database import db, init_db
+    from repositories.wiki_traffic_repository import WikiTrafficRepository
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{database}"
+    init_db(app)
+
+    columns = [f"en_page {i}" for i in range(n_columns)]
+    dates = [date(2015, 1, 1) + timedelta(days=i) for i in range(n_days)]
+    with app.app_context():
+        repo = WikiTrafficRepository()
+        repo.create_table(columns)
+        for day in dates:
+            repo.insert_or_update(day, {column: 0.0 for column in columns})
+        repo.commit()
+
+    latencies, errors = [], []
+    ingest_done = threading.Event()
+    lock = threading.Lock()
+
+    def writer():
+        started = time.perf_counter()
+        with app.app_context():
+            repo = WikiTrafficRepository()
+            repo.create_table(columns)
+            for run in range(n_ingests):
+                for day in dates:
+                    repo.insert_or_update(day, {column: float(run) for column in columns})
+                repo.commit()
+        ingest_seconds.append(time.perf_counter() - started)
+        ingest_done.set()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        with app.app_context():
+            repo = WikiTrafficRepository()
+            while not ingest_done.is_set():
+                offset = rng.randrange(0, n_days)
+                started = time.perf_counter()
+                try:
+                    repo.get_page(columns[:10], limit=100, offset=offset)
+                    db.session.commit()
+                    with lock:
+                        latencies.append(time.perf_counter() - started)
+                except Exception as e:
+                    db.session.rollback()
+                    with lock:
+                        errors.append(type(e).__name__)
+
+    ingest_seconds = []
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader, args=(i,)) for i in range(n_readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return {
+        'ingest_seconds': ingest_seconds[0],
+        'reads': len(latencies),
+        'read_p50_ms': percentile(latencies, 0.5) * 1000,
+        'read_p95_ms': percentile(latencies, 0.95) * 1000,
+        'read_max_ms': max(latencies) * 1000 if latencies else float('nan'),
+        'errors': len(errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--columns', type=int, default=50)
+    parser.add_argument('--days', type=int, default=3000)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--ingests', type=int, default=3, help='Full rewrites of the table done by the writer')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--database', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_mode(args.database, args.columns, args.days, args.readers, args.ingests)))
+        return
+
+    print(f"{'mode':<8} {'ingest (s)':>10} {'reads':>7} {'p50 (ms)':>9} {'p95 (ms)':>9} {'max (ms)':>9} {'errors':>7}")
+    for mode, tuning in (('default', 'False'), ('tuned', 'True')):
+        with tempfile.TemporaryDirectory() as workdir:
+            env = dict(os.environ, SQLITE_TUNING=tuning, LOG_LEVEL='WARNING')
+            command = [sys.executable, os.path.abspath(__file__), '--child', '--database', os.path.join(workdir, 'bench.db'),
+                       '--columns', str(args.columns), '--days', str(args.days),
+                       '--readers', str(args.readers), '--ingests', str(args.ingests)]
+            output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:<8} {result['ingest_seconds']:>10.2f} {result['reads']:>7} {result['read_p50_ms']:>9.2f} "
+              f"{result['read_p95_ms']:>9.2f} {result['read_max_ms']:>9.2f} {result['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
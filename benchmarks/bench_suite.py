@@ -0,0 +1,210 @@
+"""Time every pipeline stage on a synthetic traffic matrix and flag regressions against a baseline.
+
+Stages: merge, db_write, frame_load, peaks, acf, ccf and arima (walk-forward).
+Everything runs offline against a temporary SQLite database and temporary
+figure directories, so the working tree is left untouched.
+
+Usage:
+    python benchmarks/bench_suite.py [--pages 20] [--days 730] [--repeat 3] [--arima-series 2]
+                                     [--output results.json] [--baseline baseline.json]
+                                     [--save-baseline baseline.json] [--tolerance 0.25]
+
+The exit status is 1 when any stage is slower than the baseline by more than the tolerance.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import contextlib
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from flask import Flask
+
+from utils.database import db, init_db
+from utils.model_store import ARIMAModelStore
+from utils.traffic_merge import merge_traffic_frames
+from utils.analysis_input import AnalysisInput
+from services.wiki_traffic_service import WikiTrafficService
+from services.peaks_service import PeaksService
+from services.auto_correlation_service import AutoCorrelationService
+from services.cross_corr_service import CrossCorrelationService
+from services.arima_service import ARIMAService
+
+STAGES = ('merge', 'db_write', 'frame_load', 'peaks', 'acf', 'ccf', 'arima')
+
+
+def make_frames(n_pages, n_days, seed=0):
+    """Build per-page frames shaped like get_wikipedia_traffic_data output: weekly seasonality, a spike, staggered starts."""
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp('2024-06-30')
+    frames = []
+    for i in range(n_pages):
+        length = int(rng.integers(n_days // 2, n_days + 1))
+        index = pd.date_range(end=end, periods=length, freq='D', name='timestamp')
+        level = rng.uniform(50, 5000)
+        weekly = 1 + 0.2 * np.sin(2 * np.pi * np.arange(length) / 7)
+        views = rng.poisson(level * weekly).astype(float)
+        spike = int(rng.integers(0, length))
+        views[spike:spike + 5] *= rng.uniform(5, 20)
+        language = ('en', 'de', 'fr', 'ar')[i % 4]
+        frames.append(pd.DataFrame({f"{language}_page {i // 4}": views}, index=index))
+    return frames
+
+
+def time_stage(func, repeat):
+    """Run func `repeat` times and return its timings in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_suite(pages, days, repeat, arima_series, workdir):
+    frames = make_frames(pages, days)
+    merged_df = merge_traffic_frames(frames)
+    columns = [column for column in merged_df.columns if column != 'date']
+    # Same layout as the frame the analyses get from the database: 'date' first
+    merged_df = merged_df[['date'] + columns]
+
+    app = Flask(__name__, static_folder=os.path.join(workdir, 'static'))
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    init_db(app)
+
+    peaks_service = PeaksService()
+    peaks_service.figure_directory = os.path.join(workdir, 'peaks_figures')
+    peaks_service.csv_file_path = os.path.join(workdir, 'peaks_results.csv')
+    auto_corr_service = AutoCorrelationService()
+    auto_corr_service.figure_directory = os.path.join(workdir, 'auto_corr_figures')
+    cross_corr_service = CrossCorrelationService()
+    for directory in (peaks_service.figure_directory, auto_corr_service.figure_directory):
+        os.makedirs(directory, exist_ok=True)
+
+    results = {}
+    with app.app_context():
+        db.create_all()
+        wiki_traffic_service = WikiTrafficService()
+        repo = wiki_traffic_service.wiki_traffic_repo
+        repo.create_table(columns)
+
+        def db_write():
+            for _, row in merged_df.iterrows():
+                repo.insert_or_update(row['date'], {column: row[column] for column in columns})
+            repo.commit()
+
+        results['merge'] = time_stage(lambda: merge_traffic_frames(frames), repeat)
+        results['db_write'] = time_stage(db_write, repeat)
+        results['frame_load'] = time_stage(wiki_traffic_service.get_traffic_data_as_dataframe, repeat)
+
+        # Like /research: one immutable input is prepared and shared by every analysis
+        analysis_input = AnalysisInput.from_frame(merged_df)
+        results['peaks'] = time_stage(lambda: peaks_service.detect_peaks(analysis_input), repeat)
+        results['acf'] = time_stage(lambda: auto_corr_service.perform_auto_corr(analysis_input), repeat)
+        results['ccf'] = time_stage(lambda: cross_corr_service.cross_correlation_test(analysis_input), repeat)
+
+        if arima_series > 0:
+            arima_service = ARIMAService()
+            arima_service.figure_directory = os.path.join(workdir, 'arima_figures')
+            os.makedirs(arima_service.figure_directory, exist_ok=True)
+
+            def arima():
+                # A fresh store each run, so every series is fitted rather than served from disk
+                arima_service.model_store = ARIMAModelStore(tempfile.mkdtemp(dir=workdir))
+                frame = merged_df[['date'] + columns[:arima_series]]
+                with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                    arima_service.load_arima_results(app, frame, save_csv=False)
+
+            results['arima'] = time_stage(arima, 1)
+    return results
+
+
+def summarize(timings):
+    return {'best': min(timings), 'mean': sum(timings) / len(timings), 'runs': len(timings)}
+
+
+def compare(results, baseline, tolerance):
+    """Return the stages whose best time exceeds the baseline's by more than the tolerance."""
+    regressions = {}
+    for stage, result in results['stages'].items():
+        reference = baseline.get('stages', {}).get(stage)
+        if reference is None:
+            continue
+        ratio = result['best'] / reference['best'] if reference['best'] > 0 else float('inf')
+        result['baseline'] = reference['best']
+        result['ratio'] = ratio
+        if ratio > 1 + tolerance:
+            regressions[stage] = ratio
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=20, help='Number of synthetic pages (columns)')
+    parser.add_argument('--days', type=int, default=730, help='Length of the longest series in days')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per stage; the best run is compared (ARIMA runs once)')
+    parser.add_argument('--arima-series', type=int, default=2, help='Series put through the ARIMA walk-forward; 0 skips it')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    parser.add_argument('--baseline', help='Compare against results previously saved with --save-baseline')
+    parser.add_argument('--save-baseline', help='Also write these results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown before a stage is flagged')
+    parser.add_argument('--verbose', action='store_true', help='Keep the services\' INFO logging')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        timings = run_suite(args.pages, args.days, args.repeat, args.arima_series, workdir)
+
+    results = {
+        'meta': {
+            'pages': args.pages,
+            'days': args.days,
+            'repeat': args.repeat,
+            'arima_series': args.arima_series,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.utcnow().isoformat(),
+        },
+        'stages': {stage: summarize(timings[stage]) for stage in STAGES if stage in timings},
+    }
+
+    regressions = {}
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        if (baseline['meta']['pages'], baseline['meta']['days']) != (args.pages, args.days):
+            print(f"warning: baseline was taken at {baseline['meta']['pages']} pages x {baseline['meta']['days']} days", file=sys.stderr)
+        regressions = compare(results, baseline, args.tolerance)
+    results['regressions'] = regressions
+
+    print(f"{'stage':<12} {'best (s)':>10} {'mean (s)':>10} {'vs baseline':>12}")
+    for stage, result in results['stages'].items():
+        ratio = f"{result['ratio']:.2f}x" if 'ratio' in result else '-'
+        flag = '  REGRESSION' if stage in regressions else ''
+        print(f"{stage:<12} {result['best']:>10.4f} {result['mean']:>10.4f} {ratio:>12}{flag}")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(results, file, indent=2)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
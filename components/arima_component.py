@@ -1,30 +1,9 @@
 from services.arima_service import ARIMAService
 from services.wiki_traffic_service import WikiTrafficService
 
-import logging
-import colorlog
+from utils.logging_config import get_logger
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
-
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
-
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
-
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+logger = get_logger(__name__)
 
 
 def load_default_arima(app):
@@ -37,5 +16,8 @@ def load_default_arima(app):
 
     # arima_service.run_arima_model(wiki_traffic_service.get_traffic_data_as_dataframe(),arima_existing_figures,7)
 
+    # Fit and update the stored models here, so the forecast routes only read them
+    arima_service.refresh_models(wiki_traffic_service.get_analysis_input())
+
     logger.info("Default arima results loaded successfully.")
     logger.info(">> END:: load_default_arima")
@@ -1,37 +1,16 @@
 from services.auto_correlation_service import AutoCorrelationService
 from services.wiki_traffic_service import WikiTrafficService
 
-import logging
-import colorlog
+from utils.logging_config import get_logger
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
-
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
-
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
-
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+logger = get_logger(__name__)
 
 def load_default_auto_correlation(app):
     logger.info(">> START:: load_default_auto_correlation")
     auto_correlation_service = AutoCorrelationService()
     wiki_traffic_service = WikiTrafficService()
 
-    wiki_traffic_df = wiki_traffic_service.get_traffic_data_as_dataframe()
+    wiki_traffic_df = wiki_traffic_service.get_analysis_input()
     auto_correlation_service.reset_directory()
     auto_correlation_service.auto_corr_check_directory_existence()
     auto_correlation_service.perform_auto_corr(wiki_traffic_df)
@@ -1,30 +1,9 @@
 from services.peaks_service import PeaksService
 
 
-import logging
-import colorlog
+from utils.logging_config import get_logger
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
-
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
-
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
-
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+logger = get_logger(__name__)
 
 
 def reset_paeks(app):
@@ -3,6 +3,7 @@ import json
 
 from datetime import datetime
 from utils.database import create_tables
+from utils.profiling import profile_run
 
 from components.events_component import load_default_events
 from components.wikipedia_component import load_default_wikipedia_pages
@@ -37,7 +38,7 @@ def perform_updates(app):
     reset_service.remove_files_and_directories()
     reset_service.create_directories()
 
-    with app.app_context():
+    with app.app_context(), profile_run('perform_updates'):
         create_tables(app)
         load_default_events()
         load_default_wikipedia_pages()
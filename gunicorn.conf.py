@@ -0,0 +1,17 @@
+"""Gunicorn settings for serving the app with preforked workers.
+
+    gunicorn -c gunicorn.conf.py
+
+The app is loaded once in the master before forking. With TRAFFIC_SNAPSHOT=True the
+traffic matrix is published and memory-mapped there, so all workers share one copy.
+create_app() disposes of the master's database connections before the fork, and each
+worker starts its own logging listener (see utils.logging_config.restart_listener).
+"""
+
+import os
+
+wsgi_app = 'app:create_app()'
+preload_app = True
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', 5000)}")
+workers = int(os.environ.get('GUNICORN_WORKERS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))  # /research can take minutes on a cold start
@@ -0,0 +1,15 @@
+from utils.database import db
+
+class DataVersion(db.Model):
+    """Random token rewritten with every change of a dataset, so each process can tell when its copies are stale."""
+    __tablename__ = 'dataVersions'
+    name = db.Column(db.String(50), primary_key=True)  # e.g. 'traffic'
+    token = db.Column(db.String(32), nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+    def as_dict(self):
+        return {
+                'name': self.name,
+                'token': self.token,
+                'updated_at': self.updated_at.isoformat()
+                }
@@ -3,10 +3,10 @@ from utils.database import db
 class Event(db.Model):
     __tablename__ = 'events'
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(80), nullable=False)
+    name = db.Column(db.String(80), nullable=False, index=True)
     language = db.Column(db.String(80), nullable=False)
     created_datetime = db.Column(db.String(80), nullable=False)
-    event_code = db.Column(db.Integer, nullable=False)
+    event_code = db.Column(db.Integer, nullable=False, index=True)
 
     def as_dict(self):
         return {
@@ -0,0 +1,32 @@
+import zlib
+import numpy as np
+from utils.database import db
+
+# Sentinel stored for hours with no count (e.g. before the article existed)
+MISSING_COUNT = np.iinfo(np.uint32).max
+
+
+class HourlyTrafficChunk(db.Model):
+    __tablename__ = 'wikiTrafficHourly'
+    series = db.Column(db.String(200), primary_key=True)
+    month = db.Column(db.String(7), primary_key=True)  # 'YYYY-MM'
+    counts = db.Column(db.LargeBinary, nullable=False)  # zlib-compressed uint32, one per hour of the month
+
+    @staticmethod
+    def encode_counts(values):
+        """Pack float hourly views (NaN for gaps) into compressed uint32 counts."""
+        values = np.asarray(values, dtype=float)
+        counts = np.where(np.isnan(values), MISSING_COUNT, values).astype('<u4')
+        return zlib.compress(counts.tobytes())
+
+    def decode_counts(self):
+        """Unpack the stored counts as float32 hourly views with NaN for gaps."""
+        counts = np.frombuffer(zlib.decompress(self.counts), dtype='<u4')
+        return np.where(counts == MISSING_COUNT, np.nan, counts).astype(np.float32)
+
+    def as_dict(self):
+        return {
+                'series': self.series,
+                'month': self.month,
+                'hours': len(self.decode_counts())
+                }
@@ -0,0 +1,45 @@
+from utils.database import db
+
+class SpikeState(db.Model):
+    """Running EWMA statistics for one tracked series; constant size per series."""
+    __tablename__ = 'spikeStates'
+    series = db.Column(db.String(200), primary_key=True)
+    granularity = db.Column(db.String(10), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    mean = db.Column(db.Float, nullable=False, default=0.0)
+    var = db.Column(db.Float, nullable=False, default=0.0)
+    last_timestamp = db.Column(db.DateTime, nullable=True)
+
+    def as_dict(self):
+        return {
+                'series': self.series,
+                'granularity': self.granularity,
+                'count': self.count,
+                'mean': self.mean,
+                'var': self.var,
+                'last_timestamp': self.last_timestamp.isoformat() if self.last_timestamp else None
+                }
+
+
+class SpikeEvent(db.Model):
+    __tablename__ = 'spikeEvents'
+    id = db.Column(db.Integer, primary_key=True)
+    series = db.Column(db.String(200), nullable=False, index=True)
+    granularity = db.Column(db.String(10), nullable=False)
+    timestamp = db.Column(db.DateTime, nullable=False, index=True)
+    value = db.Column(db.Float, nullable=False)
+    baseline = db.Column(db.Float, nullable=False)
+    zscore = db.Column(db.Float, nullable=False)
+    detected_at = db.Column(db.DateTime, nullable=False)
+
+    def as_dict(self):
+        return {
+                'id': self.id,
+                'series': self.series,
+                'granularity': self.granularity,
+                'timestamp': self.timestamp.isoformat(),
+                'value': self.value,
+                'baseline': self.baseline,
+                'zscore': self.zscore,
+                'detected_at': self.detected_at.isoformat()
+                }
@@ -0,0 +1,26 @@
+from utils.database import db
+
+class TrafficRollup(db.Model):
+    """Pre-aggregated views of one series over a week, a month or its whole history."""
+    __tablename__ = 'trafficRollups'
+    series = db.Column(db.String(200), primary_key=True)
+    period = db.Column(db.String(10), primary_key=True)  # 'week', 'month' or 'total'
+    period_start = db.Column(db.Date, primary_key=True)  # Monday of the week, or first of the (first) month
+    total = db.Column(db.Float, nullable=False, default=0.0)
+    days = db.Column(db.Integer, nullable=False, default=0)  # days with a recorded count
+    max = db.Column(db.Float, nullable=True)
+
+    @property
+    def mean(self):
+        return self.total / self.days if self.days else 0.0
+
+    def as_dict(self):
+        return {
+                'series': self.series,
+                'period': self.period,
+                'period_start': self.period_start.isoformat(),
+                'total': self.total,
+                'days': self.days,
+                'mean': self.mean,
+                'max': self.max
+                }
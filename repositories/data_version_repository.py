@@ -0,0 +1,21 @@
+import uuid
+from datetime import datetime
+from models.data_version import DataVersion
+from utils.database import db
+
+class DataVersionRepository:
+    @staticmethod
+    def get_token(name):
+        version = DataVersion.query.get(name)
+        return version.token if version is not None else None
+
+    @staticmethod
+    def bump(name):
+        """Give the dataset a new token; committed together with the caller's changes."""
+        version = DataVersion.query.get(name)
+        if version is None:
+            version = DataVersion(name=name)
+            db.session.add(version)
+        version.token = uuid.uuid4().hex
+        version.updated_at = datetime.utcnow()
+        return version.token
@@ -0,0 +1,308 @@
+import os
+import threading
+
+try:
+    import duckdb
+except ImportError:  # optional dependency, only needed with TRAFFIC_BACKEND=duckdb
+    duckdb = None
+
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Long layout: one row per series and day, which DuckDB stores and scans column by column
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS traffic (
+    series VARCHAR NOT NULL,
+    date DATE NOT NULL,
+    views DOUBLE NOT NULL,
+    PRIMARY KEY (series, date)
+);
+CREATE TABLE IF NOT EXISTS dates (
+    date DATE PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS versions (
+    name VARCHAR PRIMARY KEY,
+    token VARCHAR
+)
+"""
+
+# Entry of the versions table holding the SQLite traffic version token the copy matches
+TRAFFIC_VERSION = 'traffic'
+
+# date_trunc units of the rollup periods; DuckDB weeks start on Monday like ROLLUP_PERIODS['week']
+TRUNC_UNITS = {'week': 'week', 'month': 'month'}
+
+# Connections of this process, opened on first use; a forked child starts without any
+_connections = {}
+_connections_lock = threading.Lock()
+_unavailable = False
+# Connections inherited from the parent process: never used, and never closed, since
+# closing them could checkpoint a database the parent still has open
+_inherited_connections = []
+
+
+def traffic_backend():
+    """Storage engine for analytical traffic reads (TRAFFIC_BACKEND): 'sqlite' (default) or 'duckdb'."""
+    return os.environ.get('TRAFFIC_BACKEND', 'sqlite').lower()
+
+
+def get_analytics_repository():
+    """
+    Return the DuckDB repository when TRAFFIC_BACKEND=duckdb, else None.
+
+    The file is opened by the first call in each process. A missing package or a
+    database file locked by another process is logged once per process and answered
+    with None, so reads fall back to SQLite; ingests refuse to run instead.
+    """
+    global _unavailable
+    if traffic_backend() != 'duckdb' or _unavailable:
+        return None
+    try:
+        return DuckDBTrafficRepository()
+    except Exception as e:
+        _unavailable = True
+        logger.warning("DuckDB traffic backend unavailable, using SQLite: %s", e)
+        return None
+
+
+def close_connections():
+    """Close this process's DuckDB connections, e.g. in a server master before it forks workers."""
+    with _connections_lock:
+        for connection in _connections.values():
+            connection.close()
+        _connections.clear()
+
+
+def _forget_connections_after_fork():
+    global _connections_lock, _unavailable
+    _inherited_connections.extend(_connections.values())
+    _connections.clear()
+    _connections_lock = threading.Lock()
+    _unavailable = False
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_connections_after_fork)
+
+
+def _literal(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _identifier(value):
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _connect(path):
+    with _connections_lock:
+        if path not in _connections:
+            if path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            connection = duckdb.connect(path)
+            connection.execute(SCHEMA)
+            # Stores written before the dates table existed only know the days with a count
+            connection.execute("INSERT OR IGNORE INTO dates SELECT DISTINCT date FROM traffic "
+                               "WHERE NOT EXISTS (SELECT 1 FROM dates)")
+            _connections[path] = connection
+        return _connections[path]
+
+
+class DuckDBTrafficRepository:
+    """
+    Columnar copy of the daily traffic, kept in an embedded DuckDB file (DUCKDB_PATH).
+
+    SQLite stays the system of record; this store is written on every ingest and
+    answers the analytical reads (pivots to the wide frame, range filters, rollups
+    and rolling windows) inside DuckDB, returning pandas/NumPy results directly.
+    A DuckDB file can only be opened for writing by one process at a time.
+
+    The copy records the SQLite traffic version token it was written from (see
+    get_version), so readers can tell when it is behind the system of record.
+    """
+
+    def __init__(self, path=None):
+        if duckdb is None:
+            raise ImportError("TRAFFIC_BACKEND=duckdb requires the 'duckdb' package (pip install duckdb)")
+        self.path = path or os.environ.get('DUCKDB_PATH', 'instance/traffic.duckdb')
+        self.connection = _connect(self.path)
+
+    def _cursor(self):
+        # Cursors are independent connections to the same database, safe to use from any thread
+        return self.connection.cursor()
+
+    @staticmethod
+    def _range_filters(start=None, end=None):
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("date >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("date <= ?")
+            params.append(end)
+        return clauses, params
+
+    @staticmethod
+    def _insert(cursor, df, columns):
+        incoming = df[list(columns)].astype(float)
+        incoming.insert(0, 'date', df['date'])
+        cursor.register('incoming', incoming)
+        # Every stored day is kept, with or without counts, as SQLite keeps its rows
+        cursor.execute("INSERT OR IGNORE INTO dates SELECT DISTINCT CAST(date AS DATE) FROM incoming")
+        cursor.execute("INSERT INTO traffic SELECT series, CAST(date AS DATE), views "
+                       "FROM (UNPIVOT incoming ON COLUMNS(* EXCLUDE (date)) INTO NAME series VALUE views) "
+                       "WHERE NOT isnan(views)")
+        cursor.unregister('incoming')
+
+    @staticmethod
+    def _set_version(cursor, version):
+        cursor.execute("INSERT OR REPLACE INTO versions VALUES (?, ?)", [TRAFFIC_VERSION, version])
+
+    def replace_frame(self, df, columns, version=None):
+        """
+        Replace the stored days of the given series with a wide ingest frame.
+
+        Rows of those series inside the frame's date range are deleted first, so days
+        that lost their count are not left behind; NaN cells are not stored.
+
+        Parameters:
+        df (pd.DataFrame): 'date' column and the series columns.
+        columns (list): Series to replace.
+        version (str): SQLite traffic version token the store matches afterwards, if given.
+        """
+        if df.empty or not columns:
+            return
+        cursor = self._cursor()
+        try:
+            cursor.execute("BEGIN TRANSACTION")
+            cursor.execute(f"DELETE FROM traffic WHERE series IN ({', '.join(_literal(c) for c in columns)}) "
+                           "AND date BETWEEN CAST(? AS DATE) AND CAST(? AS DATE)", [min(df['date']), max(df['date'])])
+            self._insert(cursor, df, columns)
+            if version is not None:
+                self._set_version(cursor, version)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.close()
+
+    def load(self, frames, columns, version):
+        """
+        Replace the whole store with the given wide frames in one transaction.
+
+        Parameters:
+        frames (iterable): DataFrames with a 'date' column and the series columns.
+        columns (list): Series columns of the frames.
+        version (str): SQLite traffic version token the frames were read at.
+        """
+        cursor = self._cursor()
+        try:
+            cursor.execute("BEGIN TRANSACTION")
+            cursor.execute("DELETE FROM traffic")
+            cursor.execute("DELETE FROM dates")
+            for df in frames:
+                if not df.empty and columns:
+                    self._insert(cursor, df, columns)
+            self._set_version(cursor, version)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.close()
+
+    def get_version(self):
+        """SQLite traffic version token the stored copy was written from, or None."""
+        cursor = self._cursor()
+        try:
+            row = cursor.execute("SELECT token FROM versions WHERE name = ?", [TRAFFIC_VERSION]).fetchone()
+            return row[0] if row else None
+        finally:
+            cursor.close()
+
+    def count(self):
+        cursor = self._cursor()
+        try:
+            return cursor.execute("SELECT count(*) FROM traffic").fetchone()[0]
+        finally:
+            cursor.close()
+
+    def get_frame(self, columns, start=None, end=None):
+        """
+        Pivot the stored series into the wide layout: a 'date' column and one column per series.
+
+        Parameters:
+        columns (list): Series to include, in output order.
+        start (date): First date to include.
+        end (date): Last date to include.
+
+        Returns:
+        pd.DataFrame: One row per stored day, like the SQLite table, NaN where a series has no count.
+        """
+        range_clauses, params = self._range_filters(start, end)
+        day_filter = f"WHERE {' AND '.join(range_clauses)} " if range_clauses else ""
+        series_list = ', '.join(_literal(c) for c in columns)
+        clauses = range_clauses + [f"series IN ({series_list})"]
+        query = (f"WITH wide AS (PIVOT (SELECT series, date, views FROM traffic WHERE {' AND '.join(clauses)}) "
+                 f"ON series IN ({series_list}) USING first(views) GROUP BY date) "
+                 f"SELECT date, {', '.join(_identifier(c) for c in columns)} "
+                 f"FROM (SELECT date FROM dates {day_filter}) AS days LEFT JOIN wide USING (date) ORDER BY date")
+        cursor = self._cursor()
+        try:
+            df = cursor.execute(query, params + params).df()
+        finally:
+            cursor.close()
+        df['date'] = df['date'].dt.date
+        return df
+
+    def get_series(self, column, start=None, end=None):
+        """Read the (date, views) rows of one series in date order, as WikiTrafficRepository.get_series does."""
+        clauses, params = self._range_filters(start, end)
+        cursor = self._cursor()
+        try:
+            return cursor.execute(f"SELECT date, views FROM traffic WHERE series = ? "
+                                  f"{''.join(' AND ' + clause for clause in clauses)} ORDER BY date",
+                                  [column] + params).fetchall()
+        finally:
+            cursor.close()
+
+    def get_rolling_mean(self, column, window, start=None, end=None):
+        """
+        Trailing mean of one series over `window` stored days, computed with a window function.
+
+        Returns:
+        dict: NumPy arrays 'date' and 'mean'.
+        """
+        clauses, params = self._range_filters(start, end)
+        query = ("SELECT date, avg(views) OVER (ORDER BY date ROWS BETWEEN ? PRECEDING AND CURRENT ROW) AS mean "
+                 f"FROM traffic WHERE series = ? {''.join(' AND ' + clause for clause in clauses)} ORDER BY date")
+        cursor = self._cursor()
+        try:
+            return cursor.execute(query, [window - 1, column] + params).fetchnumpy()
+        finally:
+            cursor.close()
+
+    def get_rollups(self, columns, period, start=None, end=None):
+        """
+        Aggregate series into calendar buckets.
+
+        Parameters:
+        columns (list): Series to aggregate.
+        period (str): 'week' or 'month'.
+        start (date): First day to include.
+        end (date): Last day to include.
+
+        Returns:
+        pd.DataFrame: series, period_start, total, days and max, one row per series and bucket.
+        """
+        clauses, params = self._range_filters(start, end)
+        clauses.append(f"series IN ({', '.join(_literal(c) for c in columns)})")
+        query = (f"SELECT series, CAST(date_trunc('{TRUNC_UNITS[period]}', date) AS DATE) AS period_start, "
+                 "sum(views) AS total, count(views) AS days, max(views) AS max "
+                 f"FROM traffic WHERE {' AND '.join(clauses)} GROUP BY ALL ORDER BY ALL")
+        cursor = self._cursor()
+        try:
+            return cursor.execute(query, params).df()
+        finally:
+            cursor.close()
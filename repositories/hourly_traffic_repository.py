@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+from models.hourly_traffic import HourlyTrafficChunk
+from utils.database import db
+
+class HourlyTrafficRepository:
+    @staticmethod
+    def upsert_chunk(series, month, values):
+        """
+        Store the hours of one series and month, merged into what is already stored.
+
+        values starts at the first hour of the month; NaN hours keep their stored count, so a
+        fetch window that starts mid-month does not wipe the hours before it.
+        """
+        chunk = HourlyTrafficChunk.query.get((series, month))
+        values = np.asarray(values, dtype=float)
+        if chunk:
+            stored = chunk.decode_counts().astype(float)
+            merged = np.full(max(len(stored), len(values)), np.nan)
+            merged[:len(stored)] = stored
+            fetched = ~np.isnan(values)
+            merged[:len(values)][fetched] = values[fetched]
+            chunk.counts = HourlyTrafficChunk.encode_counts(merged)
+        else:
+            db.session.add(HourlyTrafficChunk(series=series, month=month, counts=HourlyTrafficChunk.encode_counts(values)))
+
+    @staticmethod
+    def commit():
+        db.session.commit()
+
+    @staticmethod
+    def get_all_series():
+        return [row.series for row in db.session.query(HourlyTrafficChunk.series).distinct().order_by(HourlyTrafficChunk.series)]
+
+    @staticmethod
+    def get_series(series, start=None, end=None):
+        """Return one series as an hourly pd.Series, reading only the month chunks overlapping [start, end]."""
+        query = HourlyTrafficChunk.query.filter_by(series=series)
+        if start is not None:
+            query = query.filter(HourlyTrafficChunk.month >= pd.Timestamp(start).strftime('%Y-%m'))
+        if end is not None:
+            query = query.filter(HourlyTrafficChunk.month <= pd.Timestamp(end).strftime('%Y-%m'))
+        chunks = query.order_by(HourlyTrafficChunk.month).all()
+        if not chunks:
+            return pd.Series(dtype=np.float32, name=series)
+
+        parts = []
+        for chunk in chunks:
+            values = chunk.decode_counts()
+            index = pd.date_range(pd.Timestamp(f"{chunk.month}-01"), periods=len(values), freq='H')
+            parts.append(pd.Series(values, index=index))
+        result = pd.concat(parts).rename(series)
+        # Month chunks are padded from their first hour; trim that padding away
+        if result.first_valid_index() is None:
+            return result.iloc[0:0]
+        result = result.loc[result.first_valid_index():result.last_valid_index()]
+        return result.loc[start:end]
@@ -0,0 +1,28 @@
+from models.spike import SpikeState, SpikeEvent
+from utils.database import db
+
+class SpikeRepository:
+    @staticmethod
+    def get_state(series, granularity):
+        return SpikeState.query.get((series, granularity))
+
+    @staticmethod
+    def add_state(state):
+        db.session.add(state)
+
+    @staticmethod
+    def add_event(event):
+        db.session.add(event)
+
+    @staticmethod
+    def commit():
+        db.session.commit()
+
+    @staticmethod
+    def get_events(series=None, since=None, limit=100):
+        query = SpikeEvent.query
+        if series:
+            query = query.filter_by(series=series)
+        if since is not None:
+            query = query.filter(SpikeEvent.timestamp >= since)
+        return query.order_by(SpikeEvent.timestamp.desc()).limit(limit).all()
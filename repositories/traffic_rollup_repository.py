@@ -0,0 +1,50 @@
+from sqlalchemy import func
+from models.traffic_rollup import TrafficRollup
+from utils.database import db
+
+class TrafficRollupRepository:
+    @staticmethod
+    def upsert(series, period, period_start, total, days, max_value):
+        rollup = TrafficRollup.query.get((series, period, period_start))
+        if rollup is None:
+            rollup = TrafficRollup(series=series, period=period, period_start=period_start)
+            db.session.add(rollup)
+        rollup.total = total
+        rollup.days = days
+        rollup.max = max_value
+
+    @staticmethod
+    def delete_total(series):
+        TrafficRollup.query.filter_by(series=series, period='total').delete()
+
+    @staticmethod
+    def commit():
+        db.session.commit()
+
+    @staticmethod
+    def get_total(series):
+        return TrafficRollup.query.filter_by(series=series, period='total').first()
+
+    @staticmethod
+    def get_rolled_up_series():
+        """Names of the series that have an all-time rollup."""
+        return {series for series, in db.session.query(TrafficRollup.series).filter_by(period='total')}
+
+    @staticmethod
+    def summarize_months(series):
+        """Fold the monthly rollups of a series into (first month, total, days, max)."""
+        return db.session.query(
+            func.min(TrafficRollup.period_start), func.sum(TrafficRollup.total),
+            func.sum(TrafficRollup.days), func.max(TrafficRollup.max)
+        ).filter_by(series=series, period='month').one()
+
+    @staticmethod
+    def get_rollups(series=None, period='month', start=None, end=None):
+        query = TrafficRollup.query.filter_by(period=period)
+        if series:
+            query = query.filter(TrafficRollup.series.in_(series))
+        if start is not None:
+            query = query.filter(TrafficRollup.period_start >= start)
+        if end is not None:
+            query = query.filter(TrafficRollup.period_start <= end)
+        return query.order_by(TrafficRollup.series, TrafficRollup.period_start).all()
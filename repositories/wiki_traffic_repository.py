@@ -1,5 +1,5 @@
 
-from sqlalchemy import Table, Column, Date, Float, MetaData
+from sqlalchemy import Table, Column, Date, Float, MetaData, select, func
 from utils.database import db
 
 class WikiTrafficRepository:
@@ -49,4 +49,61 @@ class WikiTrafficRepository:
     def get_by_date(self, date):
         if self.table is None:
             self.table = Table('wikiTraffic', self.metadata, autoload_with=db.engine)
-        return db.session.query(self.table).filter(self.table.c.date == date).first()
\ No newline at end of file
+        return db.session.query(self.table).filter(self.table.c.date == date).first()
+
+    def _range_filters(self, start=None, end=None):
+        filters = []
+        if start is not None:
+            filters.append(self.table.c.date >= start)
+        if end is not None:
+            filters.append(self.table.c.date <= end)
+        return filters
+
+    def count(self, start=None, end=None):
+        if self.table is None:
+            self.table = Table('wikiTraffic', self.metadata, autoload_with=db.engine)
+        query = select(func.count()).select_from(self.table).where(*self._range_filters(start, end))
+        return db.session.execute(query).scalar()
+
+    def max_date(self):
+        if self.table is None:
+            self.table = Table('wikiTraffic', self.metadata, autoload_with=db.engine)
+        return db.session.execute(select(func.max(self.table.c.date))).scalar()
+
+    def get_page(self, columns, start=None, end=None, limit=100, offset=0):
+        """Read one page of rows holding only the date and the requested columns, using the date primary key."""
+        if self.table is None:
+            self.table = Table('wikiTraffic', self.metadata, autoload_with=db.engine)
+        query = (select(self.table.c.date, *[self.table.c[c] for c in columns])
+                 .where(*self._range_filters(start, end))
+                 .order_by(self.table.c.date)
+                 .limit(limit).offset(offset))
+        return db.session.execute(query).all()
+
+    def get_series(self, column, start=None, end=None):
+        """Read the date and a single series column, skipping days without a count."""
+        if self.table is None:
+            self.table = Table('wikiTraffic', self.metadata, autoload_with=db.engine)
+        query = (select(self.table.c.date, self.table.c[column])
+                 .where(self.table.c[column].isnot(None), *self._range_filters(start, end))
+                 .order_by(self.table.c.date))
+        return db.session.execute(query).all()
+
+    def iter_rows(self, columns, start=None, end=None, batch_size=1000):
+        """Yield rows in date order, one keyset-paginated batch at a time."""
+        if self.table is None:
+            self.table = Table('wikiTraffic', self.metadata, autoload_with=db.engine)
+        last_date = None
+        while True:
+            filters = self._range_filters(start, end)
+            if last_date is not None:
+                filters.append(self.table.c.date > last_date)
+            query = (select(self.table.c.date, *[self.table.c[c] for c in columns])
+                     .where(*filters)
+                     .order_by(self.table.c.date)
+                     .limit(batch_size))
+            batch = db.session.execute(query).all()
+            if not batch:
+                return
+            yield from batch
+            last_date = batch[-1][0]
@@ -3,40 +3,62 @@ import warnings
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-import logging
-import colorlog
 import numpy as np
+import hashlib
 
 from pmdarima import auto_arima
 from statsmodels.tsa.arima.model import ARIMA
 from services.wiki_traffic_service import WikiTrafficService
+from utils.model_store import get_model_store
+from utils.metrics import timed
+from utils.analysis_input import AnalysisInput
+from utils.figures import figure_variants
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error
 from sklearn.metrics import mean_absolute_error
+from utils.logging_config import get_logger
 
+logger = get_logger(__name__)
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
 
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
 
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
+def baseline_forecasts(values, season=7, alpha=0.3):
+    """
+    One-step-ahead baseline forecasts for a whole traffic matrix at once.
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+    :param values: (days, series) array, NaN before a series starts.
+    :param season: Period of the seasonal-naive forecaster.
+    :param alpha: Smoothing factor of the exponential smoothing forecaster.
+    :return: Dictionary of method name to a (days, series) array where row t only uses rows before t.
+    """
+    n_rows, n_series = values.shape
+    previous = np.full_like(values, np.nan)
+    previous[1:] = values[:-1]
 
+    seasonal_naive = np.full_like(values, np.nan)
+    seasonal_naive[season:] = values[:-season]
+
+    # Drift: last value plus the average change since the series started
+    first = (~np.isnan(values)).argmax(axis=0)
+    first_value = values[first, np.arange(n_series)]
+    steps = np.arange(n_rows)[:, None] - 1 - first
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = np.where(steps > 0, (previous - first_value) / steps, 0.0)
+    drift = previous + slope
+
+    exponential_smoothing = np.full_like(values, np.nan)
+    level = np.full(n_series, np.nan)
+    for t in range(n_rows):
+        exponential_smoothing[t] = level
+        observed = values[t]
+        smoothed = alpha * observed + (1 - alpha) * level
+        level = np.where(np.isnan(level), observed, np.where(np.isnan(observed), level, smoothed))
+
+    return {
+        'seasonal_naive': seasonal_naive,
+        'exponential_smoothing': exponential_smoothing,
+        'drift': drift,
+    }
 
 
 class ARIMAService:
@@ -46,6 +68,15 @@ class ARIMAService:
         self.figure_directory = 'static/arima_figures'
         self.csv_file_path = './files/arima_results.csv'
         self.wiki_traffic_service = WikiTrafficService()
+        self.model_store = get_model_store()
+        # auto_arima prints every candidate model it tries when tracing is on
+        self.trace = os.environ.get('ARIMA_TRACE', 'False').lower() == 'true'
+
+        # Baseline tier: series whose best baseline stays under this relative MAE skip auto_arima
+        self.tiered = os.environ.get('ARIMA_TIERED', 'True').lower() == 'true'
+        self.baseline_threshold = float(os.environ.get('ARIMA_BASELINE_THRESHOLD', 0.2))
+        self.baseline_season = int(os.environ.get('ARIMA_BASELINE_SEASON', 7))
+        self.baseline_alpha = float(os.environ.get('ARIMA_BASELINE_ALPHA', 0.3))
 
     def arima_check_directory_existence(self):
         self.logger.info(">> START:: arima_check_directory_existence")
@@ -66,9 +97,12 @@ class ARIMAService:
                         'Subject': subject,
                         'Date': date,
                         'Forecast': forecast,
+                        'Lower': arima_data.get('lower'),
+                        'Upper': arima_data.get('upper'),
                         'Actual': actual,
                         'Error': error,
-                        'MAE': mae
+                        'MAE': mae,
+                        'Model': arima_data.get('model')
                     })
 
         df = pd.DataFrame(rows)
@@ -102,38 +136,33 @@ class ARIMAService:
         else:
             self.logger.info("       ARIMA figures directory is empty. Loading default ARIMA results.")
             try:
-                self.load_arima_results(app,self.wiki_traffic_service.get_traffic_data_as_dataframe())
+                self.run_backtest(app, self.wiki_traffic_service.get_analysis_input())
             except Exception as e:
                 self.logger.error(f"Error running ARIMA model: {e}")
 
-    def load_arima_results(self, app, merged_df):
+    def load_arima_results(self, app, merged_df, columns=None, save_csv=True):
         self.logger.info(">> START:: load_arima_results")
         
         # Store all results and figure filenames
         all_results = {}
         all_fig_filenames = []
 
-        # Parse the date column correctly and set it as the index
-        merged_df['date'] = pd.to_datetime(merged_df['date'], format='%Y-%m')  # Change 1
-        merged_df.set_index('date', inplace=True)  # Change 2
-
-        # Iterate over each column (time series) in the DataFrame
-        for column_name in merged_df.columns:
-            app.logger.info(f"Processing {column_name}")
+        # Dates are parsed once by the input; each series is a float copy of its observed days
+        analysis_input = AnalysisInput.coerce(merged_df)
 
-            # Skip the 'date' column
-            if column_name == 'date':
-                continue
+        # Iterate over each series, or only the requested ones
+        for column_name in (analysis_input.columns if columns is None else columns):
+            self.logger.debug("Processing %s", column_name)
 
-            # Drop rows with NaN values for the specific column
-            series = merged_df[column_name].dropna()
+            # The series from its first to its last day with a count
+            series = analysis_input.series(column_name)
 
             # Split the data into training and testing sets
             train_size = int(len(series) * 0.7)
             train_data, test_data = series.iloc[:train_size], series.iloc[train_size:]
 
             # Train the ARIMA model
-            model = auto_arima(train_data, seasonal=False, trace=True, error_action='ignore', suppress_warnings=True)
+            model = self._fit_model(train_data)
             train_results = model.arima_res_
 
             # Initialize the results list
@@ -142,16 +171,12 @@ class ARIMAService:
             # Iteratively forecast and update the model
 
             for i in range(len(test_data)):
-                # Forecast the next day
-                forecast_result = model.predict(n_periods=1)
-                
-                # Check if the result is a Series or an array and extract the value accordingly
-                if isinstance(forecast_result, pd.Series):
-                    forecast = forecast_result.iloc[0]
-                else:
-                    forecast = forecast_result[0]
+                # Forecast the next day together with its 95% confidence interval
+                forecast_result, conf_int = model.predict(n_periods=1, return_conf_int=True, alpha=0.05)
+                forecast = np.asarray(forecast_result)[0]
+                lower, upper = np.asarray(conf_int)[0]
 
-                actual = test_data.iloc[i]
+                actual = float(test_data.iloc[i])
 
                 # Calculate the error
                 error = abs(forecast - actual)
@@ -161,9 +186,12 @@ class ARIMAService:
                 results.append({
                     'date': test_data.index[i],
                     'forecast': forecast,
+                    'lower': lower,
+                    'upper': upper,
                     'actual': actual,
                     'error': error,
-                    'mae': mae
+                    'mae': mae,
+                    'model': f'ARIMA{model.order}'
                 })
 
                 # Update the model with the actual value
@@ -171,7 +199,7 @@ class ARIMAService:
 
             # Ensure the lengths of results and test_data are the same
             if len(results) != len(test_data):
-                app.logger.warning(f"Length mismatch for {column_name}: results={len(results)}, test_data={len(test_data)}")
+                self.logger.warning("Length mismatch for %s: results=%d, test_data=%d", column_name, len(results), len(test_data))
                 # Adjust the lengths if possible
                 min_length = min(len(results), len(test_data))
                 results = results[:min_length]
@@ -180,35 +208,10 @@ class ARIMAService:
             # Generate the forecast DataFrame
             forecast_df = pd.DataFrame({
                 'mean': [r['forecast'] for r in results],
-                'mean_ci_lower': [None] * len(results),  # Placeholder, real CI can be added if calculated
-                'mean_ci_upper': [None] * len(results)   # Placeholder, real CI can be added if calculated
+                'mean_ci_lower': [r['lower'] for r in results],
+                'mean_ci_upper': [r['upper'] for r in results]
             }, index=[r['date'] for r in results])
 
-            # Plotting
-            fig, ax = plt.subplots(figsize=(25, 10))
-            ax.plot(train_data.index, train_data, label='Training Data', color='#35424a', linestyle='-', marker='o', markersize=0)
-            ax.plot(test_data.index, test_data, label='Test Data', color='#2ca02c', linestyle='--', marker='x', markersize=2)
-            ax.plot(forecast_df.index, forecast_df['mean'], label='Forecast', color='#e8491d', linestyle='--', marker='s', markersize=2)
-            
-            # Only plot the confidence interval if it contains valid numeric data
-            if forecast_df['mean_ci_lower'].notnull().any() and forecast_df['mean_ci_upper'].notnull().any():
-                ax.fill_between(forecast_df.index, forecast_df['mean_ci_lower'], forecast_df['mean_ci_upper'], 
-                                color='#e8491d', alpha=0.2, label='95% Confidence Interval')
-            
-            ax.set_xlabel('Date', fontsize=12, fontweight='bold', color='#333')
-            ax.set_ylabel('Views', fontsize=12, fontweight='bold', color='#333')
-            ax.set_title(f'ARIMA Forecast for {column_name}', fontsize=16, fontweight='bold', color='#35424a')
-            
-            # Format the x-axis to display dates correctly
-            ax.xaxis.set_major_locator(mdates.MonthLocator())
-            ax.xaxis.set_minor_locator(mdates.DayLocator())
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))  # Change 3
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right', color='#333')
-            
-
-            ax.grid(True, which='both', linestyle='--', linewidth=0.2, alpha=0.6, color='#ddd')
-            ax.legend(loc='upper left', fontsize=12, frameon=True, framealpha=0.8, facecolor='#f4f4f4', edgecolor='#ddd')
-
             # Plot statistics
             aic = train_results.aic
             # RMSE calculation
@@ -220,36 +223,358 @@ class ARIMAService:
                 f'AIC: {aic:.2f}   '
                 f'{rmse_text}'
             )
-            ax.text(0.05, 0.05, formula_text, transform=ax.transAxes, fontsize=12, fontweight='bold', verticalalignment='bottom',
-                    bbox=dict(facecolor='#ff4136', edgecolor='#ddd', alpha=0.8), color='#333')
-
-            # Vertical line to separate training and forecast
-            last_train_date = train_data.index[-1]
-            ax.axvline(x=last_train_date, color='#ff4136', linestyle=':', linewidth=2, label='Forecast Start')
-            ax.set_facecolor('#ffffff')
-            fig.patch.set_facecolor('#f4f4f4')
-            y_min, y_max = ax.get_ylim()
-            ax.set_ylim(y_min - 0.1 * (y_max - y_min), y_max + 0.1 * (y_max - y_min))
-
-            plt.tight_layout()
+            filename = self._plot_forecast(column_name, train_data, test_data, forecast_df, formula_text)
 
-            # Save the figure
-            filename = f'arima_forecast_{column_name}.png'
-            plt.savefig(os.path.join(self.figure_directory, filename), dpi=300, bbox_inches='tight')
-            plt.close(fig)
-
-            app.logger.info(f"ARIMA forecast figure saved as {filename} for column: {column_name}")
+            self.logger.info("ARIMA forecast figure saved as %s for column: %s", filename, column_name)
 
             # Store results and filename
             all_results[column_name] = results
             all_fig_filenames.append(filename)
 
+            # After the walk-forward the model has seen the whole series, so keep it for forecasting
+            self._store_model(column_name, model, series)
+
         # Save results to CSV
-        self.arima_save_to_csv(all_results)
+        if save_csv:
+            self.arima_save_to_csv(all_results)
 
         self.logger.info(">> END:: load_arima_results")
         return all_results, all_fig_filenames
     
+    def _plot_forecast(self, column_name, train_data, test_data, forecast_df, formula_text, model_name='ARIMA'):
+        """Plot training data, test data and forecast for one series and return the figure filename."""
+        fig, ax = plt.subplots(figsize=(25, 10))
+        ax.plot(train_data.index, train_data, label='Training Data', color='#35424a', linestyle='-', marker='o', markersize=0)
+        ax.plot(test_data.index, test_data, label='Test Data', color='#2ca02c', linestyle='--', marker='x', markersize=2)
+        ax.plot(forecast_df.index, forecast_df['mean'], label='Forecast', color='#e8491d', linestyle='--', marker='s', markersize=2)
+        
+        # Only plot the confidence interval if it contains valid numeric data
+        if forecast_df['mean_ci_lower'].notnull().any() and forecast_df['mean_ci_upper'].notnull().any():
+            ax.fill_between(forecast_df.index, forecast_df['mean_ci_lower'], forecast_df['mean_ci_upper'], 
+                            color='#e8491d', alpha=0.2, label='95% Confidence Interval')
+        
+        ax.set_xlabel('Date', fontsize=12, fontweight='bold', color='#333')
+        ax.set_ylabel('Views', fontsize=12, fontweight='bold', color='#333')
+        ax.set_title(f'{model_name} Forecast for {column_name}', fontsize=16, fontweight='bold', color='#35424a')
+        
+        # Format the x-axis to display dates correctly
+        ax.xaxis.set_major_locator(mdates.MonthLocator())
+        ax.xaxis.set_minor_locator(mdates.DayLocator())
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))  # Change 3
+        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right', color='#333')
+        
+
+        ax.grid(True, which='both', linestyle='--', linewidth=0.2, alpha=0.6, color='#ddd')
+        ax.legend(loc='upper left', fontsize=12, frameon=True, framealpha=0.8, facecolor='#f4f4f4', edgecolor='#ddd')
+
+        ax.text(0.05, 0.05, formula_text, transform=ax.transAxes, fontsize=12, fontweight='bold', verticalalignment='bottom',
+                bbox=dict(facecolor='#ff4136', edgecolor='#ddd', alpha=0.8), color='#333')
+
+        # Vertical line to separate training and forecast
+        last_train_date = train_data.index[-1]
+        ax.axvline(x=last_train_date, color='#ff4136', linestyle=':', linewidth=2, label='Forecast Start')
+        ax.set_facecolor('#ffffff')
+        fig.patch.set_facecolor('#f4f4f4')
+        y_min, y_max = ax.get_ylim()
+        ax.set_ylim(y_min - 0.1 * (y_max - y_min), y_max + 0.1 * (y_max - y_min))
+
+        plt.tight_layout()
+
+        # Save the figure
+        filename = f'arima_forecast_{column_name}.png'
+        plt.savefig(os.path.join(self.figure_directory, filename), dpi=300, bbox_inches='tight')
+        plt.close(fig)
+        figure_variants(os.path.join(self.figure_directory, filename))
+        return filename
+
+    @timed('arima_baseline')
+    def baseline_backtest(self, frame):
+        """
+        Backtest the baseline forecasters on every series of the traffic matrix at once.
+
+        Each series is split like the ARIMA backtest (first 70% train, rest test) and
+        scored by its one-step-ahead MAE relative to the mean test value.
+
+        :param frame: Date-indexed DataFrame with one column per series.
+        :return: (results, relative_errors) where results maps each series to its best
+                 baseline's test records in the ARIMA result format, and relative_errors
+                 maps each series to that baseline's relative MAE.
+        """
+        self.logger.info(">> START:: baseline_backtest")
+        values = frame.to_numpy(dtype=float)
+        n_rows, n_series = values.shape
+        valid = ~np.isnan(values)
+        has_data = valid.any(axis=0)
+
+        first = valid.argmax(axis=0)
+        last = n_rows - 1 - valid[::-1].argmax(axis=0)
+        train_end = first + ((last - first + 1) * 0.7).astype(int)
+        rows = np.arange(n_rows)[:, None]
+        train_mask = (rows > first) & (rows < train_end) & valid
+        test_mask = (rows >= train_end) & (rows <= last) & valid
+
+        forecasts = baseline_forecasts(values, season=self.baseline_season, alpha=self.baseline_alpha)
+        methods = list(forecasts)
+        abs_errors = np.stack([np.where(test_mask, np.abs(forecasts[m] - values), np.nan) for m in methods])
+        with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mae = np.nanmean(abs_errors, axis=1)
+            scale = np.nanmean(np.where(test_mask, np.abs(values), np.nan), axis=0)
+            relative = mae / scale
+        relative = np.where(np.isnan(relative), np.inf, relative)
+        best = relative.argmin(axis=0)
+
+        index = frame.index
+        results, relative_errors = {}, {}
+        for j, column_name in enumerate(frame.columns):
+            if not has_data[j]:
+                continue
+            method = methods[best[j]]
+            predicted = forecasts[method][:, j]
+            residuals = np.where(train_mask[:, j], values[:, j] - predicted, np.nan)
+            half_width = 1.96 * np.nanstd(residuals) if np.isfinite(residuals).any() else np.nan
+
+            records = []
+            for t in np.flatnonzero(test_mask[:, j] & ~np.isnan(predicted)):
+                forecast, actual = predicted[t], values[t, j]
+                records.append({
+                    'date': index[t],
+                    'forecast': forecast,
+                    'lower': forecast - half_width,
+                    'upper': forecast + half_width,
+                    'actual': actual,
+                    'error': abs(forecast - actual),
+                    'mae': abs(forecast - actual),
+                    'model': method
+                })
+            results[column_name] = records
+            relative_errors[column_name] = float(relative[best[j], j])
+
+        self.logger.info(">> END:: baseline_backtest")
+        return results, relative_errors
+
+    def run_backtest(self, app, merged_df):
+        """Run the backtest through the baseline tier when ARIMA_TIERED is set, otherwise auto_arima on every series."""
+        if self.tiered:
+            return self.load_tiered_results(app, merged_df)
+        return self.load_arima_results(app, merged_df)
+
+    def load_tiered_results(self, app, merged_df, threshold=None):
+        """
+        Run the cheap baselines on every series and auto_arima only where they fall short.
+
+        :param app: Application context.
+        :param merged_df: AnalysisInput, or a traffic frame with a 'date' column and one column per series.
+        :param threshold: Relative MAE above which a series is escalated to auto_arima.
+        :return: Dictionary of results and list of figure filenames, like load_arima_results.
+        """
+        self.logger.info(">> START:: load_tiered_results")
+        threshold = self.baseline_threshold if threshold is None else threshold
+        analysis_input = AnalysisInput.coerce(merged_df)
+
+        baseline_results, relative_errors = self.baseline_backtest(analysis_input.to_frame())
+        # A series too short to score a baseline on is too short to fit auto_arima on as well
+        escalate = [column for column, error in relative_errors.items() if threshold < error < np.inf]
+        too_short = [column for column, error in relative_errors.items() if error == np.inf]
+        self.logger.info("       %d of %d series escalated to auto_arima (threshold %s), %d too short to backtest.",
+                         len(escalate), len(relative_errors), threshold, len(too_short))
+
+        all_results, all_fig_filenames = self.load_arima_results(app, analysis_input, columns=escalate, save_csv=False)
+        for column_name, records in baseline_results.items():
+            if column_name in all_results or not records:
+                continue
+            series = analysis_input.series(column_name)
+            test_start = records[0]['date']
+            forecast_df = pd.DataFrame({
+                'mean': [r['forecast'] for r in records],
+                'mean_ci_lower': [r['lower'] for r in records],
+                'mean_ci_upper': [r['upper'] for r in records]
+            }, index=[r['date'] for r in records])
+            method = records[0]['model']
+            formula_text = f'{method} baseline   relative MAE: {relative_errors[column_name]:.4f}'
+            filename = self._plot_forecast(column_name, series[series.index < test_start], series[series.index >= test_start],
+                                           forecast_df, formula_text, model_name=method)
+            all_results[column_name] = records
+            all_fig_filenames.append(filename)
+
+        self.arima_save_to_csv(all_results)
+        self.logger.info(">> END:: load_tiered_results")
+        return all_results, all_fig_filenames
+
+    @timed('arima_fit')
+    def _fit_model(self, series):
+        return auto_arima(series, seasonal=False, trace=self.trace, error_action='ignore', suppress_warnings=True)
+
+    @staticmethod
+    def _series_fingerprint(series):
+        """Identify the training window of a series: its span, length and values."""
+        digest = hashlib.sha1(np.ascontiguousarray(series.to_numpy(dtype=float)).tobytes()).hexdigest()
+        return f"{series.index[0]}:{series.index[-1]}:{len(series)}:{digest}"
+
+    @staticmethod
+    def _series_step(series):
+        """Spacing of the observations: the smallest gap between consecutive dates, so missing days do not widen it."""
+        gaps = np.diff(series.index.values)
+        gaps = gaps[gaps > np.timedelta64(0)]
+        return pd.Timedelta(gaps.min()) if len(gaps) else pd.Timedelta(days=1)
+
+    def _store_model(self, column_name, model, series):
+        self.model_store.save(column_name, model, self._series_fingerprint(series), series.index[-1], self._series_step(series))
+
+    def _stored_prefix_model(self, column_name, series):
+        """
+        Find a stored model trained on a prefix of the series.
+
+        :return: (entry, points after the model's last date), or (None, None) when there is no
+                 such model, e.g. because the history itself changed.
+        """
+        metadata = self.model_store.get_metadata(column_name)
+        if metadata is None:
+            return None, None
+        last_date = pd.Timestamp(metadata['last_date'])
+        history = series[series.index <= last_date]
+        new_points = series[series.index > last_date]
+        if history.empty or new_points.empty or self._series_fingerprint(history) != metadata['fingerprint']:
+            return None, None
+        entry = self.model_store.get(column_name, metadata['fingerprint'])
+        return (entry, new_points) if entry is not None else (None, None)
+
+    def _update_model(self, column_name, series):
+        """
+        Extend the stored model with the points after its last date, if it was trained on a prefix of the series.
+
+        :return: The updated entry, or None when the history itself changed and a refit is needed.
+        """
+        entry, new_points = self._stored_prefix_model(column_name, series)
+        if entry is None:
+            return None
+
+        self.logger.info("       Updating the model of %s with %d new points.", column_name, len(new_points))
+        with timed('arima_update'):
+            entry['model'].update(new_points)
+        self._store_model(column_name, entry['model'], series)
+        return self.model_store.get(column_name)
+
+    def _get_model(self, column_name, series):
+        """
+        Return a fitted model for the series.
+
+        A stored model trained on exactly this window is used as is; one trained on an
+        earlier prefix is updated with the new points; only a changed history is refitted.
+        """
+        entry = self.model_store.get(column_name, self._series_fingerprint(series))
+        if entry is not None:
+            return entry
+        entry = self._update_model(column_name, series)
+        if entry is not None:
+            return entry
+
+        self.logger.info("       No fitted model for %s, fitting.", column_name)
+        self._store_model(column_name, self._fit_model(series), series)
+        return self.model_store.get(column_name)
+
+    def _stored_model(self, column_name, series):
+        """
+        Return a model for the series from the model store only, never fitting or saving one.
+
+        For a model trained on an earlier prefix, its statsmodels results are extended with
+        the new points at the stored parameters (no estimation), and the forecast is made
+        from those; the stored model itself is left untouched.
+
+        :return: The entry, or None when no stored model was trained on this series.
+        """
+        entry = self.model_store.get(column_name, self._series_fingerprint(series))
+        if entry is not None:
+            return entry
+        entry, new_points = self._stored_prefix_model(column_name, series)
+        if entry is None:
+            return None
+        with timed('arima_extend'):
+            results = entry['model'].arima_res_.append(new_points.to_numpy(dtype=float), refit=False)
+        return dict(entry, results=results, last_date=series.index[-1])
+
+    @timed('arima_refresh')
+    def refresh_models(self, df, columns=None):
+        """
+        Bring the stored model of every series up to date with the traffic data.
+
+        Runs on the ingest path, so forecasts served to requests only read the model store:
+        a model trained on an earlier prefix is updated with the new days, a series with a
+        revised history or no stored model is fitted.
+
+        :param df: AnalysisInput, or a traffic frame with a 'date' column and one column per series.
+        :param columns: Optional subset of series to refresh.
+        :return: Number of series with an up-to-date stored model.
+        """
+        self.logger.info(">> START:: refresh_models")
+        analysis_input = AnalysisInput.coerce(df)
+
+        refreshed = 0
+        for column_name in columns or analysis_input.columns:
+            if column_name not in analysis_input:
+                self.logger.warning("       Unknown series: %s", column_name)
+                continue
+            series = analysis_input.series(column_name)
+            if len(series) < 2:
+                continue
+            try:
+                self._get_model(column_name, series)
+            except Exception as e:
+                self.logger.error("Error refreshing the ARIMA model of %s: %s", column_name, e)
+                continue
+            refreshed += 1
+
+        self.logger.info(">> END:: refresh_models")
+        return refreshed
+
+    @timed('forecast')
+    def forecast(self, df, horizon=7, alpha=0.05, columns=None, fit=True):
+        """
+        Forecast every series N steps ahead with confidence intervals, in one batched call.
+
+        Fitted models come from the model store (memory first, then disk), so a warm call only predicts.
+
+        :param df: AnalysisInput, or a traffic frame with a 'date' column and one column per series.
+        :param horizon: Number of steps (days for daily data) to forecast.
+        :param alpha: Significance level of the confidence interval (0.05 gives 95%).
+        :param columns: Optional subset of series to forecast.
+        :param fit: Whether series without a usable stored model are fitted (and stored); when
+                    False they are left out, so the call never runs auto_arima.
+        :return: Dictionary of series name to a list of {'date', 'mean', 'lower', 'upper'} records.
+        """
+        self.logger.info(">> START:: forecast")
+        analysis_input = AnalysisInput.coerce(df)
+
+        forecasts = {}
+        for column_name in columns or analysis_input.columns:
+            if column_name not in analysis_input:
+                self.logger.warning("       Unknown series: %s", column_name)
+                continue
+            series = analysis_input.series(column_name)
+            if len(series) < 2:
+                continue
+
+            entry = self._get_model(column_name, series) if fit else self._stored_model(column_name, series)
+            if entry is None:
+                self.logger.info("       No stored model for %s, skipped.", column_name)
+                continue
+            prediction = entry.get('results', entry['model'].arima_res_).get_forecast(horizon)
+            mean, conf_int = np.asarray(prediction.predicted_mean), np.asarray(prediction.conf_int(alpha=alpha))
+            dates = [entry['last_date'] + entry['step'] * (i + 1) for i in range(horizon)]
+
+            forecasts[column_name] = [
+                {
+                    'date': date.isoformat(),
+                    'mean': float(mean[i]),
+                    'lower': float(conf_int[i, 0]),
+                    'upper': float(conf_int[i, 1]),
+                }
+                for i, date in enumerate(dates)
+            ]
+
+        self.logger.info(">> END:: forecast")
+        return forecasts
+
     def run_arima_model(self, app):
         """
         Check if figures exist, if not, perform ARIMA model.
@@ -309,8 +634,7 @@ class ARIMAService:
         else:
             self.logger.info("CSV file or figures do not exist. Running load_arima_results.")
             # Run load_arima_results function
-            merged_df = self.wiki_traffic_service.get_traffic_data_as_dataframe()
-            self.load_arima_results(app, merged_df)
+            self.run_backtest(app, self.wiki_traffic_service.get_analysis_input())
 
             self.logger.info(">> END:: run_arima_model")
             return self.run_arima_model(app)
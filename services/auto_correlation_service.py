@@ -1,7 +1,5 @@
 import os
 import shutil
-import logging
-import colorlog
 import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -10,30 +8,15 @@ import numpy as np
 from scipy import signal
 import pandas as pd
 
-matplotlib.use('Agg')
-
-
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
+from utils.metrics import timed
+from utils.analysis_input import AnalysisInput
+from utils.figures import figure_variants
+from utils.logging_config import get_logger
 
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
+matplotlib.use('Agg')
 
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+logger = get_logger(__name__)
 
 class AutoCorrelationService:
     """
@@ -75,26 +58,22 @@ class AutoCorrelationService:
         self.logger.info(f"Ensured directory exists: {self.figure_directory}")
         self.logger.info(">> END:: auto_corr_check_directory_existence")
 
+    @timed('acf')
     def perform_auto_corr(self, df, days_to_autocorrelate=30):
         self.logger.info(">> START:: perform_auto_corr")
+        analysis_input = AnalysisInput.coerce(df)
 
-        if df.empty:
+        if analysis_input.empty:
             self.logger.error("DataFrame is empty. No auto-correlation to compute.")
             self.logger.info(">> END:: perform_auto_corr")
             return {}
 
-        # Ensure 'date' column is set as index
-        if 'date' in df.columns:
-            df.set_index('date', inplace=True)
-
         result_file_paths = {}
 
         try:
-            for col in df.columns:
-                series = df[col]
-
-                # Handle NaN values by filling them with 0 or interpolating
-                series = series.fillna(0)  # or use series.interpolate() for interpolation
+            for col in analysis_input.columns:
+                # Zero before the page existed, as a float series so the correlations cannot overflow
+                series = analysis_input.padded(col).astype(float)
 
                 # Calculate auto-correlation
                 autocorr = self.auto_correlation(series, days_to_autocorrelate=days_to_autocorrelate)
@@ -110,12 +89,13 @@ class AutoCorrelationService:
                 filepath = f'auto_corr_{col}.png'
                 plt.savefig(os.path.join(self.figure_directory, filepath))
                 plt.close()
+                figure_variants(os.path.join(self.figure_directory, filepath))
                 result_file_paths[col] = {
                     'auto_corr_plot': filepath,
                     'auto_correlation': autocorr
                 }
 
-                self.logger.info(f"Auto-correlation analysis for {col} completed. Plot saved to {os.path.join(self.figure_directory, filepath)}")
+                self.logger.info("Auto-correlation analysis for %s completed. Plot saved to %s", col, filepath)
 
             # Group images by subject
             subjects = {}
@@ -151,7 +131,7 @@ class AutoCorrelationService:
         """
         Check if figures exist, if not, perform auto-correlation.
         
-        :param df: DataFrame to be used for auto-correlation.
+        :param df: AnalysisInput or traffic DataFrame to be used for auto-correlation.
         :param days_to_autocorrelate: Number of days to auto-correlate.
         :return: Dictionary of figures or result of perform_auto_corr.
         """
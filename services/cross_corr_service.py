@@ -1,39 +1,22 @@
 import os
-import logging
-import colorlog
 import matplotlib
 import numpy as np
 import pandas as pd
 from statsmodels.tsa.stattools import ccf
 import numpy as np
 from itertools import combinations
-matplotlib.use('Agg')
-
 
+from utils.metrics import timed
+from utils.analysis_input import AnalysisInput
+from utils.logging_config import get_logger
 
+matplotlib.use('Agg')
 
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
 
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
 
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+logger = get_logger(__name__)
 
 
 class CrossCorrelationService:
@@ -140,15 +123,16 @@ class CrossCorrelationService:
             self.logger.error(f"Failed to save DataFrame to {file_path}. Reason: {e}")
         self.logger.info(">> END:: save_dataframe_to_csv")
 
+    @timed('ccf')
     def cross_correlation_test(self, df, max_lag=10):
         cross_corr_results = pd.DataFrame(columns=["subject", "Page 1", "Page 2", "Best Lag", "Max Correlation"])
 
-        for col1, col2 in combinations(df.columns, 2):
-            # if first column is date then skip
-            if col1 == 'date':
-                continue
+        # Zero-filled row views of one compact matrix, instead of two fillna(0) copies per pair
+        matrix = AnalysisInput.coerce(df).matrix
+        for col1, col2 in combinations(matrix.columns, 2):
             # Calculate cross-correlation for all lags using ccf
-            corr_values = ccf(df[col1].fillna(0), df[col2].fillna(0), adjusted=False)
+            # Cast explicitly: the rows may be uint32 counts, which wrap around in integer arithmetic
+            corr_values = ccf(matrix.padded(col1).astype(np.float64), matrix.padded(col2).astype(np.float64), adjusted=False)
             lags = np.arange(-max_lag, max_lag + 1)
 
             # Find the lag with the maximum absolute correlation
@@ -0,0 +1,77 @@
+import os
+
+from services.wiki_traffic_service import WikiTrafficService
+from utils.streaming import encode_chunks, iter_csv_file, iter_csv_as_ndjson
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExportService:
+    """
+    Service for streaming traffic data and analysis results out of the application.
+    """
+
+    FORMATS = {
+        'csv': 'text/csv',
+        'json': 'application/x-ndjson',
+    }
+
+    def __init__(self):
+        """
+        Initialize the ExportService with the traffic service and the analysis result files.
+        """
+        self.wiki_traffic_service = WikiTrafficService()
+        # Result files written by PeaksService, ARIMAService and CrossCorrelationService
+        self.result_files = {
+            'peaks': './files/peaks_results.csv',
+            'arima': './files/arima_results.csv',
+            'cross_correlation': './files/cross_correlation.csv',
+        }
+        self.logger = logger
+
+    @property
+    def datasets(self):
+        return ('traffic',) + tuple(self.result_files)
+
+    def open_export(self, dataset, fmt, columns=None, start=None, end=None):
+        """
+        Prepare a streamed export.
+
+        :param dataset: One of 'traffic', 'peaks', 'arima' or 'cross_correlation'.
+        :param fmt: 'csv' or 'json' (newline-delimited JSON).
+        :param columns: Traffic columns to include (traffic only).
+        :param start: First date to include (traffic only).
+        :param end: Last date to include (traffic only).
+        :return: (factory, version) where factory() returns a fresh generator of byte chunks
+                 and version identifies the exported content.
+        :raises ValueError: For unknown datasets, formats or columns.
+        :raises FileNotFoundError: When an analysis has not produced its result file yet.
+        """
+        self.logger.info(">> START:: open_export %s.%s", dataset, fmt)
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown export format '{fmt}'")
+
+        if dataset == 'traffic':
+            columns = self.wiki_traffic_service.select_columns(columns)
+            iterate = self.wiki_traffic_service.iter_traffic_csv if fmt == 'csv' else self.wiki_traffic_service.iter_traffic_ndjson
+            version = f"{self.wiki_traffic_service.get_traffic_version(columns, start, end)}-{fmt}"
+
+            def factory():
+                return encode_chunks(iterate(columns, start, end))
+
+        elif dataset in self.result_files:
+            path = self.result_files[dataset]
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"No {dataset} results found at {path}")
+            stat = os.stat(path)
+            version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}-{fmt}"
+
+            def factory():
+                return iter_csv_file(path) if fmt == 'csv' else encode_chunks(iter_csv_as_ndjson(path))
+
+        else:
+            raise ValueError(f"Unknown export dataset '{dataset}'")
+
+        self.logger.info(">> END:: open_export %s.%s", dataset, fmt)
+        return factory, version
@@ -1,35 +1,16 @@
 from scipy.signal import find_peaks
 import os
-import logging
 import pandas as pd
 import matplotlib
 import matplotlib.pyplot as plt
 matplotlib.use('Agg')
 
+from utils.metrics import timed
+from utils.analysis_input import AnalysisInput
+from utils.figures import figure_variants
+from utils.logging_config import get_logger
 
-import colorlog
-
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
-
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
-
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
-
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+logger = get_logger(__name__)
 
 
 
@@ -45,7 +26,6 @@ class PeaksService:
         self.figure_directory = 'static/peaks_figures'  # for images
         self.csv_file_path = './files/peaks_results.csv'  # for csv data
         self.logger = logger
-        logging.basicConfig(level=logging.INFO)
 
     def peaks_check_directory_existence(self):
         self.logger.info(">> START:: peaks_check_directory_existence")
@@ -61,19 +41,17 @@ class PeaksService:
         self.logger.info(">> END:: load_peaks_figures")
         return peaks_existing_figures
 
+    @timed('peaks')
     def detect_peaks(self, df, peaks_toFind=10):
         self.logger.info(">> START:: detect_peaks")
         peaks_dict = {}
+        analysis_input = AnalysisInput.coerce(df)
 
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-
-        for column in df.columns:
+        for column in analysis_input.columns:
             if column != 'date':
                 event_name, language = self.parse_column_name(column)
                 peak_filename = f'peaks_{language}_{event_name}.png'
-                data = df[column].dropna()
+                data = analysis_input.series(column)
 
                 if data.empty:
                     continue
@@ -103,28 +81,69 @@ class PeaksService:
         parts = column_name.split('_', 1)
         return parts[1], parts[0] if len(parts) > 1 else (column_name, 'unknown')
 
+    def date_format(self, index):
+        # Hourly (or finer) series keep the hour in their peak labels
+        if (index == index.normalize()).all():
+            return '%Y-%m-%d'
+        return '%Y-%m-%d %H:%M'
+
     # Modified oneP method
     def oneP(self, data):
         return (data - data.mean()) / data.std()  # Changed to z-score normalization
 
-    def peaks_optimize(self, data_column, event_name, language, peak_filename, peaks_toFind=10):
-        self.logger.info(f">> START:: peaks_optimize for {event_name} ({language})")
-        
+    def find_series_peaks(self, data_column, peaks_toFind=10):
+        """
+        Find at most peaks_toFind peaks, raising the distance and prominence until few enough remain.
+
+        :param data_column: Smoothed, normalized series.
+        :param peaks_toFind: Maximum number of peaks.
+        :return: (peak positions, find_peaks properties).
+        """
         initial_distance = max(len(data_column) // 20, 1)  # Start with 5% of data length, minimum 1
         initial_prominence = 0.5  # Increased initial prominence
-        
+
         while True:
             peaks, properties = find_peaks(
                 data_column,
                 distance=initial_distance,
                 prominence=initial_prominence,
             )
-            
+
             if len(peaks) <= peaks_toFind:  # Added upper limit for prominence
                 break
-            
+
             initial_distance = int(initial_distance * 1.01)
-            initial_prominence *= 1.02 
+            initial_prominence *= 1.02
+
+        return peaks, properties
+
+    def series_peaks(self, data, peaks_toFind=10):
+        """
+        Positions of the peaks of one raw series, detected as for the peak figures but without plotting.
+
+        Peaks are found on the smoothed series, then moved to the highest raw day of their
+        smoothing window, so they can be marked on the raw values.
+
+        :param data: Series of daily counts.
+        :param peaks_toFind: Maximum number of peaks.
+        :return: List of positions in the series.
+        """
+        if len(data) < 2:
+            return []
+        normalized_data = self.oneP(data.rolling(window=3, min_periods=1).mean())
+        if normalized_data.isna().all():
+            # A constant series has no peaks
+            return []
+        peaks, _ = self.find_series_peaks(normalized_data, peaks_toFind)
+        values = data.to_numpy()
+        return sorted({int(max(peak - 2, 0) + values[max(peak - 2, 0):peak + 1].argmax()) for peak in peaks})
+
+    def peaks_optimize(self, data_column, event_name, language, peak_filename, peaks_toFind=10):
+        self.logger.info(">> START:: peaks_optimize for %s (%s)", event_name, language)
+
+        peaks, properties = self.find_series_peaks(data_column, peaks_toFind)
+
+        date_format = self.date_format(data_column.index)
 
         # Save the figure if peaks are detected
         if len(peaks) > 0:
@@ -134,7 +153,7 @@ class PeaksService:
 
             for i, peak in enumerate(peaks):
                 offset = 10 if i % 2 == 0 else -10
-                plt.annotate(data_column.index[peak].strftime('%Y-%m-%d'),
+                plt.annotate(data_column.index[peak].strftime(date_format),
                             (data_column.index[peak], data_column.iloc[peak]),
                             textcoords="offset points",
                             xytext=(0, offset),
@@ -147,9 +166,10 @@ class PeaksService:
             plt.legend()
             plt.savefig(os.path.join(self.figure_directory, peak_filename))
             plt.close()
+            figure_variants(os.path.join(self.figure_directory, peak_filename))
 
         else:
-            self.logger.warning(f"No peaks detected for {event_name} ({language}).")
+            self.logger.warning("No peaks detected for %s (%s).", event_name, language)
 
         avg_distance = None
         if len(peaks) > 1:
@@ -157,7 +177,7 @@ class PeaksService:
             avg_distance = peak_distances.mean()
 
         return {
-            'dates': data_column.index[peaks].strftime('%Y-%m-%d').tolist(),
+            'dates': data_column.index[peaks].strftime(date_format).tolist(),
             'values': data_column.iloc[peaks].tolist(),
             'filename': peak_filename,
             'avg_distance': avg_distance,
@@ -187,7 +207,7 @@ class PeaksService:
         """
         Check if figures exist, if not, perform peak detection.
         
-        :param df: DataFrame to be used for peak detection.
+        :param df: AnalysisInput or traffic DataFrame to be used for peak detection.
         :param peaks_toFind: Number of peaks to find.
         :return: Dictionary of figures or result of detect_peaks.
         """
@@ -209,7 +229,7 @@ class PeaksService:
             if figures:
                 for event, imgs in figures.items():
                     for img in imgs:
-                        self.logger.info(f"Loaded existing figure: {img['filename']}")
+                        self.logger.debug("Loaded existing figure: %s", img['filename'])
                 self.logger.info("Figures already exist. Returning existing figures.")
                 self.logger.info(">> END:: run_peak_detection")
                 return figures
@@ -0,0 +1,56 @@
+import importlib
+import threading
+
+# Service class name -> module defining it. Modules are only imported on first use,
+# so routes that never touch the analysis services never load their scientific stack.
+SERVICE_MODULES = {
+    'EventService': 'services.event_service',
+    'WikipediaService': 'services.wikipedia_service',
+    'WikiTrafficService': 'services.wiki_traffic_service',
+    'PeaksService': 'services.peaks_service',
+    'ARIMAService': 'services.arima_service',
+    'CrossCorrelationService': 'services.cross_corr_service',
+    'AutoCorrelationService': 'services.auto_correlation_service',
+    'ResetService': 'services.reset_service',
+    'SpikeDetectionService': 'services.spike_service',
+    'ExportService': 'services.export_service',
+    'TrafficRollupService': 'services.rollup_service',
+    'ResearchCacheService': 'services.research_cache_service',
+    'ResearchService': 'services.research_service',
+    'SeriesChartService': 'services.series_chart_service',
+}
+
+
+class LazyServiceRegistry:
+    """
+    Resolve service classes by attribute access, importing their modules on first use.
+
+    ``registry.ARIMAService`` returns the class itself, so it is used exactly like a
+    direct import: ``registry.ARIMAService()`` or ``registry.EventService.get_all_events()``.
+    """
+
+    def __init__(self, modules):
+        self._modules = dict(modules)
+        self._classes = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # Only reached for names that are not regular attributes
+        modules = self.__dict__.get('_modules', {})
+        if name not in modules:
+            raise AttributeError(f"Unknown service '{name}'")
+        service_class = self._classes.get(name)
+        if service_class is None:
+            with self._lock:
+                service_class = self._classes.get(name)
+                if service_class is None:
+                    service_class = getattr(importlib.import_module(modules[name]), name)
+                    self._classes[name] = service_class
+        return service_class
+
+    def loaded(self):
+        """Return the names of the services imported so far."""
+        return sorted(self._classes)
+
+
+registry = LazyServiceRegistry(SERVICE_MODULES)
@@ -0,0 +1,125 @@
+import os
+import threading
+from collections import OrderedDict
+
+from repositories.wiki_traffic_repository import WikiTrafficRepository
+from utils.http_cache import make_etag, file_stamp, directory_stamp
+from utils.metrics import record_cache
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Files the research results are read from; the traffic CSV is rewritten on every ingest. The peaks and
+# cross-correlation CSVs are only exports of results derived from the traffic, so they are left out:
+# rewriting them must not invalidate what was just cached.
+RESULT_FILES = (
+    './files/wiki_traffic_data.csv',
+    './files/arima_results.csv',
+)
+# Sections of the research page, each computed and cached on its own
+RESEARCH_SECTIONS = ('peaks', 'acf', 'ccf', 'arima')
+# Figure directories under the app's static folder
+FIGURE_DIRECTORIES = ('peaks_figures', 'auto_corr_figures', 'arima_figures')
+
+# Research results by version, then by section, shared by every request in the process
+_research_cache = OrderedDict()
+_research_cache_lock = threading.Lock()
+# Analyses run one at a time: they share figure directories and Matplotlib is not thread-safe
+_compute_lock = threading.Lock()
+
+
+class ResearchCacheService:
+    """
+    Service caching the research results by data and result version.
+
+    The version is computed from the traffic table (row count and latest date) and the
+    stamps of the result CSVs and figure files, so it is cheap to check and changes
+    whenever an ingest or an analysis run changes anything the page shows.
+    """
+
+    def __init__(self):
+        """
+        Initialize the ResearchCacheService with its repository and settings.
+        """
+        self.wiki_traffic_repo = WikiTrafficRepository()
+        self.cache_size = int(os.environ.get('RESEARCH_CACHE_SIZE', 4))
+        self.max_age = int(os.environ.get('RESEARCH_MAX_AGE', 0))
+        self.logger = logger
+
+    def get_version(self, static_folder):
+        """
+        Get the current version of the research results.
+
+        Parameters:
+        static_folder (str): The application's static folder holding the figure directories.
+
+        Returns:
+        str: A short hash, used as the ETag of the research responses.
+        """
+        try:
+            traffic = (self.wiki_traffic_repo.count(), str(self.wiki_traffic_repo.max_date()))
+        except Exception as e:
+            # No traffic table yet
+            self.logger.debug("Traffic version unavailable: %s", e)
+            traffic = None
+        results = tuple(file_stamp(path) for path in RESULT_FILES)
+        figures = tuple(directory_stamp(os.path.join(static_folder, directory)) for directory in FIGURE_DIRECTORIES)
+        return make_etag(traffic, results, figures)
+
+    def get(self, version, key):
+        """
+        Get a cached result of a version, e.g. one research section.
+
+        Returns:
+        The cached value, or None if it has not been computed for this version.
+        """
+        with _research_cache_lock:
+            entry = _research_cache.get(version)
+            value = entry.get(key) if entry is not None else None
+            if entry is not None:
+                _research_cache.move_to_end(version)
+        record_cache('research', value is not None)
+        return value
+
+    def put(self, version, key, value):
+        """Cache a result under a version, keeping the RESEARCH_CACHE_SIZE most recent versions."""
+        if self.cache_size > 0:
+            with _research_cache_lock:
+                _research_cache.setdefault(version, {})[key] = value
+                _research_cache.move_to_end(version)
+                while len(_research_cache) > self.cache_size:
+                    _research_cache.popitem(last=False)
+
+    def get_or_compute(self, key, static_folder, compute):
+        """
+        Return a result for the current version, computing it at most once per version.
+
+        Computations are serialized; the version is taken again afterwards, since an
+        analysis run may write the figures and CSVs that are part of it.
+
+        Parameters:
+        key (str): Name of the result, e.g. a research section.
+        static_folder (str): The application's static folder.
+        compute (callable): Produces the result when it is not cached.
+
+        Returns:
+        tuple: (version, result).
+        """
+        version = self.get_version(static_folder)
+        value = self.get(version, key)
+        if value is not None:
+            return version, value
+        with _compute_lock:
+            version = self.get_version(static_folder)
+            value = self.get(version, key)
+            if value is None:
+                value = compute()
+                version = self.get_version(static_folder)
+                self.put(version, key, value)
+        return version, value
+
+    @staticmethod
+    def clear():
+        """Drop every cached research entry."""
+        with _research_cache_lock:
+            _research_cache.clear()
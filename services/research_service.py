@@ -0,0 +1,167 @@
+import os
+import math
+
+from services.wiki_traffic_service import WikiTrafficService
+from services.peaks_service import PeaksService
+from services.auto_correlation_service import AutoCorrelationService
+from services.cross_corr_service import CrossCorrelationService
+from services.arima_service import ARIMAService
+from services.research_cache_service import RESEARCH_SECTIONS
+from utils.figures import figure_variants
+from utils.http_cache import to_jsonable
+from utils.metrics import timed, observe_frame
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+class ResearchService:
+    """
+    Service computing the research results one section at a time, as flat JSON-ready items.
+
+    Each item describes one series (or, for cross-correlation, one pair of series) with
+    its figure path relative to the static folder and the figure's compressed thumbnail and
+    full-size variants, so a page can request and render only the sections and series it
+    displays.
+    """
+
+    def __init__(self):
+        """
+        Initialize the ResearchService with the analysis services.
+        """
+        self.wiki_traffic_service = WikiTrafficService()
+        self.peaks_service = PeaksService()
+        self.auto_corr_service = AutoCorrelationService()
+        self.cross_corr_service = CrossCorrelationService()
+        self.arima_service = ARIMAService()
+        self.logger = logger
+
+    def get_section(self, section, app):
+        """
+        Compute one research section.
+
+        Parameters:
+        section (str): 'peaks', 'acf', 'ccf' or 'arima'.
+        app (Flask): The application, for the ARIMA figure paths.
+
+        Returns:
+        list: JSON-ready items, each with at least 'subject' and 'series'.
+
+        Raises:
+        ValueError: If the section is unknown.
+        """
+        if section not in RESEARCH_SECTIONS:
+            raise ValueError(f"Unknown research section '{section}'")
+        self.logger.info(f">> START:: research section {section}")
+        with timed(f"research_{section}"):
+            items = getattr(self, f"_{section}_items")(app)
+            for item in items:
+                if 'figure' in item:
+                    item['variants'] = self._figure_variants(app.static_folder, item['figure'])
+        self.logger.info(f">> END:: research section {section}")
+        return to_jsonable(items)
+
+    @staticmethod
+    def _figure_variants(static_folder, figure):
+        """Thumbnail and full-size variants of a figure, as paths relative to the static folder."""
+        variants = figure_variants(os.path.join(static_folder, figure))
+        if variants is None:
+            return None
+        directory = os.path.dirname(figure)
+        return {
+            'full': f"{directory}/{variants['full']}",
+            'thumbnails': [[width, f"{directory}/{name}"] for width, name in variants['thumbnails']],
+        }
+
+    def _analysis_input(self):
+        analysis_input = self.wiki_traffic_service.get_analysis_input()
+        observe_frame('analysis', analysis_input)
+        return analysis_input
+
+    def _peaks_items(self, app):
+        self.peaks_service.peaks_check_directory_existence()
+        results = self.peaks_service.run_peak_detection(self._analysis_input())
+        items = []
+        for subject, images in results.items():
+            for image in images:
+                item = {
+                    'subject': subject,
+                    'series': f"{image['language']}_{image['event_name']}",
+                    'figure': f"peaks_figures/{image['filename']}",
+                }
+                if 'dates' in image:
+                    item['peaks'] = [{'date': date, 'value': value} for date, value in zip(image['dates'], image['values'])]
+                items.append(item)
+        return items
+
+    def _acf_items(self, app):
+        self.auto_corr_service.auto_corr_check_directory_existence()
+        results = self.auto_corr_service.run_auto_cross_correlation(self._analysis_input())
+        items = []
+        for subject, plots in results.items():
+            for plot in plots:
+                filename = plot['auto_corr_plot']
+                item = {
+                    'subject': subject,
+                    'series': os.path.splitext(filename)[0][len('auto_corr_'):],
+                    'figure': f"auto_corr_figures/{filename}",
+                }
+                if 'auto_correlation' in plot:
+                    item['auto_correlation'] = plot['auto_correlation']
+                items.append(item)
+        return items
+
+    def _ccf_items(self, app):
+        results = self.cross_corr_service.cross_correlation_test(self._analysis_input(), 10)
+        self.cross_corr_service.save_dataframe_to_csv(results, self.cross_corr_service.csv_file_path)
+        return [
+            {
+                'subject': row['subject'],
+                'series': [row['Page 1'], row['Page 2']],
+                'best_lag': row['Best Lag'],
+                'max_correlation': row['Max Correlation'],
+            }
+            for row in results.to_dict(orient='records')
+        ]
+
+    def _arima_items(self, app):
+        self.arima_service.arima_check_directory_existence()
+        results = self.arima_service.run_arima_model(app)
+        items = []
+        for subject, entries in results.items():
+            for entry in entries:
+                items.append({
+                    'subject': subject,
+                    'series': os.path.splitext(entry['filename'])[0][len('arima_forecast_'):],
+                    'figure': f"arima_figures/{entry['filename']}",
+                    'forecast': entry['forecast'],
+                })
+        return items
+
+    @staticmethod
+    def paginate(items, series=None, page=1, per_page=10):
+        """
+        Select and page section items.
+
+        Parameters:
+        items (list): Items from get_section.
+        series (list): Series to keep; an item matches when its series (or one of a pair) is listed.
+        page (int): 1-based page number.
+        per_page (int): Items per page, capped at 100.
+
+        Returns:
+        dict: The page of items with page, per_page, total and pages.
+        """
+        if series:
+            wanted = set(series)
+            items = [item for item in items
+                     if wanted.intersection(item['series'] if isinstance(item['series'], list) else [item['series']])]
+        page = max(page, 1)
+        per_page = min(max(per_page, 1), 100)
+        total = len(items)
+        return {
+            'items': items[(page - 1) * per_page:page * per_page],
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'pages': math.ceil(total / per_page) if total else 0,
+        }
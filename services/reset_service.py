@@ -1,29 +1,8 @@
 import os
 import shutil
-import logging
-import colorlog
+from utils.logging_config import get_logger
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
-
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
-
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
-
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+logger = get_logger(__name__)
 
 
 class ResetService:
@@ -43,7 +22,6 @@ class ResetService:
         self.directories_to_remove = ['arima_figures', 'peaks_figures', 'auto_corr_figures']
         self.db_file = 'CLBML.db'
         self.logger = logger
-        logging.basicConfig(level=logging.INFO)
 
     def remove_files_and_directories(self):
         """
@@ -0,0 +1,182 @@
+import pandas as pd
+from sqlalchemy.exc import NoSuchTableError
+
+from repositories.traffic_rollup_repository import TrafficRollupRepository
+from repositories.wiki_traffic_repository import WikiTrafficRepository
+from repositories.duckdb_traffic_repository import get_analytics_repository
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Pandas period of each stored rollup granularity; weeks start on Monday
+ROLLUP_PERIODS = {'week': 'W-SUN', 'month': 'M'}
+
+
+def rollup_series(series, period):
+    """
+    Aggregate a daily series into calendar buckets.
+
+    Parameters:
+    series (pd.Series): Daily views indexed by date; NaN marks days without data.
+    period (str): 'week' or 'month'.
+
+    Returns:
+    pd.DataFrame: One row per bucket, indexed by the bucket's first day, with total, days and max columns.
+    """
+    series = series.dropna()
+    if series.empty:
+        return pd.DataFrame(columns=['total', 'days', 'max'])
+    buckets = pd.DatetimeIndex(series.index).to_period(ROLLUP_PERIODS[period]).start_time
+    rollups = series.groupby(buckets).agg(['sum', 'count', 'max'])
+    rollups.columns = ['total', 'days', 'max']
+    return rollups
+
+
+class TrafficRollupService:
+    """
+    Service maintaining weekly, monthly and all-time traffic rollups per page.
+    """
+
+    def __init__(self):
+        """
+        Initialize the TrafficRollupService with its repositories.
+        """
+        self.rollup_repo = TrafficRollupRepository()
+        self.wiki_traffic_repo = WikiTrafficRepository()
+        self.analytics_repo = get_analytics_repository()
+        self.logger = logger
+
+    def update(self, columns, start, end):
+        """
+        Refresh the rollups touched by newly ingested rows.
+
+        Only the weeks and months overlapping [start, end] are recomputed, from the
+        stored traffic rows, and each all-time rollup is then folded from the monthly ones.
+        Series without any rollup yet are rolled up over their whole stored history.
+
+        Parameters:
+        columns (list): Series whose rows changed.
+        start (date): First changed date.
+        end (date): Last changed date.
+        """
+        self.logger.info(">> START:: update rollups")
+        rolled_up = self.rollup_repo.get_rolled_up_series()
+        missing = [column for column in columns if column not in rolled_up]
+        if missing:
+            self._refresh(missing)
+        present = [column for column in columns if column in rolled_up]
+        if present:
+            self._refresh(present, start, end)
+        self.logger.info(">> END:: update rollups")
+
+    def backfill(self):
+        """
+        Roll up the whole stored history of every series that has no rollups yet.
+
+        Traffic stored before the rollup table existed is otherwise only rolled up as
+        new days arrive, so its totals would be missing or cover the new days only.
+
+        Returns:
+        list: The series that were rolled up.
+        """
+        self.logger.info(">> START:: backfill rollups")
+        try:
+            columns = [column for column in self.wiki_traffic_repo.get_all_columns() if column != 'date']
+        except NoSuchTableError:
+            columns = []
+        rolled_up = self.rollup_repo.get_rolled_up_series()
+        missing = [column for column in columns if column not in rolled_up]
+        if missing:
+            self._refresh(missing)
+        self.logger.info(">> END:: backfill rollups")
+        return missing
+
+    def _refresh(self, columns, start=None, end=None):
+        """Recompute the buckets of the series overlapping [start, end] (all of them without a range) and their totals."""
+        range_start = range_end = None
+        if start is not None:
+            # Widen the range to whole buckets so partially covered weeks and months are complete
+            start = pd.Timestamp(start)
+            end = pd.Timestamp(end)
+            range_start = min(start.to_period('M').start_time, start.to_period('W-SUN').start_time).date()
+            range_end = max(end.to_period('M').end_time, end.to_period('W-SUN').end_time).date()
+
+        if self.analytics_repo is not None:
+            buckets = self._aggregate_in_engine(columns, range_start, range_end)
+        else:
+            buckets = self._aggregate_rows(columns, range_start, range_end)
+        if buckets is None:
+            self.logger.warning("No traffic rows to roll up.")
+            return
+
+        for column, period, period_start, total, days, max_value in buckets:
+            self.rollup_repo.upsert(column, period, period_start, total, days, max_value)
+        self.rollup_repo.commit()
+
+        for column in columns:
+            first_month, total, days, max_value = self.rollup_repo.summarize_months(column)
+            self.rollup_repo.delete_total(column)
+            if first_month is not None:
+                self.rollup_repo.upsert(column, 'total', first_month, total, days, max_value)
+        self.rollup_repo.commit()
+
+        span = f"between {range_start} and {range_end}" if range_start is not None else "over their whole history"
+        self.logger.info("Rollups refreshed for %d series %s.", len(columns), span)
+
+    def _aggregate_rows(self, columns, start, end):
+        """Bucket the stored SQLite rows in pandas; returns None when the range holds no rows."""
+        rows = list(self.wiki_traffic_repo.iter_rows(columns, start, end))
+        if not rows:
+            return None
+        frame = pd.DataFrame(rows, columns=['date'] + list(columns))
+        frame = frame.set_index(pd.to_datetime(frame['date'])).drop(columns=['date']).astype(float)
+
+        buckets = []
+        for column in columns:
+            for period in ROLLUP_PERIODS:
+                for period_start, rollup in rollup_series(frame[column], period).iterrows():
+                    buckets.append((column, period, period_start.date(), float(rollup['total']),
+                                    int(rollup['days']), float(rollup['max'])))
+        return buckets
+
+    def _aggregate_in_engine(self, columns, start, end):
+        """Bucket the range with GROUP BY queries in the DuckDB backend; returns None when it holds no rows."""
+        buckets = []
+        for period in ROLLUP_PERIODS:
+            rollups = self.analytics_repo.get_rollups(columns, period, start, end)
+            buckets.extend((series, period, pd.Timestamp(period_start).date(), float(total), int(days), float(max_value))
+                           for series, period_start, total, days, max_value in rollups.itertuples(index=False))
+        return buckets or None
+
+    def get_summary(self, series):
+        """
+        Get the all-time rollup of one series.
+
+        Parameters:
+        series (str): Series column name, e.g. 'en_Some event'.
+
+        Returns:
+        dict: total, days, mean and max, or None if the series has no rollup yet.
+        """
+        rollup = self.rollup_repo.get_total(series)
+        return rollup.as_dict() if rollup else None
+
+    def get_rollups(self, series=None, period='month', start=None, end=None):
+        """
+        Get stored rollups.
+
+        Parameters:
+        series (list): Series to include; defaults to all.
+        period (str): 'week', 'month' or 'total'.
+        start (date): Earliest bucket start to include.
+        end (date): Latest bucket start to include.
+
+        Returns:
+        list: Rollups as dictionaries, ordered by series and bucket.
+
+        Raises:
+        ValueError: If the period is unknown.
+        """
+        if period not in ROLLUP_PERIODS and period != 'total':
+            raise ValueError(f"Unknown rollup period '{period}'")
+        return [rollup.as_dict() for rollup in self.rollup_repo.get_rollups(series, period, start, end)]
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+from services.wiki_traffic_service import WikiTrafficService
+from services.peaks_service import PeaksService
+from services.arima_service import ARIMAService
+from utils.analysis_input import AnalysisInput
+from utils.series_payload import encode_series, typed_array
+from utils.metrics import timed
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds for the overlay parameters taken from the query string
+MAX_PEAKS = 50
+MAX_HORIZON = 90
+
+
+class SeriesChartService:
+    """
+    Service shipping single series to the client-side chart as compact payloads.
+
+    Only the requested column is read (through the series LRU of WikiTrafficService), and
+    peak and forecast overlays are computed on that one series, so a chart costs a small
+    query instead of a Matplotlib render; zooming and panning happen in the browser.
+    """
+
+    def __init__(self):
+        """
+        Initialize the SeriesChartService with the traffic, peaks and ARIMA services.
+        """
+        self.wiki_traffic_service = WikiTrafficService()
+        self.peaks_service = PeaksService()
+        self.arima_service = ARIMAService()
+        self.logger = logger
+
+    def get_version(self, name, forecast=False):
+        """
+        Get an identifier that changes whenever the series' traffic changes.
+
+        Parameters:
+        name (str): Series name.
+        forecast (bool): Whether the response has a forecast overlay, which also changes
+        when a model for the series is stored.
+
+        Returns:
+        str: Short hash for the ETag of the series responses.
+        """
+        version = self.wiki_traffic_service.get_traffic_version([name])
+        if forecast:
+            metadata = self.arima_service.model_store.get_metadata(name)
+            version = f"{version}:{metadata.get('saved_at') if metadata else ''}"
+        return version
+
+    def get_daily_series(self, name):
+        """
+        Get one series as consecutive daily values from its first to its last day with a count.
+
+        Parameters:
+        name (str): Series name, e.g. 'en_Some event'.
+
+        Returns:
+        pd.Series: Values indexed by day, days without a count as 0.
+
+        Raises:
+        ValueError: If the series does not exist.
+        """
+        df = self.wiki_traffic_service.get_series(name)
+        series = pd.Series(df[name].to_numpy(dtype=np.float64), index=pd.to_datetime(df['date']), name=name)
+        if series.empty:
+            return series
+        return series.asfreq('D', fill_value=0.0)
+
+    def get_payload(self, name, peaks=10, horizon=0):
+        """
+        Build the JSON payload of a series with its overlays.
+
+        Parameters:
+        name (str): Series name.
+        peaks (int): Maximum number of peaks to mark; 0 for none.
+        horizon (int): Days to forecast with the stored ARIMA model; 0 for none. Models are
+        never fitted here: without a stored model for the series the overlay is left out.
+
+        Returns:
+        dict: See utils.series_payload.encode_series.
+
+        Raises:
+        ValueError: If the series does not exist or a parameter is out of range.
+        """
+        if not 0 <= peaks <= MAX_PEAKS:
+            raise ValueError(f"peaks must be between 0 and {MAX_PEAKS}")
+        if not 0 <= horizon <= MAX_HORIZON:
+            raise ValueError(f"forecast must be between 0 and {MAX_HORIZON} days")
+
+        with timed('series_payload'):
+            series = self.get_daily_series(name)
+            peak_positions = self.peaks_service.series_peaks(series, peaks) if peaks else None
+            forecast = None
+            if horizon and len(series) >= 2:
+                # The days with a count, as the stored models were trained on, so their fingerprints match
+                observed = self.wiki_traffic_service.get_series(name)
+                forecast = self.arima_service.forecast(AnalysisInput.from_frame(observed), horizon=horizon,
+                                                       columns=[name], fit=False).get(name)
+            start = series.index[0].date() if len(series) else None
+            return encode_series(name, start, series.to_numpy(), peaks=peak_positions, forecast=forecast)
+
+    def get_binary(self, name):
+        """
+        Get the values of a series as a raw little-endian typed array.
+
+        Returns:
+        tuple: (bytes, dtype, first date or None, number of values).
+
+        Raises:
+        ValueError: If the series does not exist.
+        """
+        series = self.get_daily_series(name)
+        data, dtype = typed_array(series.to_numpy())
+        return data, dtype, series.index[0].date() if len(series) else None, len(series)
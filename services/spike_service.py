@@ -0,0 +1,144 @@
+import os
+import math
+from datetime import datetime
+import pandas as pd
+
+from models.spike import SpikeState, SpikeEvent
+from repositories.spike_repository import SpikeRepository
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class EwmaSpikeDetector:
+    """
+    Online spike detector based on an exponentially weighted mean and variance.
+
+    The state of a series is just (count, mean, var), so every new point costs O(1)
+    and memory does not grow with history.
+    """
+
+    def __init__(self, alpha=0.1, threshold=3.0, warmup=14, min_views=50):
+        """
+        Parameters:
+        alpha (float): Smoothing factor of the running mean and variance.
+        threshold (float): z-score above which a point is reported as a spike.
+        warmup (int): Number of points to observe before spikes are reported.
+        min_views (float): Ignore spikes below this absolute number of views.
+        """
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self.min_views = min_views
+
+    def update(self, state, value):
+        """
+        Fold one observation into the state.
+
+        Parameters:
+        state: Object with mutable count, mean and var attributes.
+        value (float): The new observation.
+
+        Returns:
+        tuple: (zscore, baseline, is_spike), scored against the state before the update.
+        """
+        if state.count == 0:
+            state.mean, state.var, state.count = float(value), 0.0, 1
+            return 0.0, float(value), False
+
+        baseline = state.mean
+        diff = value - baseline
+        std = math.sqrt(state.var)
+        zscore = diff / std if std > 0 else 0.0
+        is_spike = state.count >= self.warmup and zscore >= self.threshold and value >= self.min_views
+
+        increment = self.alpha * diff
+        state.mean = baseline + increment
+        state.var = (1 - self.alpha) * (state.var + diff * increment)
+        state.count += 1
+        return zscore, baseline, is_spike
+
+
+class SpikeDetectionService:
+    """
+    Service that feeds freshly ingested pageview points to the online spike detector.
+    """
+
+    def __init__(self):
+        """
+        Initialize the SpikeDetectionService with detector settings from the environment.
+        """
+        self.spike_repo = SpikeRepository()
+        self.detector = EwmaSpikeDetector(
+            alpha=float(os.environ.get('SPIKE_ALPHA', 0.1)),
+            threshold=float(os.environ.get('SPIKE_THRESHOLD', 3.0)),
+            warmup=int(os.environ.get('SPIKE_WARMUP', 14)),
+            min_views=float(os.environ.get('SPIKE_MIN_VIEWS', 50)),
+        )
+        # Points a series seen for the first time is seeded with, instead of its whole history
+        self.bootstrap_points = int(os.environ.get('SPIKE_BOOTSTRAP_POINTS', 60))
+        self.logger = logger
+
+    def consume(self, df, granularity='daily'):
+        """
+        Feed the points of an ingest frame that the detector has not seen yet.
+
+        Parameters:
+        df (pd.DataFrame): Frame with a 'date' column and one column per series.
+        granularity (str): Granularity of the frame; each granularity keeps its own state.
+
+        Returns:
+        list: The SpikeEvent rows emitted by this call.
+        """
+        self.logger.info(">> START:: consume")
+        if df.empty or 'date' not in df.columns:
+            self.logger.warning("No data for spike detection.")
+            self.logger.info(">> END:: consume")
+            return []
+
+        timestamps = pd.to_datetime(df['date'])
+        detected_at = datetime.utcnow()
+        events = []
+
+        for column in df.columns:
+            if column == 'date':
+                continue
+
+            state = self.spike_repo.get_state(column, granularity)
+            series = pd.Series(df[column].to_numpy(), index=timestamps).dropna().sort_index()
+            if state is None:
+                state = SpikeState(series=column, granularity=granularity, count=0, mean=0.0, var=0.0)
+                self.spike_repo.add_state(state)
+                series = series.iloc[-self.bootstrap_points:]
+            elif state.last_timestamp is not None:
+                series = series[series.index > pd.Timestamp(state.last_timestamp)]
+
+            for timestamp, value in series.items():
+                zscore, baseline, is_spike = self.detector.update(state, value)
+                if is_spike:
+                    event = SpikeEvent(series=column, granularity=granularity, timestamp=timestamp.to_pydatetime(),
+                                       value=float(value), baseline=baseline, zscore=zscore, detected_at=detected_at)
+                    self.spike_repo.add_event(event)
+                    events.append(event)
+
+            if not series.empty:
+                state.last_timestamp = series.index[-1].to_pydatetime()
+
+        self.spike_repo.commit()
+        self.logger.info(f"Spike detection emitted {len(events)} events.")
+        self.logger.info(">> END:: consume")
+        return events
+
+    def get_recent_spikes(self, series=None, since=None, limit=100):
+        """
+        Get the most recent spike events.
+
+        Parameters:
+        series (str): Restrict to one series.
+        since (datetime): Only events at or after this timestamp.
+        limit (int): Maximum number of events.
+
+        Returns:
+        list: Spike events as dictionaries, newest first.
+        """
+        return [event.as_dict() for event in self.spike_repo.get_events(series, since, limit)]
@@ -1,38 +1,44 @@
 import os
+import io
+import csv
+import json
+import math
+import hashlib
 import logging
-from datetime import datetime
-from functools import reduce
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
 import pandas as pd
 
 from repositories.wiki_traffic_repository import WikiTrafficRepository
 from repositories.wikipedia_repository import WikipediaRepository
 from repositories.event_repository import EventRepository
+from repositories.hourly_traffic_repository import HourlyTrafficRepository
+from repositories.duckdb_traffic_repository import get_analytics_repository, traffic_backend
+from repositories.data_version_repository import DataVersionRepository
 
-from utils.api import get_wikipedia_traffic_data
+from services.spike_service import SpikeDetectionService
+from services.rollup_service import TrafficRollupService
 
-import colorlog
+from utils.api import get_wikipedia_traffic_data, get_pageview_cache
+from utils.traffic_merge import merge_traffic_frames
+from utils.traffic_matrix import TrafficMatrix
+from utils.analysis_input import AnalysisInput
+from utils.metrics import timed, observe_frame, record_cache
+from utils.traffic_snapshot import snapshot_enabled, publish_snapshot, get_traffic_snapshot
+from utils.logging_config import get_logger
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
+logger = get_logger(__name__)
 
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
+# Recently read single-page series, shared by every service instance in the process; entries
+# are keyed by the traffic version token, so an ingest in another worker invalidates them too
+_series_cache = OrderedDict()
+_series_cache_lock = threading.Lock()
+# Serializes reloads of the DuckDB copy within the process
+_analytics_sync_lock = threading.Lock()
 
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
-
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+# Name of the traffic table's entry in the data versions, bumped by every ingest
+TRAFFIC_VERSION = 'traffic'
 
 
 class WikiTrafficService:
@@ -47,9 +53,13 @@ class WikiTrafficService:
         self.wiki_traffic_repo = WikiTrafficRepository()
         self.wikipedia_repo = WikipediaRepository()
         self.event_repo = EventRepository()
+        self.hourly_traffic_repo = HourlyTrafficRepository()
+        self.data_version_repo = DataVersionRepository()
+        self.analytics_repo = get_analytics_repository()
+        self.hourly_lookback_days = int(os.environ.get('HOURLY_LOOKBACK_DAYS', 90))
+        self.series_cache_size = int(os.environ.get('TRAFFIC_SERIES_CACHE_SIZE', 64))
         self.filePath = './files/wiki_traffic_data.csv'
         self.logger = logger
-        logging.basicConfig(level=logging.INFO)
 
     def _get_initial_columns(self):
         """
@@ -63,15 +73,20 @@ class WikiTrafficService:
         self.logger.info(f"Initial columns: {columns}")
         return columns
 
-    def get_traffic_data(self):
+    def get_traffic_data(self, on_collision='sum', granularity='daily'):
         """
         Collect traffic data from Wikipedia.
 
+        Parameters:
+        on_collision (str): Policy for pages sharing a '{language}_{event name}' key ('sum', 'first' or 'error').
+        granularity (str): 'daily', or 'hourly' to fetch the last HOURLY_LOOKBACK_DAYS days hour by hour.
+
         Returns:
         pd.DataFrame: DataFrame containing the traffic data.
         """
         self.logger.info("Starting wiki traffic data collection...")
         today_str = datetime.now().strftime('%Y%m%d')
+        hourly_start_str = (datetime.now() - timedelta(days=self.hourly_lookback_days)).strftime('%Y%m%d')
         data = []
 
         wikipedia_pages = self.wikipedia_repo.get_all()
@@ -79,7 +94,7 @@ class WikiTrafficService:
         for page in wikipedia_pages:
             event = self.event_repo.get_by_event_code(page.event_code)
             if event is None:
-                self.logger.warning(f"No event found for page: {page.title}")
+                self.logger.warning("No event found for page: %s", page.title)
                 continue
 
             created_datetime = self._parse_datetime(event.created_datetime)
@@ -87,29 +102,27 @@ class WikiTrafficService:
                 continue
 
             start_date = created_datetime.strftime('%Y%m%d')
+            if granularity == 'hourly':
+                start_date = max(start_date, hourly_start_str)
 
             try:
-                df = get_wikipedia_traffic_data(page.language, page.title, start_date, today_str, event.name)
+                df = get_wikipedia_traffic_data(page.language, page.title, start_date, today_str, event.name, granularity=granularity)
                 data.append(df)
             except Exception as e:
                 self.logger.error(f"Error fetching data for {page.title}: {str(e)}")
 
+        cache = get_pageview_cache()
+        # stats() queries the cache database, so only build it when it will be logged
+        if cache is not None and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Pageview cache stats: %s", cache.stats())
+
         if not data:
             self.logger.warning("No data fetched from API")
             return pd.DataFrame()
 
-        merged_df = reduce(lambda left, right: pd.merge(left, right, on='timestamp', how='outer', suffixes=('', '_y')), data)
-
-        # Ensure 'timestamp' column exists and is converted to 'date'
-        if 'timestamp' in merged_df.columns:
-            merged_df['date'] = pd.to_datetime(merged_df['timestamp']).dt.date
-            merged_df = merged_df.drop(columns=['timestamp'])  # Remove the 'timestamp' column
-        else:
-            merged_df['date'] = pd.to_datetime(merged_df.index).date  # Fallback to index if no 'timestamp' column
-
-        merged_df = merged_df.reset_index(drop=True)
-        # Sort the DataFrame by the 'date' column from oldest to newest
-        merged_df = merged_df.sort_values(by='date')
+        with timed('merge'):
+            merged_df = merge_traffic_frames(data, on_collision=on_collision, freq='H' if granularity == 'hourly' else 'D')
+        observe_frame('merge', merged_df)
 
         self.logger.info("Wiki traffic data collection completed.")
         return merged_df
@@ -135,7 +148,13 @@ class WikiTrafficService:
     def create_and_populate_wiki_traffic(self):
         """
         Create and populate the wiki traffic table in the database.
+
+        Raises:
+        RuntimeError: If TRAFFIC_BACKEND=duckdb but the DuckDB store cannot be opened here.
         """
+        if traffic_backend() == 'duckdb' and self.analytics_repo is None:
+            raise RuntimeError("TRAFFIC_BACKEND=duckdb but the DuckDB store cannot be opened in this process; "
+                               "refusing to ingest, which would leave the columnar copy behind")
         df = self.get_traffic_data()
         if df.empty:
             self.logger.warning("No data to insert into the database.")
@@ -148,15 +167,186 @@ class WikiTrafficService:
         self.logger.info(f"Columns to be created in the table: {columns}")
         self.wiki_traffic_repo.create_table(columns)
 
-        for index, row in df.iterrows():
+        # Every ingest fetches the whole history; only new or revised days are written and rolled up
+        changed = self._changed_rows(df, columns)
+        self.logger.info(f"{len(changed)} of {len(df)} fetched days are new or revised.")
+        for index, row in changed.iterrows():
             date = row['date']
             row_data = {col: row[col] for col in columns if col in row.index}
             self.wiki_traffic_repo.insert_or_update(date, row_data)
 
+        previous_version = version = self.data_version_repo.get_token(TRAFFIC_VERSION)
+        if not changed.empty:
+            # Committed with the rows, so readers never pair new rows with the old version
+            version = self.data_version_repo.bump(TRAFFIC_VERSION)
         self.wiki_traffic_repo.commit()
+        if self.analytics_repo is not None and not changed.empty:
+            self._update_analytics_store(df, columns, changed, previous_version, version)
+        self.clear_series_cache()
         self.logger.info("Wiki traffic data inserted into the database.")
+        if snapshot_enabled():
+            self.publish_traffic_snapshot()
+        if not changed.empty:
+            TrafficRollupService().update(columns, changed['date'].min(), changed['date'].max())
+        SpikeDetectionService().consume(df, granularity='daily')
         self.save_to_csv(df)
 
+    def _update_analytics_store(self, df, columns, changed, previous_version, version):
+        """
+        Bring the DuckDB copy up to date after an ingest.
+
+        If the copy matched the version before the ingest, only the fetched days from the first
+        to the last changed one are replaced; otherwise it is reloaded from SQLite.
+        """
+        if self.analytics_repo.get_version() != previous_version:
+            self.sync_analytics_store()
+            return
+        window = df[(df['date'] >= changed['date'].min()) & (df['date'] <= changed['date'].max())]
+        self.analytics_repo.replace_frame(window, columns, version=version)
+
+    def _changed_rows(self, df, columns):
+        """
+        Select the rows of a fetched frame that are not stored yet or differ from the stored values.
+
+        Parameters:
+        df (pd.DataFrame): Fetched traffic with a 'date' column.
+        columns (list): Series columns of the frame.
+
+        Returns:
+        pd.DataFrame: The new or revised rows of df.
+        """
+        stored = pd.DataFrame(list(self.wiki_traffic_repo.iter_rows(columns, df['date'].min(), df['date'].max())),
+                              columns=['date'] + columns).set_index('date')
+        fetched = df.set_index('date')[columns].astype(float)
+        stored = stored.reindex(fetched.index).astype(float)
+        unchanged = ((fetched == stored) | (fetched.isna() & stored.isna())).all(axis=1)
+        return df[~unchanged.to_numpy()]
+
+    def create_and_populate_hourly_traffic(self):
+        """
+        Fetch hourly traffic and store it as compressed integer counts, one chunk per series and month.
+        """
+        df = self.get_traffic_data(granularity='hourly')
+        if df.empty:
+            self.logger.warning("No hourly data to insert into the database.")
+            return
+
+        df = df.set_index('date')
+        for column in df.columns:
+            series = df[column].dropna()
+            for month, values in series.groupby(series.index.to_period('M')):
+                hours = pd.date_range(month.start_time, values.index.max(), freq='H')
+                self.hourly_traffic_repo.upsert_chunk(column, str(month), values.reindex(hours).to_numpy())
+
+        self.hourly_traffic_repo.commit()
+        self.logger.info(f"Hourly traffic stored for {len(df.columns)} series.")
+        SpikeDetectionService().consume(df.reset_index(), granularity='hourly')
+
+    @timed('db_read_hourly')
+    def get_hourly_traffic_as_dataframe(self, resample=None, start=None, end=None, columns=None):
+        """
+        Get hourly traffic data as a DataFrame, optionally downsampled on read.
+
+        Parameters:
+        resample (str): Pandas offset alias to downsample to (e.g. '6H', 'D'); None keeps hourly rows.
+        start (str): First timestamp to include.
+        end (str): Last timestamp to include.
+        columns (list): Series to load; defaults to every stored series.
+
+        Returns:
+        pd.DataFrame: A 'date' column of timestamps followed by one column per series.
+        """
+        columns = columns or self.hourly_traffic_repo.get_all_series()
+        series_list = [self.hourly_traffic_repo.get_series(column, start, end) for column in columns]
+        series_list = [series for series in series_list if not series.empty]
+        if not series_list:
+            return pd.DataFrame()
+
+        if resample:
+            series_list = [series.resample(resample).sum(min_count=1) for series in series_list]
+
+        df = pd.concat(series_list, axis=1)
+        df.index.name = 'date'
+        return df.reset_index()
+
+    def get_analysis_dataframe(self):
+        """
+        Get the traffic frame the analysis services run on.
+
+        Honors TRAFFIC_GRANULARITY ('daily' or 'hourly') and TRAFFIC_RESAMPLE (an optional
+        pandas offset alias such as '6H' or 'W' to downsample to on read).
+
+        Returns:
+        pd.DataFrame: A 'date' column followed by one column per series.
+        """
+        granularity = os.environ.get('TRAFFIC_GRANULARITY', 'daily').lower()
+        resample = os.environ.get('TRAFFIC_RESAMPLE') or None
+
+        if granularity == 'hourly':
+            return self.get_hourly_traffic_as_dataframe(resample=resample)
+
+        df = self.get_snapshot_dataframe() if snapshot_enabled() else self.get_traffic_data_as_dataframe()
+        if resample and not df.empty:
+            df = df.set_index(pd.to_datetime(df['date'])).drop(columns=['date'])
+            df = df.resample(resample).sum(min_count=1).rename_axis('date').reset_index()
+        return df
+
+    def get_analysis_input(self):
+        """
+        Get the analysis traffic as an immutable AnalysisInput that every analysis service accepts.
+
+        Dates are parsed once and the shared matrix is never written to, so one input can be passed to
+        peaks, auto-correlation, cross-correlation and ARIMA in turn.
+
+        Returns:
+        AnalysisInput: The prepared input (empty when there is no traffic).
+        """
+        return AnalysisInput.from_frame(self.get_analysis_dataframe())
+
+    def get_traffic_matrix(self):
+        """
+        Get the analysis traffic as a compact TrafficMatrix (uint32/float32 rows, no NaN padding).
+
+        Returns:
+        TrafficMatrix: The matrix, or None when there is no traffic.
+        """
+        df = self.get_analysis_dataframe()
+        if df.empty:
+            return None
+        matrix = TrafficMatrix.from_frame(df)
+        self.logger.debug("Traffic matrix: %d series x %d days, %d bytes", len(matrix), len(matrix.dates), matrix.nbytes)
+        return matrix
+
+    def publish_traffic_snapshot(self):
+        """
+        Publish the stored daily traffic as the shared, memory-mapped snapshot.
+
+        Returns:
+        str: The published version, or None if there is no traffic to publish.
+        """
+        df = self.get_traffic_data_as_dataframe()
+        if df.empty:
+            self.logger.warning("No traffic data to publish as a snapshot.")
+            return None
+        version = publish_snapshot(df)
+        self.logger.info("Published traffic snapshot %s (%d rows, %d columns).", version, len(df), len(df.columns) - 1)
+        return version
+
+    def get_snapshot_dataframe(self):
+        """
+        Get the daily traffic frame from the shared snapshot, publishing one first if none exists.
+
+        The series columns are read-only views of memory shared by every worker.
+
+        Returns:
+        pd.DataFrame: A 'date' column followed by one column per series.
+        """
+        snapshot = get_traffic_snapshot()
+        df = snapshot.frame()
+        if df is None and self.publish_traffic_snapshot() is not None:
+            df = snapshot.frame()
+        return df if df is not None else pd.DataFrame()
+
     def get_all_columns(self):
         """
         Get all columns from the wiki traffic table.
@@ -165,7 +355,7 @@ class WikiTrafficService:
         list: List of column names.
         """
         columns = self.wiki_traffic_repo.get_all_columns()
-        self.logger.info(f"Retrieved columns: {columns}")
+        self.logger.debug("Retrieved columns: %s", columns)
         return columns or []
 
     def get_all_traffic_data(self):
@@ -176,7 +366,7 @@ class WikiTrafficService:
         list: List of traffic data entries.
         """
         data = self.wiki_traffic_repo.get_all()
-        self.logger.info(f"Retrieved {len(data)} rows of traffic data")
+        self.logger.debug("Retrieved %d rows of traffic data", len(data))
         return data or []
 
     def get_traffic_data_as_dataframe(self):
@@ -186,31 +376,269 @@ class WikiTrafficService:
         Returns:
         pd.DataFrame: DataFrame containing the traffic data.
         """
-        all_data = self.get_all_traffic_data()
-        columns = self.get_all_columns()
+        if self.analytics_repo is not None:
+            return self._get_analytics_dataframe()
+
+        with timed('db_read'):
+            all_data = self.get_all_traffic_data()
+            columns = self.get_all_columns()
+
+            data_dict = {'date': [entry.date for entry in all_data]}
+            for column in columns:
+                data_dict[column] = [getattr(entry, column, None) for entry in all_data]
+
+            df = pd.DataFrame(data_dict)
+        observe_frame('db_read', df)
+        return df
+
+    def _get_analytics_dataframe(self):
+        """
+        Get the wide traffic frame pivoted by the DuckDB backend, reloading it from SQLite first if it is behind.
+
+        Returns:
+        pd.DataFrame: A 'date' column followed by one column per series, in table order.
+        """
+        columns = [column for column in self.get_all_columns() if column != 'date']
+        if not columns:
+            return pd.DataFrame()
+        repo = self._synced_analytics_repo()
+        with timed('db_read'):
+            df = repo.get_frame(columns)
+        observe_frame('db_read', df)
+        return df
+
+    def _synced_analytics_repo(self):
+        """The DuckDB repository, after reloading it if its version differs from the SQLite traffic version."""
+        with _analytics_sync_lock:
+            if self.analytics_repo.get_version() != self.data_version_repo.get_token(TRAFFIC_VERSION):
+                self.sync_analytics_store()
+        return self.analytics_repo
+
+    def sync_analytics_store(self):
+        """
+        Replace the DuckDB copy with the stored daily traffic, e.g. after switching TRAFFIC_BACKEND
+        on or after an ingest in a process without the DuckDB store.
+
+        The copy is tagged with the traffic version read before copying, so a concurrent
+        ingest leaves it marked as behind.
+        """
+        columns = self.select_columns()
+        version = self.data_version_repo.get_token(TRAFFIC_VERSION)
+        self.logger.info(f"Copying {len(columns)} traffic series into the analytical store.")
+        pages = (pd.DataFrame(self.wiki_traffic_repo.get_page(columns, limit=5000, offset=offset), columns=['date'] + columns)
+                 for offset in range(0, self.wiki_traffic_repo.count(), 5000))
+        self.analytics_repo.load(pages, columns, version)
+
+    def select_columns(self, columns=None):
+        """
+        Validate requested traffic columns, defaulting to every series column.
+
+        Raises:
+        ValueError: If a requested column does not exist.
+        """
+        available = [column for column in self.get_all_columns() if column != 'date']
+        if not columns:
+            return available
+        unknown = [column for column in columns if column not in available]
+        if unknown:
+            raise ValueError(f"Unknown traffic columns: {', '.join(unknown)}")
+        return list(columns)
+
+    def get_traffic_page(self, page=1, per_page=100, columns=None, start=None, end=None):
+        """
+        Get one page of traffic rows for the selected columns and date range.
+
+        Parameters:
+        page (int): 1-based page number.
+        per_page (int): Rows per page, capped at 1000.
+        columns (list): Series columns to include; defaults to all.
+        start (date): First date to include.
+        end (date): Last date to include.
+
+        Returns:
+        dict: columns, rows (lists of values), page, per_page, total and pages.
+        """
+        columns = self.select_columns(columns)
+        page = max(page, 1)
+        per_page = min(max(per_page, 1), 1000)
+
+        rows = self.wiki_traffic_repo.get_page(columns, start, end, limit=per_page, offset=(page - 1) * per_page)
+        total = self.wiki_traffic_repo.count(start, end)
+        return {
+            'columns': ['date'] + columns,
+            'rows': [[row[0].isoformat()] + list(row[1:]) for row in rows],
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'pages': math.ceil(total / per_page) if total else 0,
+        }
+
+    def iter_traffic_csv(self, columns=None, start=None, end=None, batch_size=1000):
+        """
+        Stream the traffic table as CSV text, one batch of rows at a time.
+
+        Parameters:
+        columns (list): Series columns to include; defaults to all.
+        start (date): First date to include.
+        end (date): Last date to include.
+        batch_size (int): Rows read from the database and emitted per chunk.
+
+        Yields:
+        str: CSV chunks, starting with the header line.
+        """
+        columns = self.select_columns(columns)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['date'] + columns)
+
+        for i, row in enumerate(self.wiki_traffic_repo.iter_rows(columns, start, end, batch_size), start=1):
+            writer.writerow(row)
+            if i % batch_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    def iter_traffic_ndjson(self, columns=None, start=None, end=None, batch_size=1000):
+        """
+        Stream the traffic table as newline-delimited JSON, one object per date.
+
+        Parameters:
+        columns (list): Series columns to include; defaults to all.
+        start (date): First date to include.
+        end (date): Last date to include.
+        batch_size (int): Rows read from the database and emitted per chunk.
+
+        Yields:
+        str: Chunks of JSON lines.
+        """
+        columns = self.select_columns(columns)
+        keys = ['date'] + columns
+        lines = []
+        for row in self.wiki_traffic_repo.iter_rows(columns, start, end, batch_size):
+            lines.append(json.dumps(dict(zip(keys, [row[0].isoformat()] + list(row[1:])))))
+            if len(lines) == batch_size:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        if lines:
+            yield '\n'.join(lines) + '\n'
+
+    def get_traffic_version(self, columns=None, start=None, end=None):
+        """
+        Get a short identifier that changes whenever the selected traffic rows change.
+
+        Besides the row count and latest date, the token every ingest writes is included,
+        so revised values on existing days also give a new version.
+
+        Returns:
+        str: Hash of the ingest token, row count, latest date and the selection.
+        """
+        token = self.data_version_repo.get_token(TRAFFIC_VERSION)
+        count = self.wiki_traffic_repo.count(start, end)
+        latest = self.wiki_traffic_repo.max_date()
+        key = f"{token}:{count}:{latest}:{','.join(columns or [])}:{start}:{end}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+    def get_series(self, column, start=None, end=None):
+        """
+        Get one traffic series without loading the rest of the table.
+
+        Only the date and the requested column are read, and recently used series are
+        kept in a process-wide LRU of TRAFFIC_SERIES_CACHE_SIZE entries (0 disables it).
+        Entries are keyed by the token every ingest writes to the database, so they go
+        stale in every process at once, whichever process ran the ingest.
 
-        data_dict = {'date': [entry.date for entry in all_data]}
-        for column in columns:
-            data_dict[column] = [getattr(entry, column, None) for entry in all_data]
+        Parameters:
+        column (str): Series column name, e.g. 'en_Some event'.
+        start (date): First date to include.
+        end (date): Last date to include.
 
-        return pd.DataFrame(data_dict)
+        Returns:
+        pd.DataFrame: 'date' and the series column, in date order, for the days that have a count.
 
-    def get_traffic_data_for_page(self, language, title):
+        Raises:
+        ValueError: If the column does not exist.
+        """
+        key = (self.data_version_repo.get_token(TRAFFIC_VERSION), column, start, end)
+        with _series_cache_lock:
+            # Entries of an older version can never be hit again
+            if _series_cache and next(iter(_series_cache))[0] != key[0]:
+                _series_cache.clear()
+            hit = key in _series_cache
+            if hit:
+                _series_cache.move_to_end(key)
+                df = _series_cache[key]
+        record_cache('traffic_series', hit)
+        if hit:
+            return df.copy()
+
+        if column not in self.get_all_columns() or column == 'date':
+            raise ValueError(f"Unknown traffic column: {column}")
+        with timed('db_read_series'):
+            repo = self._synced_analytics_repo() if self.analytics_repo is not None else self.wiki_traffic_repo
+            rows = repo.get_series(column, start, end)
+            df = pd.DataFrame(rows, columns=['date', column])
+
+        if self.series_cache_size > 0:
+            with _series_cache_lock:
+                _series_cache[key] = df
+                _series_cache.move_to_end(key)
+                while len(_series_cache) > self.series_cache_size:
+                    _series_cache.popitem(last=False)
+        return df.copy()
+
+    def get_rolling_series(self, column, window, start=None, end=None):
+        """
+        Get the trailing mean of one series over `window` days with a count.
+
+        Computed by a window function in DuckDB when TRAFFIC_BACKEND=duckdb, otherwise in pandas.
+
+        Parameters:
+        column (str): Series column name.
+        window (int): Number of days averaged, including the current one.
+        start (date): First date to include.
+        end (date): Last date to include.
+
+        Returns:
+        pd.DataFrame: 'date' and the rolling mean under the series column name.
+
+        Raises:
+        ValueError: If the column does not exist or the window is not positive.
+        """
+        if window < 1:
+            raise ValueError("The rolling window must be at least one day")
+        if self.analytics_repo is None:
+            df = self.get_series(column, start, end)
+            df[column] = df[column].rolling(window=window, min_periods=1).mean()
+            return df
+
+        if column not in self.get_all_columns() or column == 'date':
+            raise ValueError(f"Unknown traffic column: {column}")
+        result = self._synced_analytics_repo().get_rolling_mean(column, window, start, end)
+        return pd.DataFrame({'date': pd.to_datetime(result['date']).date, column: result['mean']})
+
+    @staticmethod
+    def clear_series_cache():
+        """Drop every cached series; called after the traffic table changes."""
+        with _series_cache_lock:
+            _series_cache.clear()
+
+    def get_traffic_data_for_page(self, language, title, start=None, end=None):
         """
         Get traffic data for a specific Wikipedia page.
 
         Parameters:
         language (str): The language of the Wikipedia page.
         title (str): The title of the Wikipedia page.
+        start (date): First date to include.
+        end (date): Last date to include.
 
         Returns:
         pd.DataFrame: DataFrame containing the traffic data for the specified page.
         """
-        df = self.get_traffic_data_as_dataframe()
-        column_name = f"{language}_{title}"
-        if column_name in df.columns:
-            return df[['date', column_name]].sort_values('date')
-        else:
+        try:
+            return self.get_series(f"{language}_{title}", start, end)
+        except ValueError:
             self.logger.warning(f"No data found for page: {title} in language: {language}")
             return pd.DataFrame()
 
@@ -225,11 +653,8 @@ class WikiTrafficService:
         Returns:
         int: The total number of views.
         """
-        df = self.get_traffic_data_for_page(language, title)
-        if not df.empty:
-            column_name = f"{language}_{title}"
-            return df[column_name].sum()
-        return 0
+        summary = TrafficRollupService().get_summary(f"{language}_{title}")
+        return summary['total'] if summary else 0
 
     def get_average_views_for_page(self, language, title):
         """
@@ -242,11 +667,8 @@ class WikiTrafficService:
         Returns:
         float: The average number of views.
         """
-        df = self.get_traffic_data_for_page(language, title)
-        if not df.empty:
-            column_name = f"{language}_{title}"
-            return df[column_name].mean()
-        return 0
+        summary = TrafficRollupService().get_summary(f"{language}_{title}")
+        return summary['mean'] if summary else 0
 
     def save_to_csv(self, df):
         """
@@ -1,31 +1,9 @@
-import logging
 from models.wikipedia_page import WikipediaPage
 from repositories.wikipedia_repository import WikipediaRepository
 
-import logging
-import colorlog
+from utils.logging_config import get_logger
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
-
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
-
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
-
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
+logger = get_logger(__name__)
 
 
 
@@ -34,7 +12,6 @@ class WikipediaService:
     Service layer for WikipediaPage model operations.
     """
     logger = logger
-    logging.basicConfig(level=logging.INFO)
 
     @staticmethod
     def create_page(title, language, views, event_code, url):
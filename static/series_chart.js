@@ -0,0 +1,183 @@
+// Lightweight canvas chart for the compact series payloads of /api/v1/series/<name>.
+// Wheel zooms, dragging pans and a double click resets the view; nothing is requested again.
+var SeriesChart = (function () {
+    var DAY = 24 * 3600 * 1000;
+    var PADDING = { left: 60, right: 15, top: 15, bottom: 30 };
+
+    // Expand a payload into day timestamps and values
+    function decode(payload) {
+        var values = new Float64Array(payload.length);
+        var total = 0;
+        for (var i = 0; i < payload.length; i++) {
+            if (payload.encoding === 'delta') {
+                total += payload.values[i];
+                values[i] = total;
+            } else {
+                values[i] = payload.values[i];
+            }
+        }
+        var start = payload.start ? Date.parse(payload.start) : 0;
+        var forecast = null;
+        if (payload.forecast && payload.forecast.start) {
+            forecast = {
+                start: Date.parse(payload.forecast.start),
+                mean: payload.forecast.mean,
+                lower: payload.forecast.lower,
+                upper: payload.forecast.upper
+            };
+        }
+        return { name: payload.series, start: start, values: values, peaks: payload.peaks || [], forecast: forecast };
+    }
+
+    function Chart(canvas, payload) {
+        this.canvas = canvas;
+        this.bind();
+        this.update(payload);
+    }
+
+    // Show another payload on the same canvas, resetting the view
+    Chart.prototype.update = function (payload) {
+        this.data = decode(payload);
+        var end = this.data.start + Math.max(this.data.values.length - 1, 1) * DAY;
+        if (this.data.forecast) { end = this.data.forecast.start + (this.data.forecast.mean.length - 1) * DAY; }
+        this.full = [this.data.start, end];
+        this.view = this.full.slice();
+        this.draw();
+    };
+
+    Chart.prototype.x = function (time) {
+        var width = this.width - PADDING.left - PADDING.right;
+        return PADDING.left + (time - this.view[0]) / (this.view[1] - this.view[0]) * width;
+    };
+
+    Chart.prototype.y = function (value) {
+        var height = this.height - PADDING.top - PADDING.bottom;
+        return PADDING.top + height - (value - this.range[0]) / (this.range[1] - this.range[0] || 1) * height;
+    };
+
+    Chart.prototype.timeAt = function (px) {
+        var width = this.width - PADDING.left - PADDING.right;
+        return this.view[0] + (px - PADDING.left) / width * (this.view[1] - this.view[0]);
+    };
+
+    // Value range of what is visible, so zooming in rescales the y axis
+    Chart.prototype.visibleRange = function () {
+        var data = this.data, low = Infinity, high = -Infinity;
+        var first = Math.max(0, Math.floor((this.view[0] - data.start) / DAY));
+        var last = Math.min(data.values.length - 1, Math.ceil((this.view[1] - data.start) / DAY));
+        for (var i = first; i <= last; i++) {
+            low = Math.min(low, data.values[i]);
+            high = Math.max(high, data.values[i]);
+        }
+        if (data.forecast) {
+            for (var j = 0; j < data.forecast.mean.length; j++) {
+                low = Math.min(low, data.forecast.lower[j]);
+                high = Math.max(high, data.forecast.upper[j]);
+            }
+        }
+        return isFinite(low) ? [Math.min(low, 0), high] : [0, 1];
+    };
+
+    Chart.prototype.draw = function () {
+        var ratio = window.devicePixelRatio || 1;
+        this.width = this.canvas.clientWidth;
+        this.height = this.canvas.clientHeight;
+        this.canvas.width = this.width * ratio;
+        this.canvas.height = this.height * ratio;
+        var context = this.canvas.getContext('2d');
+        context.setTransform(ratio, 0, 0, ratio, 0, 0);
+        context.clearRect(0, 0, this.width, this.height);
+        this.range = this.visibleRange();
+
+        var data = this.data, self = this;
+        context.save();
+        context.beginPath();
+        context.rect(PADDING.left, PADDING.top, this.width - PADDING.left - PADDING.right, this.height - PADDING.top - PADDING.bottom);
+        context.clip();
+
+        if (data.forecast) {
+            var forecast = data.forecast;
+            context.fillStyle = 'rgba(255, 65, 54, 0.15)';
+            context.beginPath();
+            forecast.upper.forEach(function (value, i) { context.lineTo(self.x(forecast.start + i * DAY), self.y(value)); });
+            for (var k = forecast.lower.length - 1; k >= 0; k--) { context.lineTo(self.x(forecast.start + k * DAY), self.y(forecast.lower[k])); }
+            context.fill();
+            context.strokeStyle = '#ff4136';
+            context.setLineDash([4, 3]);
+            context.beginPath();
+            forecast.mean.forEach(function (value, i) { context.lineTo(self.x(forecast.start + i * DAY), self.y(value)); });
+            context.stroke();
+            context.setLineDash([]);
+        }
+
+        context.strokeStyle = '#0074d9';
+        context.lineWidth = 1;
+        context.beginPath();
+        for (var i = 0; i < data.values.length; i++) {
+            context.lineTo(this.x(data.start + i * DAY), this.y(data.values[i]));
+        }
+        context.stroke();
+
+        context.fillStyle = '#2ecc40';
+        data.peaks.forEach(function (position) {
+            context.beginPath();
+            context.arc(self.x(data.start + position * DAY), self.y(data.values[position]), 3.5, 0, 2 * Math.PI);
+            context.fill();
+        });
+        context.restore();
+
+        context.fillStyle = '#333';
+        context.font = '11px sans-serif';
+        context.textAlign = 'right';
+        [this.range[0], (this.range[0] + this.range[1]) / 2, this.range[1]].forEach(function (value) {
+            context.fillText(Math.round(value).toLocaleString(), PADDING.left - 6, self.y(value) + 4);
+        });
+        context.textAlign = 'center';
+        for (var t = 0; t <= 4; t++) {
+            var time = this.view[0] + t / 4 * (this.view[1] - this.view[0]);
+            context.fillText(new Date(time).toISOString().slice(0, 10), this.x(time), this.height - 10);
+        }
+    };
+
+    Chart.prototype.bind = function () {
+        var self = this, dragging = null;
+        this.canvas.addEventListener('wheel', function (event) {
+            event.preventDefault();
+            var rect = self.canvas.getBoundingClientRect();
+            var anchor = self.timeAt(event.clientX - rect.left);
+            var scale = event.deltaY < 0 ? 0.8 : 1.25;
+            var span = Math.max((self.view[1] - self.view[0]) * scale, 7 * DAY);
+            var share = (anchor - self.view[0]) / (self.view[1] - self.view[0]);
+            self.view = [anchor - share * span, anchor + (1 - share) * span];
+            self.draw();
+        }, { passive: false });
+        this.canvas.addEventListener('mousedown', function (event) { dragging = { x: event.clientX, view: self.view.slice() }; });
+        window.addEventListener('mouseup', function () { dragging = null; });
+        window.addEventListener('mousemove', function (event) {
+            if (!dragging) { return; }
+            var width = self.width - PADDING.left - PADDING.right;
+            var shift = (event.clientX - dragging.x) / width * (dragging.view[1] - dragging.view[0]);
+            self.view = [dragging.view[0] - shift, dragging.view[1] - shift];
+            self.draw();
+        });
+        this.canvas.addEventListener('dblclick', function () { self.view = self.full.slice(); self.draw(); });
+        window.addEventListener('resize', function () { self.draw(); });
+    };
+
+    // Fetch a payload and draw it, reusing the chart already on the canvas; returns a promise of the chart
+    function load(canvas, url) {
+        return fetch(url)
+            .then(function (response) { return response.json(); })
+            .then(function (payload) {
+                if (payload.error) { throw new Error(payload.error); }
+                if (canvas.seriesChart) {
+                    canvas.seriesChart.update(payload);
+                } else {
+                    canvas.seriesChart = new Chart(canvas, payload);
+                }
+                return canvas.seriesChart;
+            });
+    }
+
+    return { decode: decode, Chart: Chart, load: load };
+})();
@@ -0,0 +1,79 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.analysis_input import AnalysisInput
+from services.peaks_service import PeaksService
+from services.auto_correlation_service import AutoCorrelationService
+from services.cross_corr_service import CrossCorrelationService
+
+
+class TestAnalysisInput(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        rng = np.random.default_rng(0)
+        views = rng.poisson(100, size=90).astype(float)
+        views[30:33] += 3000
+        self.df = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=90).date,
+            'en_Event': views,
+            'ar_Event': np.r_[np.full(20, np.nan), views[20:]],
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_series_are_nan_free_floats(self):
+        analysis_input = AnalysisInput.from_frame(self.df)
+        series = analysis_input.series('ar_Event')
+
+        self.assertEqual(len(series), 70)
+        self.assertEqual(series.index[0], pd.Timestamp('2024-01-21'))
+        self.assertFalse(series.isna().any())
+        self.assertEqual(series.dtype, np.float64)
+        # Counts are stored as uint32, but the series can go negative without wrapping around
+        self.assertTrue(((series - 10000) < 0).all())
+        padded = analysis_input.padded('ar_Event')
+        self.assertEqual(padded.iloc[:20].sum(), 0)
+        self.assertTrue(np.shares_memory(padded.to_numpy(), analysis_input.matrix.values))
+
+    def test_interior_gaps_are_dropped_like_dropna(self):
+        self.df.loc[[40, 41], 'ar_Event'] = np.nan
+        analysis_input = AnalysisInput.from_frame(self.df)
+        series = analysis_input.series('ar_Event')
+
+        expected = self.df.set_index(pd.DatetimeIndex(self.df['date'], name='date'))['ar_Event'].dropna()
+        pd.testing.assert_series_equal(series, expected)
+        self.assertNotIn(pd.Timestamp('2024-02-10'), series.index)
+        self.assertEqual(analysis_input.padded('ar_Event').iloc[40], 0)
+        self.assertTrue(np.isnan(analysis_input.to_frame()['ar_Event'].iloc[40]))
+
+    def test_services_leave_the_shared_frame_untouched(self):
+        original = self.df.copy()
+        peaks_service = PeaksService()
+        peaks_service.figure_directory = self.directory
+        peaks_service.csv_file_path = os.path.join(self.directory, 'peaks.csv')
+        auto_corr_service = AutoCorrelationService()
+        auto_corr_service.figure_directory = self.directory
+
+        events = peaks_service.detect_peaks(self.df)
+        auto_corr_service.perform_auto_corr(self.df)
+        CrossCorrelationService().cross_correlation_test(self.df)
+
+        pd.testing.assert_frame_equal(self.df, original)
+        self.assertIn('2024-02-02', events['Event'][0]['dates'])
+
+
+if __name__ == '__main__':
+    unittest.main()
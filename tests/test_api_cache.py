@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.api import PageviewCache, split_date_range, fetch_pageview_items
+
+
+def _fake_response(url, headers=None):
+    """Answer like the API: one item per day of the requested range."""
+    start, end = url.rstrip('/').split('/')[-2:]
+    days = pd.date_range(pd.Timestamp(start[:8]), pd.Timestamp(end[:8]), freq='D')
+    response = MagicMock(status_code=200)
+    response.json.return_value = {'items': [{'timestamp': f"{day:%Y%m%d}00", 'views': day.day} for day in days]}
+    return response
+
+
+def _requested_span(call):
+    return tuple(call.args[0].rstrip('/').split('/')[-2:])
+
+
+class TestPageviewCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = PageviewCache(os.path.join(self.tmp_dir.name, 'cache.db'))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_split_date_range_marks_only_past_months_final(self):
+        chunks = split_date_range(date(2024, 1, 15), date(2024, 3, 10), today=date(2024, 3, 10))
+        self.assertEqual(chunks, [
+            (date(2024, 1, 15), date(2024, 1, 31), True),
+            (date(2024, 2, 1), date(2024, 2, 29), True),
+            (date(2024, 3, 1), date(2024, 3, 10), False),
+        ])
+
+    @patch('utils.api.requests.get', side_effect=_fake_response)
+    def test_past_chunks_are_served_from_cache(self, mock_get):
+        first = fetch_pageview_items('en', 'Page', '20200101', '20200331', cache=self.cache)
+        second = fetch_pageview_items('en', 'Page', '20200101', '20200331', cache=self.cache)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 91)
+        # One request for the whole cold range, none once its months are cached
+        self.assertEqual([_requested_span(call) for call in mock_get.call_args_list], [('20200101', '20200331')])
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (3, 3, 3))
+        self.assertEqual(len(self.cache.get(('en.wikipedia', 'Page', 'daily', '20200201', '20200229'))), 29)
+
+    @patch('utils.api.requests.get', side_effect=_fake_response)
+    def test_only_the_uncached_span_is_requested(self, mock_get):
+        fetch_pageview_items('en', 'Page', '20200101', '20200229', cache=self.cache)
+        items = fetch_pageview_items('en', 'Page', '20200101', '20200415', cache=self.cache)
+
+        self.assertEqual([_requested_span(call) for call in mock_get.call_args_list],
+                         [('20200101', '20200229'), ('20200301', '20200415')])
+        self.assertEqual([item['timestamp'] for item in items],
+                         [f"{day:%Y%m%d}00" for day in pd.date_range('2020-01-01', '2020-04-15')])
+
+    @patch('utils.api.requests.get', return_value=MagicMock(status_code=404))
+    def test_missing_data_is_not_cached(self, mock_get):
+        self.assertEqual(fetch_pageview_items('en', 'Page', '20200101', '20200331', cache=self.cache), [])
+        self.assertEqual(fetch_pageview_items('en', 'Page', '20200101', '20200331', cache=self.cache), [])
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_lru_eviction_respects_size_cap(self):
+        items = [{'timestamp': str(i), 'views': i} for i in range(200)]
+        self.cache.put(('p', 'a', 'daily', '1', '1'), items)
+        self.cache.max_bytes = self.cache.stats()['size_bytes'] + 10
+        self.cache.put(('p', 'b', 'daily', '1', '1'), items)
+
+        self.assertIsNone(self.cache.get(('p', 'a', 'daily', '1', '1')))
+        self.assertEqual(self.cache.get(('p', 'b', 'daily', '1', '1')), items)
+
+
+if __name__ == '__main__':
+    unittest.main()
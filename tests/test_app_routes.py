@@ -0,0 +1,74 @@
+import os
+import sys
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+# The routes run against a private in-memory database, whatever DATABASE_URI is set to
+with patch.dict(os.environ, {'DATABASE_URI': 'sqlite://'}):
+    from app import app, create_app
+
+from utils.database import db, create_tables
+from models.spike import SpikeState, SpikeEvent
+
+
+class TestSpikeRoutes(unittest.TestCase):
+
+    def setUp(self):
+        self.context = app.app_context()
+        self.context.push()
+        db.create_all()
+        self.client = app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_invalid_since_is_a_bad_request(self):
+        response = self.client.get('/spikes?since=yesterday')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.get_json())
+        self.assertEqual(self.client.get('/spikes?since=2024-01-01').get_json(), [])
+
+    def test_reset_clears_detector_state(self):
+        db.session.add(SpikeState(series='en_A', granularity='daily', count=20, mean=10.0, var=1.0))
+        db.session.add(SpikeEvent(series='en_A', granularity='daily', timestamp=datetime(2024, 1, 1), value=90.0,
+                                  baseline=10.0, zscore=8.0, detected_at=datetime(2024, 1, 2)))
+        db.session.commit()
+
+        create_tables(app)
+
+        self.assertEqual(SpikeState.query.count(), 0)
+        self.assertEqual(SpikeEvent.query.count(), 0)
+
+
+class TestForecastRoute(unittest.TestCase):
+
+    def test_requests_never_fit_or_update_models(self):
+        client = app.test_client()
+        with patch('services.wiki_traffic_service.WikiTrafficService.get_analysis_input'), \
+                patch('services.arima_service.ARIMAService.forecast', return_value={}) as forecast:
+            response = client.get('/forecast?series=en_A&horizon=3')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(forecast.call_args.kwargs['columns'], ['en_A'])
+        self.assertFalse(forecast.call_args.kwargs['fit'])
+
+
+class TestCreateApp(unittest.TestCase):
+
+    def test_pooled_connections_are_disposed_before_forking(self):
+        with app.app_context():
+            engine = db.engine
+        with patch.dict(os.environ, {'TRAFFIC_SNAPSHOT': 'False'}), patch.object(engine, 'dispose') as dispose:
+            self.assertIs(create_app(), app)
+        dispose.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from services.arima_service import ARIMAService
+from services.series_chart_service import SeriesChartService
+from utils.model_store import ARIMAModelStore
+
+
+class FakeResults:
+    """Stands in for statsmodels ARIMA results: forecasts the last value seen."""
+
+    def __init__(self, values):
+        self.values = list(values)
+
+    def append(self, endog, refit=False):
+        # Re-estimating the parameters is what the request path must never do
+        assert not refit, 'the stored parameters must be kept'
+        return FakeResults(self.values + np.asarray(endog, dtype=float).tolist())
+
+    def get_forecast(self, steps):
+        return FakePrediction(np.full(steps, self.values[-1]))
+
+
+class FakePrediction:
+
+    def __init__(self, mean):
+        self.predicted_mean = mean
+
+    def conf_int(self, alpha=0.05):
+        return np.column_stack([self.predicted_mean - 1, self.predicted_mean + 1])
+
+
+class FakeModel:
+    """Stands in for a fitted pmdarima model; update counts the (MLE) re-estimations."""
+
+    order = (1, 0, 0)
+
+    def __init__(self, values):
+        self.values = list(values)
+        self.updates = 0
+
+    @property
+    def arima_res_(self):
+        return FakeResults(self.values)
+
+    def params(self):
+        return [0.5]
+
+    def aic(self):
+        return 1.0
+
+    def update(self, y):
+        self.values.extend(np.asarray(y, dtype=float).tolist())
+        self.updates += 1
+        return self
+
+
+def traffic(days):
+    return pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=days, freq='D').date,
+        'en_A': np.arange(days, dtype=float) + 10,
+    })
+
+
+class TestARIMAForecast(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.service = ARIMAService()
+        self.service.model_store = ARIMAModelStore(self.directory)
+        patcher = patch.object(ARIMAService, '_fit_model', side_effect=lambda series: FakeModel(series))
+        self.fit = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_stored_model_is_reused(self):
+        first = self.service.forecast(traffic(30), horizon=3)
+        second = self.service.forecast(traffic(30), horizon=3)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.fit.call_count, 1)
+        self.assertEqual([record['date'][:10] for record in first['en_A']], ['2024-01-31', '2024-02-01', '2024-02-02'])
+        self.assertEqual(first['en_A'][0]['mean'], 39.0)
+
+    def test_refresh_updates_the_model_instead_of_refitting(self):
+        self.service.refresh_models(traffic(30))
+        self.service.refresh_models(traffic(33))
+
+        self.assertEqual(self.fit.call_count, 1)
+        entry = self.service.model_store.get('en_A')
+        self.assertEqual(entry['model'].updates, 1)
+        self.assertEqual(entry['last_date'], pd.Timestamp('2024-02-02'))
+
+        # The updated model was saved, so forecasts are plain hits
+        forecasts = self.service.forecast(traffic(33), horizon=2, fit=False)
+        self.assertEqual(forecasts['en_A'][0]['date'][:10], '2024-02-03')
+        self.assertEqual(forecasts['en_A'][0]['mean'], 42.0)
+        self.assertEqual(self.fit.call_count, 1)
+        self.assertEqual(entry['model'].updates, 1)
+
+    def test_refresh_refits_a_revised_history(self):
+        self.service.refresh_models(traffic(30))
+        revised = traffic(31)
+        revised.loc[5, 'en_A'] = 500.0
+
+        # Requests leave the stale model alone, the next refresh refits it
+        self.assertEqual(self.service.forecast(revised, horizon=2, fit=False), {})
+        self.assertEqual(self.fit.call_count, 1)
+        self.service.refresh_models(revised)
+        self.assertEqual(self.fit.call_count, 2)
+        self.assertIn('en_A', self.service.forecast(revised, horizon=2, fit=False))
+
+    def test_gap_near_the_end_keeps_daily_forecast_dates(self):
+        df = traffic(30)
+        df.loc[28, 'en_A'] = np.nan
+        self.service.refresh_models(df)
+        forecasts = self.service.forecast(df, horizon=3, fit=False)
+
+        self.assertEqual([record['date'][:10] for record in forecasts['en_A']], ['2024-01-31', '2024-02-01', '2024-02-02'])
+
+    def test_unknown_series_are_skipped(self):
+        forecasts = self.service.forecast(traffic(30), horizon=2, columns=['en_A', 'xx_Missing'])
+        self.assertEqual(list(forecasts), ['en_A'])
+
+    def test_lookup_only_never_fits(self):
+        self.assertEqual(self.service.forecast(traffic(30), horizon=2, fit=False), {})
+        self.assertEqual(self.fit.call_count, 0)
+
+    def test_lookup_only_extends_an_older_model_without_estimation(self):
+        self.service.refresh_models(traffic(30))
+        with patch.object(FakeModel, 'update', side_effect=AssertionError('update re-runs the optimizer')):
+            forecasts = self.service.forecast(traffic(33), horizon=2, fit=False)
+
+        self.assertEqual(forecasts['en_A'][0]['date'][:10], '2024-02-03')
+        self.assertEqual(forecasts['en_A'][0]['mean'], 42.0)
+        self.assertEqual(self.fit.call_count, 1)
+        entry = self.service.model_store.get('en_A')
+        self.assertEqual(entry['model'].updates, 0)
+        self.assertEqual(entry['last_date'], pd.Timestamp('2024-01-30'))
+
+    def test_chart_overlay_needs_a_stored_model(self):
+        chart_service = SeriesChartService()
+        chart_service.arima_service = self.service
+        df = traffic(30)
+        df.loc[10, 'en_A'] = np.nan
+        observed = df.dropna().reset_index(drop=True)
+        with patch.object(chart_service.wiki_traffic_service, 'get_series', return_value=observed), \
+                patch.object(chart_service.wiki_traffic_service, 'get_traffic_version', return_value='v1'):
+            payload = chart_service.get_payload('en_A', peaks=0, horizon=3)
+            self.assertNotIn('forecast', payload)
+            self.assertEqual(self.fit.call_count, 0)
+            before = chart_service.get_version('en_A', forecast=True)
+
+            # A model fitted elsewhere on the same days (gap left out) is found by its fingerprint
+            self.service.forecast(df, horizon=3)
+            payload = chart_service.get_payload('en_A', peaks=0, horizon=3)
+            # Responses with the overlay are revalidated once a model is stored
+            self.assertNotEqual(chart_service.get_version('en_A', forecast=True), before)
+            self.assertEqual(chart_service.get_version('en_A'), 'v1')
+        self.assertEqual(payload['forecast']['start'], '2024-01-31')
+        self.assertEqual(payload['length'], 30)
+        self.assertEqual(self.fit.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from services.arima_service import ARIMAService, baseline_forecasts
+
+
+class TestBaselineForecasts(unittest.TestCase):
+
+    def test_forecasts_only_use_past_rows(self):
+        values = np.array([[1.0, np.nan], [2.0, 10.0], [3.0, 12.0], [4.0, 14.0], [5.0, 16.0]])
+        forecasts = baseline_forecasts(values, season=2, alpha=0.5)
+
+        np.testing.assert_array_equal(forecasts['seasonal_naive'][:, 0], [np.nan, np.nan, 1, 2, 3])
+        # A linear series is forecast exactly by the drift method once it has two points
+        np.testing.assert_array_equal(forecasts['drift'][2:, 0], [3, 4, 5])
+        np.testing.assert_array_equal(forecasts['drift'][3:, 1], [14, 16])
+        np.testing.assert_array_equal(forecasts['exponential_smoothing'][:, 1], [np.nan, np.nan, 10, 11, 12.5])
+
+
+def traffic(days=70):
+    """A weekly series the seasonal-naive baseline forecasts exactly, a noisy one and one with a single day."""
+    noise = np.random.default_rng(0).uniform(0, 1000, size=days)
+    short = np.full(days, np.nan)
+    short[-1] = 50.0
+    return pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=days, freq='D').date,
+        'en_Weekly': np.resize([100.0, 200.0, 300.0, 150.0, 120.0, 80.0, 90.0], days),
+        'en_Noisy': noise,
+        'en_Short': short,
+    })
+
+
+class TestTieredBacktest(unittest.TestCase):
+
+    def setUp(self):
+        self.service = ARIMAService()
+        for name in ('_plot_forecast', 'arima_save_to_csv'):
+            patcher = patch.object(ARIMAService, name, return_value=f'{name}.png')
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_baseline_backtest_scores_each_series(self):
+        frame = traffic().set_index('date')
+        results, relative_errors = self.service.baseline_backtest(frame)
+
+        self.assertEqual(relative_errors['en_Weekly'], 0.0)
+        self.assertEqual({r['model'] for r in results['en_Weekly']}, {'seasonal_naive'})
+        # The last 30% of the days are the test window
+        self.assertEqual(len(results['en_Weekly']), 70 - int(70 * 0.7))
+        self.assertGreater(relative_errors['en_Noisy'], self.service.baseline_threshold)
+        self.assertEqual(results['en_Short'], [])
+        self.assertEqual(relative_errors['en_Short'], float('inf'))
+
+    def test_only_series_the_baselines_miss_are_escalated(self):
+        arima_records = [{'date': pd.Timestamp('2024-03-10'), 'forecast': 1.0, 'model': 'ARIMA(1, 0, 0)'}]
+        with patch.object(ARIMAService, 'load_arima_results',
+                          return_value=({'en_Noisy': arima_records}, ['arima_forecast_en_Noisy.png'])) as load_arima:
+            results, filenames = self.service.load_tiered_results(None, traffic())
+
+        self.assertEqual(load_arima.call_args.kwargs['columns'], ['en_Noisy'])
+        self.assertIs(results['en_Noisy'], arima_records)
+        self.assertEqual(results['en_Weekly'][0]['model'], 'seasonal_naive')
+        # Too short to score a baseline on, so too short for auto_arima as well
+        self.assertNotIn('en_Short', results)
+        self.assertEqual(len(filenames), 2)
+
+    def test_threshold_controls_escalation(self):
+        with patch.object(ARIMAService, 'load_arima_results', return_value=({}, [])) as load_arima:
+            results, _ = self.service.load_tiered_results(None, traffic(), threshold=1e9)
+
+        self.assertEqual(load_arima.call_args.kwargs['columns'], [])
+        self.assertEqual(set(results), {'en_Weekly', 'en_Noisy'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,49 +1,43 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
 import logging
-from flask import Flask
+
+import numpy as np
+import pandas as pd
 
 # Ensure the parent directory is in sys.path
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
-from dotenv import load_dotenv
 from services.cross_corr_service import CrossCorrelationService
-from services.wiki_traffic_service import WikiTrafficService
-from utils.database import init_db
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class TestCrossCorrelationService(unittest.TestCase):
 
-    def test_cross_corr_service_sequence(self, mock_reset_directory, mock_check_directory):
-        # Arrange
-
-        # Load environment variables from .env file
-        load_dotenv()
-
-        # Create a Flask application
-        app = Flask(__name__)
-        # Use a single database URI
-        app.config['SQLALCHEMY_DATABASE_URI'] = os.environ['DATABASE_URI']
-
-        # Initialize the database
-        with app.app_context():
-            init_db(app)
-
-        cross_corr_service = CrossCorrelationService()
-        wiki_traffic_service = WikiTrafficService()
-
-        with app.app_context():  # Use the application context
-            logging.info("Get all traffic data as a DataFrame.")
-            wiki_traffic_df = wiki_traffic_service.get_traffic_data_as_dataframe()
-
-            logging.info("Performing cross correlation.")
-            cross_corr_service.perform_cross_corr(wiki_traffic_df)
+    def test_cross_corr_service_sequence(self):
+        # Arrange: a page, the page it follows three days later and unrelated noise
+        rng = np.random.default_rng(0)
+        leader = rng.poisson(100, size=120).astype(float)
+        leader[40:45] += 2000
+        df = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=120).date,
+            'de_Event': np.r_[np.full(3, 100.0), leader[:-3]],
+            'en_Event': leader,
+            'fr_Other': rng.poisson(100, size=120).astype(float),
+        })
+
+        # Act
+        logging.info("Performing cross correlation.")
+        results = CrossCorrelationService().cross_correlation_test(df, max_lag=10)
+
+        # Assert: only the correlated pair is reported
+        self.assertEqual(len(results), 1)
+        self.assertEqual((results.loc[0, 'Page 1'], results.loc[0, 'Page 2']), ('de_Event', 'en_Event'))
+        self.assertGreater(results.loc[0, 'Max Correlation'], 0.5)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,66 @@
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from flask import Flask
+from sqlalchemy import inspect, text
+from sqlalchemy.pool import QueuePool
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.database import db, init_db, engine_options
+
+
+class TestDatabaseTuning(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(self.directory, 'test.db')}"
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_sqlite_keeps_default_engine_without_tuning(self):
+        self.assertEqual(engine_options('sqlite:////tmp/a.db'), {})
+        self.assertEqual(engine_options('sqlite://', sqlite_tuning=True), {})
+        self.assertTrue(engine_options('postgresql://db/app')['pool_pre_ping'])
+
+    def test_tuning_enables_wal_and_pool(self):
+        with mock.patch.dict(os.environ, {'SQLITE_TUNING': 'True', 'SQLITE_SYNCHRONOUS': 'NORMAL'}):
+            init_db(self.app)
+        with self.app.app_context():
+            self.assertIsInstance(db.engine.pool, QueuePool)
+            self.assertEqual(db.session.execute(text("PRAGMA journal_mode")).scalar(), 'wal')
+            self.assertEqual(db.session.execute(text("PRAGMA synchronous")).scalar(), 1)
+            db.session.remove()
+            db.engine.dispose()
+
+    def test_lookup_indexes_are_created(self):
+        init_db(self.app)
+        with self.app.app_context():
+            db.create_all()
+            indexes = {index['name'] for index in inspect(db.engine).get_indexes('events')}
+            self.assertIn('ix_events_event_code', indexes)
+            db.engine.dispose()
+
+    def test_missing_model_tables_are_created(self):
+        # A database from before the spike, hourly, rollup and version tables existed
+        with sqlite3.connect(os.path.join(self.directory, 'test.db')) as connection:
+            connection.execute('CREATE TABLE "wikiTraffic" (date DATE PRIMARY KEY)')
+        init_db(self.app)
+        with self.app.app_context():
+            tables = set(inspect(db.engine).get_table_names())
+            db.engine.dispose()
+        self.assertTrue({'dataVersions', 'spikeStates', 'spikeEvents', 'wikiTrafficHourly', 'trafficRollups'} <= tables)
+
+
+if __name__ == '__main__':
+    unittest.main()
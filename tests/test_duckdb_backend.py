@@ -0,0 +1,174 @@
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from flask import Flask
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.database import db, init_db
+from repositories import duckdb_traffic_repository
+from repositories.duckdb_traffic_repository import duckdb, DuckDBTrafficRepository, close_connections
+from repositories.wiki_traffic_repository import WikiTrafficRepository
+from repositories.data_version_repository import DataVersionRepository
+from services.rollup_service import rollup_series
+from services.wiki_traffic_service import WikiTrafficService, TRAFFIC_VERSION
+
+
+@unittest.skipIf(duckdb is None, "duckdb is not installed")
+class TestDuckDBTrafficRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = DuckDBTrafficRepository(':memory:')
+        self.repo.connection.execute("DELETE FROM traffic")
+        self.repo.connection.execute("DELETE FROM dates")
+        self.repo.connection.execute("DELETE FROM versions")
+        self.df = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=40).date,
+            'en_A': np.arange(40, dtype=float),
+            "ar_it's": [np.nan] * 5 + [10.0] * 35,
+        })
+        self.columns = ['en_A', "ar_it's"]
+        self.repo.replace_frame(self.df, self.columns)
+
+    def test_frame_pivots_back_to_the_wide_layout(self):
+        pd.testing.assert_frame_equal(self.repo.get_frame(self.columns), self.df)
+        ranged = self.repo.get_frame(['en_A'], start=date(2024, 1, 10), end=date(2024, 1, 12))
+        self.assertEqual(ranged['en_A'].tolist(), [9.0, 10.0, 11.0])
+
+    def test_replace_frame_drops_counts_missing_from_the_new_ingest(self):
+        update = self.df.iloc[:10].copy()
+        update.loc[0, 'en_A'] = np.nan
+        self.repo.replace_frame(update, ['en_A'])
+        series = self.repo.get_series('en_A')
+        self.assertEqual(len(series), 39)
+        self.assertEqual(series[0], (date(2024, 1, 2), 1.0))
+
+    def test_rollups_match_the_pandas_buckets(self):
+        expected = rollup_series(self.df.set_index(pd.to_datetime(self.df['date']))['en_A'], 'week')
+        rollups = self.repo.get_rollups(['en_A'], 'week')
+        self.assertEqual(rollups['total'].tolist(), expected['total'].tolist())
+        self.assertEqual(pd.to_datetime(rollups['period_start']).tolist(), expected.index.tolist())
+
+    def test_rolling_mean(self):
+        result = self.repo.get_rolling_mean('en_A', 3)
+        self.assertEqual(result['mean'][:3].tolist(), [0.0, 0.5, 1.0])
+
+    def test_version_is_written_with_the_rows(self):
+        self.assertIsNone(self.repo.get_version())
+        self.repo.replace_frame(self.df.iloc[:3], ['en_A'], version='v1')
+        self.assertEqual(self.repo.get_version(), 'v1')
+        self.repo.replace_frame(self.df.iloc[:3], ['en_A'])
+        self.assertEqual(self.repo.get_version(), 'v1')
+
+    def test_load_replaces_the_whole_store(self):
+        pages = [self.df.iloc[:2][['date', 'en_A']], self.df.iloc[2:4][['date', 'en_A']]]
+        self.repo.load(iter(pages), ['en_A'], 'v2')
+        self.assertEqual([row[1] for row in self.repo.get_series('en_A')], [0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(self.repo.get_series("ar_it's"), [])
+        self.assertEqual(self.repo.get_version(), 'v2')
+
+
+@unittest.skipIf(duckdb is None, "duckdb is not installed")
+class TestDuckDBConnections(unittest.TestCase):
+
+    def test_forked_child_forgets_the_parent_connections(self):
+        path = ':memory:'
+        parent = DuckDBTrafficRepository(path).connection
+        with patch.object(duckdb_traffic_repository, '_inherited_connections', []) as inherited, \
+                patch.object(duckdb_traffic_repository, '_unavailable', True):
+            duckdb_traffic_repository._forget_connections_after_fork()
+            self.assertFalse(duckdb_traffic_repository._unavailable)
+            self.assertEqual(inherited, [parent])
+            self.assertIsNot(DuckDBTrafficRepository(path).connection, parent)
+
+    def test_close_connections(self):
+        repo = DuckDBTrafficRepository(':memory:')
+        close_connections()
+        self.assertEqual(duckdb_traffic_repository._connections, {})
+        with self.assertRaises(duckdb.Error):
+            repo.connection.execute("SELECT 1")
+
+
+@unittest.skipIf(duckdb is None, "duckdb is not installed")
+class TestDuckDBTrafficService(unittest.TestCase):
+
+    def setUp(self):
+        close_connections()
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        init_db(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.env = patch.dict(os.environ, {'TRAFFIC_BACKEND': 'duckdb', 'DUCKDB_PATH': ':memory:'})
+        self.env.start()
+        self.repo = WikiTrafficRepository()
+        self.repo.create_table(['en_A'])
+        self._write({i: float(i) for i in range(5)})
+        WikiTrafficService.clear_series_cache()
+
+    def tearDown(self):
+        WikiTrafficService.clear_series_cache()
+        self.env.stop()
+        close_connections()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _write(self, values):
+        """Store rows and a new version, as an ingest in a process without this DuckDB store would."""
+        for day, value in values.items():
+            self.repo.insert_or_update(date(2024, 1, 1) + timedelta(days=day), {'en_A': value})
+        DataVersionRepository.bump(TRAFFIC_VERSION)
+        self.repo.commit()
+
+    def test_reads_reload_a_copy_that_is_behind(self):
+        service = WikiTrafficService()
+        self.assertEqual(service.get_traffic_data_as_dataframe()['en_A'].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(service.analytics_repo.get_version(), DataVersionRepository.get_token(TRAFFIC_VERSION))
+
+        # The copy is not empty, but its version no longer matches SQLite
+        self._write({2: 20.0, 5: 5.0})
+        self.assertEqual(service.get_traffic_data_as_dataframe()['en_A'].tolist(), [0.0, 1.0, 20.0, 3.0, 4.0, 5.0])
+        self.assertEqual(service.get_series('en_A')['en_A'].tolist(), [0.0, 1.0, 20.0, 3.0, 4.0, 5.0])
+
+    def test_frame_matches_sqlite_on_days_without_counts(self):
+        self._write({5: None, 6: 6.0})
+
+        duckdb_frame = WikiTrafficService().get_traffic_data_as_dataframe()
+        with patch.dict(os.environ, {'TRAFFIC_BACKEND': 'sqlite'}):
+            sqlite_frame = WikiTrafficService().get_traffic_data_as_dataframe()
+        self.assertEqual(len(sqlite_frame), 7)
+        pd.testing.assert_frame_equal(duckdb_frame, sqlite_frame.astype({'en_A': float}))
+
+    def test_ingest_updates_the_copy_and_its_version(self):
+        service = WikiTrafficService()
+        service.get_traffic_data_as_dataframe()
+        fetched = pd.DataFrame({'date': [date(2024, 1, 1) + timedelta(days=i) for i in range(7)],
+                                'en_A': [0.0, 1.0, 2.0, 30.0, 4.0, 5.0, 6.0]})
+        with patch.object(WikiTrafficService, 'get_traffic_data', return_value=fetched), \
+                patch.object(WikiTrafficService, 'save_to_csv'), \
+                patch('services.wiki_traffic_service.snapshot_enabled', return_value=False), \
+                patch('services.wiki_traffic_service.SpikeDetectionService'):
+            service.create_and_populate_wiki_traffic()
+        self.assertEqual(service.analytics_repo.get_version(), DataVersionRepository.get_token(TRAFFIC_VERSION))
+        self.assertEqual([row[1] for row in service.analytics_repo.get_series('en_A')], fetched['en_A'].tolist())
+
+    def test_ingest_refuses_to_run_without_the_store(self):
+        with patch('services.wiki_traffic_service.get_analytics_repository', return_value=None), \
+                patch.object(WikiTrafficService, 'get_traffic_data') as fetch:
+            with self.assertRaises(RuntimeError):
+                WikiTrafficService().create_and_populate_wiki_traffic()
+        fetch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import os
+import sys
+import gzip
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+from sqlalchemy import text
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+# The routes run against a private in-memory database, whatever DATABASE_URI is set to
+with patch.dict(os.environ, {'DATABASE_URI': 'sqlite://'}):
+    from app import app
+
+from utils.database import db
+from repositories.wiki_traffic_repository import WikiTrafficRepository
+from services.wiki_traffic_service import WikiTrafficService
+from services.export_service import ExportService
+from utils.streaming import ExportSpoolCache
+
+START = date(2024, 1, 1)
+DAYS = 30
+URL = '/export/traffic.csv'
+
+
+class TestTrafficExportRoute(unittest.TestCase):
+
+    def setUp(self):
+        self.context = app.app_context()
+        self.context.push()
+        db.create_all()
+        self.repo = WikiTrafficRepository()
+        self.repo.create_table(['en_A'])
+        for i in range(DAYS):
+            self.repo.insert_or_update(START + timedelta(days=i), {'en_A': float(i)})
+        self.repo.commit()
+        self.spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.spool_dir.cleanup)
+        spool_patch = patch('app.get_export_spool_cache', return_value=ExportSpoolCache(self.spool_dir.name))
+        spool_patch.start()
+        self.addCleanup(spool_patch.stop)
+        self.client = app.test_client()
+        self.full = self.client.get(URL)
+
+    def tearDown(self):
+        db.session.remove()
+        db.session.execute(text('DROP TABLE IF EXISTS "wikiTraffic"'))
+        db.session.execute(text('DELETE FROM "dataVersions"'))
+        db.session.execute(text('DELETE FROM "trafficRollups"'))
+        db.session.commit()
+        self.context.pop()
+
+    def _ingest(self, values):
+        """Run the daily ingest on a frame of en_A values from START, without the side outputs."""
+        fetched = pd.DataFrame({'date': [START + timedelta(days=i) for i in range(len(values))], 'en_A': values})
+        with patch.object(WikiTrafficService, 'get_traffic_data', return_value=fetched), \
+                patch.object(WikiTrafficService, 'save_to_csv'), \
+                patch('services.wiki_traffic_service.snapshot_enabled', return_value=False), \
+                patch('services.wiki_traffic_service.SpikeDetectionService'):
+            WikiTrafficService().create_and_populate_wiki_traffic()
+
+    def test_full_response(self):
+        self.assertEqual(self.full.status_code, 200)
+        lines = self.full.data.decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'date,en_A')
+        self.assertEqual(len(lines), DAYS + 1)
+        self.assertEqual(self.full.headers['Accept-Ranges'], 'bytes')
+
+    def test_range_returns_the_slice(self):
+        response = self.client.get(URL, headers={'Range': 'bytes=5-24'})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.data, self.full.data[5:25])
+        self.assertEqual(response.headers['Content-Range'], f'bytes 5-24/{len(self.full.data)}')
+        self.assertEqual(response.headers['Content-Length'], '20')
+
+        suffix = self.client.get(URL, headers={'Range': 'bytes=-10'})
+        self.assertEqual(suffix.status_code, 206)
+        self.assertEqual(suffix.data, self.full.data[-10:])
+
+    def test_ranges_of_one_version_generate_the_export_once(self):
+        with patch.object(ExportService, 'open_export', autospec=True, side_effect=ExportService.open_export) as open_export, \
+                patch.object(WikiTrafficService, 'iter_traffic_csv', autospec=True,
+                             side_effect=WikiTrafficService.iter_traffic_csv) as iterate:
+            first = self.client.get(URL, headers={'Range': 'bytes=0-9'})
+            second = self.client.get(URL, headers={'Range': 'bytes=10-'})
+        self.assertEqual(open_export.call_count, 2)
+        self.assertEqual(iterate.call_count, 1)
+        self.assertEqual(first.data + second.data, self.full.data)
+
+    def test_unsatisfiable_range(self):
+        total = len(self.full.data)
+        response = self.client.get(URL, headers={'Range': f'bytes={total}-'})
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response.headers['Content-Range'], f'bytes */{total}')
+
+    def test_if_range_matching_etag_returns_the_slice(self):
+        response = self.client.get(URL, headers={'Range': 'bytes=0-9', 'If-Range': self.full.headers['ETag']})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.data, self.full.data[:10])
+
+    def test_stale_if_range_returns_the_full_body(self):
+        response = self.client.get(URL, headers={'Range': 'bytes=0-9', 'If-Range': '"outdated-csv"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, self.full.data)
+
+    def test_revised_values_change_the_version(self):
+        # Same days and row count, one revised value: a resumed download must not mix the two bodies
+        values = [float(i) for i in range(DAYS)]
+        values[3] = 1000.0
+        self._ingest(values)
+
+        current = self.client.get(URL)
+        self.assertNotEqual(current.headers['ETag'], self.full.headers['ETag'])
+        self.assertIn(b'2024-01-04,1000.0', current.data)
+        response = self.client.get(URL, headers={'Range': 'bytes=0-9', 'If-Range': self.full.headers['ETag']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, current.data)
+
+    def test_gzip_response(self):
+        response = self.client.get(URL, headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.headers['ETag'], self.full.headers['ETag'][:-1] + '-gzip"')
+        self.assertEqual(gzip.decompress(response.data), self.full.data)
+
+    def test_range_ignores_gzip(self):
+        response = self.client.get(URL, headers={'Range': 'bytes=0-9', 'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 206)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.data, self.full.data[:10])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.figures import figure_variants
+
+
+class TestFigureVariants(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'peaks_en_A.png')
+        Image.new('RGB', (2000, 600), 'white').save(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_writes_full_size_and_thumbnails(self):
+        variants = figure_variants(self.path)
+
+        self.assertEqual(variants['full'], 'variants/peaks_en_A.webp')
+        self.assertEqual([width for width, _ in variants['thumbnails']], [640, 1280])
+        with Image.open(os.path.join(self.directory, variants['full'])) as full:
+            self.assertEqual(full.size, (2000, 600))
+        with Image.open(os.path.join(self.directory, variants['thumbnails'][0][1])) as thumbnail:
+            self.assertEqual(thumbnail.size, (640, 192))
+        # The analyses list their figure directories; only the original PNG is at the top level
+        self.assertEqual(sorted(f for f in os.listdir(self.directory) if f.endswith('.png')), ['peaks_en_A.png'])
+
+    def test_fresh_variants_are_kept(self):
+        variants = figure_variants(self.path)
+        full = os.path.join(self.directory, variants['full'])
+        written = os.stat(full).st_mtime_ns
+
+        self.assertEqual(figure_variants(self.path), variants)
+        self.assertEqual(os.stat(full).st_mtime_ns, written)
+
+    def test_unreadable_figure_has_no_variants(self):
+        self.assertIsNone(figure_variants(os.path.join(self.directory, 'missing.png')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from flask import Flask
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.database import db, init_db
+from models.hourly_traffic import HourlyTrafficChunk
+from repositories.hourly_traffic_repository import HourlyTrafficRepository
+from services.wiki_traffic_service import WikiTrafficService
+
+
+class TestHourlyTraffic(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        init_db(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.repo = HourlyTrafficRepository()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_counts_round_trip_with_gaps(self):
+        chunk = HourlyTrafficChunk(series='en_A', month='2024-01',
+                                   counts=HourlyTrafficChunk.encode_counts([np.nan, 0, 5, np.nan, 7]))
+        np.testing.assert_array_equal(chunk.decode_counts(), [np.nan, 0, 5, np.nan, 7])
+
+    def test_upsert_keeps_hours_outside_the_new_window(self):
+        self.repo.upsert_chunk('en_A', '2024-01', np.arange(48, dtype=float))
+        # A later fetch starts on the second day and revises hour 30
+        later = np.full(72, np.nan)
+        later[24:] = 100.0
+        self.repo.upsert_chunk('en_A', '2024-01', later)
+        self.repo.commit()
+
+        series = self.repo.get_series('en_A')
+        self.assertEqual(len(series), 72)
+        self.assertEqual(list(series.iloc[:24]), list(range(24)))
+        self.assertTrue((series.iloc[24:] == 100.0).all())
+
+    def test_get_series_trims_month_padding_and_window(self):
+        values = np.full(40, np.nan)
+        values[10:30] = 1.0
+        self.repo.upsert_chunk('en_A', '2024-01', values)
+        self.repo.upsert_chunk('en_A', '2024-02', np.ones(5))
+        self.repo.commit()
+
+        series = self.repo.get_series('en_A')
+        self.assertEqual(series.index[0], pd.Timestamp('2024-01-01 10:00'))
+        self.assertEqual(series.index[-1], pd.Timestamp('2024-02-01 04:00'))
+        # Hours inside the span that were never fetched stay NaN
+        self.assertTrue(np.isnan(series.loc['2024-01-02 06:00']))
+
+        window = self.repo.get_series('en_A', start='2024-02-01', end='2024-02-01 02:00')
+        self.assertEqual(list(window), [1.0, 1.0, 1.0])
+        self.assertTrue(self.repo.get_series('en_B').empty)
+
+    def test_ingest_merges_into_the_first_month_of_the_window(self):
+        self.repo.upsert_chunk('en_A', '2024-01', np.full(24 * 10, 3.0))
+        self.repo.commit()
+        fetched = pd.DataFrame({
+            'date': pd.date_range('2024-01-05', periods=24 * 10, freq='H'),
+            'en_A': 9.0,
+        })
+        with patch.object(WikiTrafficService, 'get_traffic_data', return_value=fetched), \
+                patch('services.wiki_traffic_service.SpikeDetectionService'):
+            WikiTrafficService().create_and_populate_hourly_traffic()
+
+        series = self.repo.get_series('en_A')
+        self.assertEqual(series.index[0], pd.Timestamp('2024-01-01 00:00'))
+        self.assertTrue((series.loc[:'2024-01-04 23:00'] == 3.0).all())
+        self.assertTrue((series.loc['2024-01-05':] == 9.0).all())
+        self.assertEqual(series.index[-1], pd.Timestamp('2024-01-14 23:00'))
+
+    def test_analysis_dataframe_resamples_hourly_traffic(self):
+        self.repo.upsert_chunk('en_A', '2024-01', np.ones(48))
+        self.repo.upsert_chunk('ar_A', '2024-01', np.full(24, 2.0))
+        self.repo.commit()
+
+        with patch.dict(os.environ, {'TRAFFIC_GRANULARITY': 'hourly', 'TRAFFIC_RESAMPLE': 'D'}):
+            df = WikiTrafficService().get_analysis_dataframe()
+
+        self.assertEqual(list(df['date']), list(pd.date_range('2024-01-01', periods=2, freq='D')))
+        self.assertEqual(list(df['en_A']), [24.0, 24.0])
+        # A day without any count stays missing rather than becoming 0
+        self.assertEqual(df['ar_A'].iloc[0], 48.0)
+        self.assertTrue(np.isnan(df['ar_A'].iloc[1]))
+
+    def test_analysis_dataframe_resamples_daily_traffic(self):
+        daily = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=14, freq='D').date, 'en_A': 1.0})
+        with patch.dict(os.environ, {'TRAFFIC_GRANULARITY': 'daily', 'TRAFFIC_RESAMPLE': 'W'}), \
+                patch('services.wiki_traffic_service.snapshot_enabled', return_value=False), \
+                patch.object(WikiTrafficService, 'get_traffic_data_as_dataframe', return_value=daily):
+            df = WikiTrafficService().get_analysis_dataframe()
+
+        self.assertEqual(list(df['en_A']), [7.0, 7.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from flask import Flask, Response, render_template_string
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.http_cache import init_static_fingerprints, is_not_modified, set_cache_headers, to_jsonable
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open(os.path.join(self.directory, 'figure.png'), 'wb') as file:
+            file.write(b'first')
+
+        self.app = Flask(__name__, static_folder=self.directory)
+        init_static_fingerprints(self.app)
+
+        @self.app.route('/page')
+        def page():
+            if is_not_modified('v1'):
+                return set_cache_headers(Response(status=304), 'v1')
+            return set_cache_headers(Response(render_template_string("{{ static_url('figure.png') }}")), 'v1')
+
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_conditional_get_returns_304(self):
+        response = self.client.get('/page')
+        self.assertEqual(response.headers['ETag'], '"v1"')
+        self.assertEqual(self.client.get('/page', headers={'If-None-Match': '"v1"'}).status_code, 304)
+        self.assertEqual(self.client.get('/page', headers={'If-None-Match': '"v0"'}).status_code, 200)
+
+    def test_static_urls_change_with_content_and_are_immutable(self):
+        first = self.client.get('/page').get_data(as_text=True)
+        with open(os.path.join(self.directory, 'figure.png'), 'wb') as file:
+            file.write(b'second version')
+        second = self.client.get('/page').get_data(as_text=True)
+
+        self.assertNotEqual(first, second)
+        response = self.client.get(second)
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        response.close()
+
+    def test_results_become_plain_json(self):
+        results = to_jsonable({'acf': np.array([1.0, np.nan]), 'ccf': pd.DataFrame({'Best Lag': [np.int64(3)]})})
+        self.assertEqual(results, {'acf': [1.0, None], 'ccf': [{'Best Lag': 3}]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import sys
+import logging
+import unittest
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils import logging_config
+from utils.logging_config import parse_levels, configure_logging, restart_listener
+
+
+class TestParseLevels(unittest.TestCase):
+
+    def test_per_subsystem_levels(self):
+        self.assertEqual(
+            parse_levels('services.arima_service=debug, utils = WARNING,'),
+            {'services.arima_service': 'DEBUG', 'utils': 'WARNING'}
+        )
+
+    def test_empty_spec(self):
+        self.assertEqual(parse_levels(None), {})
+        self.assertEqual(parse_levels(''), {})
+
+
+class TestQueueListener(unittest.TestCase):
+
+    def setUp(self):
+        configure_logging()
+        if logging_config._listener is None:
+            self.skipTest('logging runs synchronously (LOG_ASYNC=False)')
+
+    def test_restart_gives_a_new_queue_and_thread(self):
+        old = logging_config._listener
+        restart_listener()
+        new = logging_config._listener
+        self.assertIsNot(new, old)
+        self.assertIs(logging_config._queue_handler.queue, new.queue)
+        self.assertIsNot(new.queue, old.queue)
+        self.assertEqual(new.handlers, old.handlers)
+        self.assertTrue(new._thread.is_alive())
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'needs fork()')
+    def test_forked_child_has_a_running_listener(self):
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child: report whether a listener thread runs and is fed by the root handler
+            listener = logging_config._listener
+            alive = listener._thread is not None and listener._thread.is_alive()
+            fed = logging_config._queue_handler.queue is listener.queue
+            os.write(write_end, b'1' if alive and fed else b'0')
+            os._exit(0)
+        os.close(write_end)
+        result = os.read(read_end, 1)
+        os.close(read_end)
+        os.waitpid(pid, 0)
+        self.assertEqual(result, b'1')
+
+
+if __name__ == '__main__':
+    unittest.main()
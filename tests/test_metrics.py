@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils import metrics
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+
+    def tearDown(self):
+        metrics.reset()
+
+    def test_disabled_metrics_record_nothing(self):
+        with mock.patch.object(metrics, 'ENABLED', False):
+            with metrics.timed('peaks'):
+                pass
+            metrics.record_cache('pageview', True)
+
+        self.assertNotIn('stage="peaks"', metrics.render_prometheus())
+        self.assertNotIn('cache="pageview"', metrics.render_prometheus())
+
+    def test_timed_decorator_and_cache_counter_render_as_prometheus_text(self):
+        @metrics.timed('ccf')
+        def work():
+            return 42
+
+        with mock.patch.object(metrics, 'ENABLED', True):
+            self.assertEqual(work(), 42)
+            self.assertEqual(work(), 42)
+            metrics.record_cache('pageview', True)
+            metrics.record_cache('pageview', False)
+
+        text = metrics.render_prometheus()
+        self.assertIn('wikitraffic_stage_duration_seconds_count{stage="ccf"} 2', text)
+        self.assertIn('wikitraffic_stage_duration_seconds_bucket{stage="ccf",le="+Inf"} 2', text)
+        self.assertIn('wikitraffic_cache_lookups_total{cache="pageview",result="hit"} 1', text)
+        self.assertIn('wikitraffic_cache_lookups_total{cache="pageview",result="miss"} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.model_store import ARIMAModelStore
+
+
+class StubModel:
+    order = (1, 1, 0)
+
+    def __init__(self, name):
+        self.name = name
+
+    def params(self):
+        return [0.1, 0.2]
+
+    def aic(self):
+        return 12.5
+
+
+class TestARIMAModelStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = ARIMAModelStore(self.directory, capacity=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _save(self, store, series, fingerprint='f1'):
+        store.save(series, StubModel(f"{series}:{fingerprint}"), fingerprint, pd.Timestamp('2024-01-31'), pd.Timedelta(days=1))
+
+    def test_save_and_get(self):
+        self._save(self.store, 'en_A')
+        entry = self.store.get('en_A', 'f1')
+
+        self.assertEqual(entry['model'].name, 'en_A:f1')
+        self.assertEqual(entry['order'], (1, 1, 0))
+        self.assertEqual(entry['last_date'], pd.Timestamp('2024-01-31'))
+        self.assertEqual(entry['step'], pd.Timedelta(days=1))
+        self.assertEqual(self.store.get_metadata('en_A')['params'], [0.1, 0.2])
+
+    def test_other_fingerprint_is_rejected(self):
+        self._save(self.store, 'en_A')
+        self.assertIsNone(self.store.get('en_A', 'f2'))
+        self.assertIsNone(ARIMAModelStore(self.directory).get('en_A', 'f2'))
+        self.assertIsNone(self.store.get('en_B'))
+
+    def test_least_recently_used_model_is_evicted(self):
+        for series in ('en_A', 'en_B', 'en_C'):
+            self._save(self.store, series)
+        self.assertEqual(self.store.stats()['hot'], 2)
+
+        # en_A was evicted from memory, so it comes back from disk
+        self.assertEqual(self.store.get('en_A', 'f1')['model'].name, 'en_A:f1')
+        self.assertEqual(self.store.stats()['loads'], 1)
+
+    def test_models_are_loaded_from_disk_on_first_use(self):
+        self._save(self.store, 'en_A')
+        store = ARIMAModelStore(self.directory)
+        self.assertEqual(store.stats(), {'hits': 0, 'misses': 0, 'loads': 0, 'hot': 0})
+
+        store.get('en_A', 'f1')
+        store.get('en_A', 'f1')
+        self.assertEqual(store.stats(), {'hits': 2, 'misses': 0, 'loads': 1, 'hot': 1})
+
+    def test_resave_replaces_the_model_file(self):
+        self._save(self.store, 'en_A', 'f1')
+        self._save(self.store, 'en_A', 'f2')
+
+        self.assertEqual(len([f for f in os.listdir(self.directory) if f.endswith('.joblib')]), 1)
+        self.assertEqual(ARIMAModelStore(self.directory).get('en_A', 'f2')['fingerprint'], 'f2')
+
+    def test_interrupted_save_keeps_the_previous_pair(self):
+        self._save(self.store, 'en_A', 'f1')
+        replace = os.replace
+
+        def crash_on_sidecar(source, target):
+            if target.endswith('.json'):
+                raise OSError('crashed')
+            replace(source, target)
+
+        # Crash after the new model file is in place but before the sidecar is replaced
+        with patch('utils.model_store.os.replace', side_effect=crash_on_sidecar):
+            with self.assertRaises(OSError):
+                self._save(self.store, 'en_A', 'f2')
+
+        entry = ARIMAModelStore(self.directory).get('en_A')
+        self.assertEqual(entry['fingerprint'], 'f1')
+        self.assertEqual(entry['model'].name, 'en_A:f1')
+
+    def test_invalid_sidecar_is_a_miss(self):
+        self._save(self.store, 'en_A', 'f1')
+        model_file = self.store.get_metadata('en_A')['model_file']
+
+        os.remove(os.path.join(self.directory, model_file))
+        self.assertIsNone(ARIMAModelStore(self.directory).get('en_A', 'f1'))
+        with open(self.store._meta_path('en_A'), 'w', encoding='utf-8') as file:
+            file.write('{"series": ')
+        self.assertIsNone(self.store.get_metadata('en_A'))
+
+    def test_clear(self):
+        self._save(self.store, 'en_A')
+        self.store.clear()
+        self.assertEqual(os.listdir(self.directory), [])
+        self.assertIsNone(self.store.get('en_A'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import sys
+import time
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils import profiling
+from utils.profiling import init_request_profiling, apply_retention
+
+
+class TestRequestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patches = [patch.object(profiling, 'PROFILE_DIR', self.tmp_dir.name),
+                        patch.dict(os.environ, {'PROFILE_ADMIN_TOKEN': 'secret'})]
+        for p in self.patches:
+            p.start()
+
+        self.app = Flask(__name__)
+        self.app.testing = True
+        init_request_profiling(self.app)
+
+        @self.app.route('/ok')
+        def ok():
+            return 'ok'
+
+        @self.app.route('/boom')
+        def boom():
+            raise RuntimeError('boom')
+
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        sys.setprofile(None)
+        for p in self.patches:
+            p.stop()
+        self.tmp_dir.cleanup()
+
+    def _profiles(self):
+        return sorted(f for f in os.listdir(self.tmp_dir.name) if f.endswith('.prof'))
+
+    def test_requests_without_the_token_are_not_profiled(self):
+        for headers, query in (({}, ''), ({'X-Profile': 'wrong'}, ''), ({}, '?profile=wrong')):
+            response = self.client.get(f'/ok{query}', headers=headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('X-Profile-Path', response.headers)
+        self.assertEqual(self._profiles(), [])
+
+    def test_no_configured_token_disables_profiling(self):
+        with patch.dict(os.environ, {'PROFILE_ADMIN_TOKEN': ''}):
+            response = self.client.get('/ok?profile=', headers={'X-Profile': ''})
+        self.assertNotIn('X-Profile-Path', response.headers)
+        self.assertEqual(self._profiles(), [])
+
+    def test_token_in_header_or_query_profiles_the_request(self):
+        by_header = self.client.get('/ok', headers={'X-Profile': 'secret'})
+        by_query = self.client.get('/ok?profile=secret')
+        for response in (by_header, by_query):
+            path = response.headers['X-Profile-Path']
+            self.assertTrue(os.path.exists(path))
+            self.assertTrue(os.path.exists(path[:-len('.prof')] + '.txt'))
+        self.assertEqual(len(self._profiles()), 2)
+        self.assertIsNone(sys.getprofile())
+
+    def test_failed_request_disables_the_profiler(self):
+        with self.assertRaises(RuntimeError):
+            self.client.get('/boom', headers={'X-Profile': 'secret'})
+        self.assertIsNone(sys.getprofile())
+        profiles = self._profiles()
+        self.assertEqual(len(profiles), 1)
+        self.assertTrue(profiles[0].endswith('-failed.prof'))
+
+    def test_teardown_outside_the_app_context_is_ignored(self):
+        # Streamed responses may run the request teardown after the app context was popped
+        stop_profile = self.app.teardown_request_funcs[None][-1]
+        stop_profile(None)
+        self.assertEqual(self._profiles(), [])
+
+
+class TestProfileRetention(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.patch = patch.object(profiling, 'PROFILE_DIR', self.tmp_dir.name)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, age_days=0):
+        for extension in ('prof', 'txt'):
+            path = os.path.join(self.tmp_dir.name, f'{name}.{extension}')
+            with open(path, 'w') as file:
+                file.write('x')
+            mtime = time.time() - age_days * 86400
+            os.utime(path, (mtime, mtime))
+
+    def test_oldest_profiles_beyond_the_count_are_removed(self):
+        for day in range(1, 6):
+            self._write(f'2024010{day}T000000000000-run')
+        apply_retention(max_files=2, max_age_days=7)
+        self.assertEqual(sorted(os.listdir(self.tmp_dir.name)), [
+            '20240104T000000000000-run.prof', '20240104T000000000000-run.txt',
+            '20240105T000000000000-run.prof', '20240105T000000000000-run.txt'])
+
+    def test_profiles_past_the_age_limit_are_removed(self):
+        self._write('20240101T000000000000-old', age_days=10)
+        self._write('20240102T000000000000-new', age_days=1)
+        apply_retention(max_files=50, max_age_days=7)
+        self.assertEqual(sorted(os.listdir(self.tmp_dir.name)), [
+            '20240102T000000000000-new.prof', '20240102T000000000000-new.txt'])
+
+    def test_missing_directory_is_ignored(self):
+        with patch.object(profiling, 'PROFILE_DIR', os.path.join(self.tmp_dir.name, 'missing')):
+            apply_retention()
+
+
+if __name__ == '__main__':
+    unittest.main()
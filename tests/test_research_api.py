@@ -0,0 +1,69 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from services.research_cache_service import ResearchCacheService
+from services.research_service import ResearchService
+
+
+class TestResearchApi(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [
+            {'subject': 'Flood', 'series': 'en_Flood'},
+            {'subject': 'Flood', 'series': 'ar_Flood'},
+            {'subject': 'Flood', 'series': ['en_Flood', 'he_Flood']},
+            {'subject': 'Storm', 'series': 'en_Storm'},
+        ]
+        self.static_folder = tempfile.mkdtemp()
+        ResearchCacheService.clear()
+
+    def tearDown(self):
+        ResearchCacheService.clear()
+        shutil.rmtree(self.static_folder, ignore_errors=True)
+
+    def test_paginate_pages_items(self):
+        result = ResearchService.paginate(self.items, page=2, per_page=3)
+        self.assertEqual(result['items'], self.items[3:])
+        self.assertEqual((result['page'], result['per_page'], result['total'], result['pages']), (2, 3, 4, 2))
+
+    def test_paginate_selects_series_and_pairs(self):
+        result = ResearchService.paginate(self.items, series=['en_Flood'])
+        self.assertEqual(result['items'], [self.items[0], self.items[2]])
+        self.assertEqual(ResearchService.paginate(self.items, series=['xx_None'])['pages'], 0)
+
+    def test_unknown_section_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ResearchService().get_section('heatmap', None)
+
+    def test_sections_are_computed_once_per_version(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return self.items
+
+        cache = ResearchCacheService()
+        first = cache.get_or_compute('peaks', self.static_folder, compute)
+        second = cache.get_or_compute('peaks', self.static_folder, compute)
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 1)
+
+        # A new figure changes the version, so the section is computed again
+        os.makedirs(os.path.join(self.static_folder, 'peaks_figures'))
+        with open(os.path.join(self.static_folder, 'peaks_figures', 'en_Flood.png'), 'wb') as file:
+            file.write(b'png')
+        third = cache.get_or_compute('peaks', self.static_folder, compute)
+        self.assertNotEqual(third[0], first[0])
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from flask import Flask
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.database import db, init_db
+from services.rollup_service import rollup_series, TrafficRollupService
+from services.wiki_traffic_service import WikiTrafficService, TRAFFIC_VERSION
+from repositories.data_version_repository import DataVersionRepository
+from repositories.wiki_traffic_repository import WikiTrafficRepository
+
+START = date(2024, 1, 1)
+
+
+class TestRollupSeries(unittest.TestCase):
+
+    def setUp(self):
+        # Wednesday 2024-01-31 to Tuesday 2024-02-06, with one missing day
+        index = pd.date_range('2024-01-31', periods=7, freq='D')
+        self.series = pd.Series([1, 2, np.nan, 4, 5, 6, 7], index=index, dtype=float)
+
+    def test_weekly_buckets_start_on_monday(self):
+        weekly = rollup_series(self.series, 'week')
+
+        self.assertEqual([d.strftime('%Y-%m-%d') for d in weekly.index], ['2024-01-29', '2024-02-05'])
+        self.assertEqual(list(weekly['total']), [12.0, 13.0])
+        self.assertEqual(list(weekly['days']), [4, 2])
+        self.assertEqual(list(weekly['max']), [5.0, 7.0])
+
+    def test_monthly_buckets(self):
+        monthly = rollup_series(self.series, 'month')
+
+        self.assertEqual([d.strftime('%Y-%m-%d') for d in monthly.index], ['2024-01-01', '2024-02-01'])
+        self.assertEqual(list(monthly['total']), [1.0, 24.0])
+        self.assertEqual(list(monthly['days']), [1, 5])
+
+    def test_empty_series(self):
+        self.assertTrue(rollup_series(pd.Series(dtype=float), 'month').empty)
+
+
+class TestIngestRollupSpan(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        init_db(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _ingest(self, values):
+        """Run the daily ingest on a fetched frame of en_A values from START; returns the rollup update spans."""
+        fetched = pd.DataFrame({'date': [START + timedelta(days=i) for i in range(len(values))],
+                                'en_A': np.asarray(values, dtype=float)})
+        with patch.object(WikiTrafficService, 'get_traffic_data', return_value=fetched), \
+                patch.object(WikiTrafficService, 'save_to_csv'), \
+                patch.object(TrafficRollupService, 'update', autospec=True, side_effect=TrafficRollupService.update) as update, \
+                patch('services.wiki_traffic_service.snapshot_enabled', return_value=False), \
+                patch('services.wiki_traffic_service.SpikeDetectionService'):
+            WikiTrafficService().create_and_populate_wiki_traffic()
+        return [(call.args[2], call.args[3]) for call in update.call_args_list]
+
+    def test_only_new_and_revised_days_are_rolled_up(self):
+        history = [float(i) for i in range(40)]
+        self.assertEqual(self._ingest(history), [(START, START + timedelta(days=39))])
+
+        # The next fetch returns the whole history again, with one revision and five new days
+        revised = history + [100.0] * 5
+        revised[35] = 500.0
+        self.assertEqual(self._ingest(revised), [(START + timedelta(days=35), START + timedelta(days=44))])
+
+        february = TrafficRollupService().rollup_repo.get_rollups(['en_A'], 'month', date(2024, 2, 1), date(2024, 2, 1))[0]
+        self.assertEqual(february.total, sum(revised[31:45]))
+        self.assertEqual(february.days, 14)
+        self.assertEqual(TrafficRollupService().rollup_repo.get_total('en_A').total, sum(revised))
+
+    def test_unchanged_fetch_keeps_the_version(self):
+        self._ingest([1.0, np.nan, 3.0])
+        token = DataVersionRepository.get_token(TRAFFIC_VERSION)
+        self.assertIsNotNone(token)
+
+        self.assertEqual(self._ingest([1.0, np.nan, 3.0]), [])
+        self.assertEqual(DataVersionRepository.get_token(TRAFFIC_VERSION), token)
+
+    def _store_history(self, values):
+        """Write traffic rows directly, as they were stored before rollups existed."""
+        repo = WikiTrafficRepository()
+        repo.create_table(['en_A'])
+        for i, value in enumerate(values):
+            repo.insert_or_update(START + timedelta(days=i), {'en_A': value})
+        repo.commit()
+
+    def test_backfill_rolls_up_the_stored_history(self):
+        history = [float(i) for i in range(40)]
+        self._store_history(history)
+        service = TrafficRollupService()
+        self.assertIsNone(service.get_summary('en_A'))
+
+        self.assertEqual(service.backfill(), ['en_A'])
+        self.assertEqual(service.get_summary('en_A')['total'], sum(history))
+        self.assertEqual(service.get_summary('en_A')['days'], 40)
+        self.assertEqual([r['total'] for r in service.get_rollups(['en_A'])], [sum(history[:31]), sum(history[31:])])
+        self.assertEqual(service.backfill(), [])
+
+    def test_first_ingest_over_stored_history_rolls_up_all_of_it(self):
+        history = [float(i) for i in range(40)]
+        self._store_history(history)
+
+        # Only the new days are changed rows, but the series had no rollups yet
+        self.assertEqual(self._ingest(history + [100.0] * 5), [(START + timedelta(days=40), START + timedelta(days=44))])
+        summary = TrafficRollupService().get_summary('en_A')
+        self.assertEqual(summary['total'], sum(history) + 500.0)
+        self.assertEqual(summary['days'], 45)
+
+
+if __name__ == '__main__':
+    unittest.main()
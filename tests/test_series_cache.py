@@ -0,0 +1,76 @@
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from flask import Flask
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.database import db, init_db
+from repositories.wiki_traffic_repository import WikiTrafficRepository
+from repositories.data_version_repository import DataVersionRepository
+from services.wiki_traffic_service import WikiTrafficService, TRAFFIC_VERSION
+
+START = date(2024, 1, 1)
+
+
+class TestSeriesCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        init_db(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.repo = WikiTrafficRepository()
+        self.repo.create_table(['en_A'])
+        for i in range(5):
+            self.repo.insert_or_update(START + timedelta(days=i), {'en_A': float(i)})
+        DataVersionRepository.bump(TRAFFIC_VERSION)
+        self.repo.commit()
+        WikiTrafficService.clear_series_cache()
+
+    def tearDown(self):
+        WikiTrafficService.clear_series_cache()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _write_elsewhere(self, day, value):
+        """Change a stored value the way an ingest in another worker would: rows and token, no cache clear."""
+        self.repo.insert_or_update(START + timedelta(days=day), {'en_A': value})
+        DataVersionRepository.bump(TRAFFIC_VERSION)
+        self.repo.commit()
+
+    def test_repeated_reads_hit_the_cache(self):
+        service = WikiTrafficService()
+        with patch.object(service.wiki_traffic_repo, 'get_series', wraps=service.wiki_traffic_repo.get_series) as read:
+            first = service.get_series('en_A')
+            second = service.get_series('en_A')
+        self.assertEqual(read.call_count, 1)
+        self.assertTrue(first.equals(second))
+
+    def test_new_version_invalidates_entries(self):
+        service = WikiTrafficService()
+        self.assertEqual(service.get_series('en_A')['en_A'].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+        self._write_elsewhere(2, 20.0)
+        self.assertEqual(service.get_series('en_A')['en_A'].tolist(), [0.0, 1.0, 20.0, 3.0, 4.0])
+
+    def test_entries_are_kept_until_the_version_changes(self):
+        service = WikiTrafficService()
+        service.get_series('en_A')
+        # Written without a version bump, so the cached series is still served
+        self.repo.insert_or_update(START, {'en_A': 100.0})
+        self.repo.commit()
+        self.assertEqual(service.get_series('en_A')['en_A'].iloc[0], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.series_payload import delta_encode, delta_decode, encode_series, typed_array
+from services.peaks_service import PeaksService
+
+
+class TestSeriesPayload(unittest.TestCase):
+
+    def test_delta_encoding_round_trips(self):
+        values = [120, 118, 5000, 0, 7]
+        self.assertEqual(delta_encode(values), [120, -2, 4882, -5000, 7])
+        self.assertEqual(delta_decode(delta_encode(values)), values)
+        self.assertEqual(delta_encode([]), [])
+
+    def test_payload_encoding_and_overlays(self):
+        forecast = [{'date': '2024-01-04T00:00:00', 'mean': 10.12345, 'lower': 8.0, 'upper': 12.0}]
+        payload = encode_series('en_A', date(2024, 1, 1), np.array([3.0, 5.0, 4.0]), peaks=[1], forecast=forecast)
+
+        self.assertEqual(payload['encoding'], 'delta')
+        self.assertEqual(payload['values'], [3, 2, -1])
+        self.assertEqual((payload['start'], payload['length'], payload['peaks']), ('2024-01-01', 3, [1]))
+        self.assertEqual(payload['forecast'], {'start': '2024-01-04', 'mean': [10.123], 'lower': [8.0], 'upper': [12.0]})
+
+        plain = encode_series('en_A', date(2024, 1, 1), np.array([0.5, 1.25]))
+        self.assertEqual((plain['encoding'], plain['values']), ('plain', [0.5, 1.25]))
+        self.assertNotIn('peaks', plain)
+
+    def test_typed_array_matches_dtype(self):
+        data, dtype = typed_array(np.array([1.0, 2.0]))
+        self.assertEqual(dtype, 'uint32')
+        self.assertEqual(np.frombuffer(data, dtype='<u4').tolist(), [1, 2])
+
+        data, dtype = typed_array(np.array([1.5, -2.0]))
+        self.assertEqual(dtype, 'float32')
+        self.assertEqual(np.frombuffer(data, dtype='<f4').tolist(), [1.5, -2.0])
+
+    def test_series_peaks_finds_spikes_without_plotting(self):
+        values = np.full(60, 10.0)
+        values[[15, 40]] = [500.0, 300.0]
+        series = pd.Series(values, index=pd.date_range('2024-01-01', periods=60))
+
+        peaks = PeaksService().series_peaks(series, 5)
+        self.assertIn(15, peaks)
+        self.assertIn(40, peaks)
+        self.assertEqual(PeaksService().series_peaks(pd.Series(np.ones(10)), 5), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
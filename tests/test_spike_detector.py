@@ -0,0 +1,95 @@
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+from flask import Flask
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.database import db, init_db
+from models.spike import SpikeState, SpikeEvent
+from services.spike_service import EwmaSpikeDetector, SpikeDetectionService
+
+START = date(2024, 1, 1)
+
+
+class TestEwmaSpikeDetector(unittest.TestCase):
+
+    def setUp(self):
+        self.detector = EwmaSpikeDetector(alpha=0.2, threshold=3.0, warmup=5, min_views=10)
+        self.state = SimpleNamespace(count=0, mean=0.0, var=0.0)
+
+    def _feed(self, values):
+        return [self.detector.update(self.state, value)[2] for value in values]
+
+    def test_flags_a_jump_after_warmup(self):
+        flags = self._feed([100, 104, 98, 101, 99, 103, 97, 100, 1000])
+        self.assertEqual(flags, [False] * 8 + [True])
+
+    def test_no_spike_during_warmup_or_below_min_views(self):
+        self.assertEqual(self._feed([100, 102, 5000]), [False, False, False])
+
+        quiet = SimpleNamespace(count=0, mean=0.0, var=0.0)
+        flags = [self.detector.update(quiet, value)[2] for value in [1, 2, 1, 2, 1, 2, 1, 9]]
+        self.assertFalse(any(flags))
+
+    def test_state_stays_constant_size(self):
+        self._feed(range(1000))
+        self.assertEqual(vars(self.state).keys(), {'count', 'mean', 'var'})
+        self.assertEqual(self.state.count, 1000)
+
+
+class TestSpikeDetectionService(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        init_db(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.values = [100, 104, 98, 101, 99, 103, 97, 100] * 2 + [102, 1000, 101, 99, 103, 98, 2000, 100]
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _frame(self, days):
+        return pd.DataFrame({'date': [START + timedelta(days=i) for i in range(days)], 'en_A': self.values[:days]})
+
+    def test_consecutive_ingests_resume_the_state(self):
+        first = SpikeDetectionService().consume(self._frame(20))
+        self.assertEqual([event.timestamp.date() for event in first], [START + timedelta(days=17)])
+
+        # The next ingest fetches the whole window again, plus the new days
+        second = SpikeDetectionService().consume(self._frame(24))
+        self.assertEqual([event.timestamp.date() for event in second], [START + timedelta(days=22)])
+        self.assertEqual(SpikeEvent.query.count(), 2)
+
+        # Same state as feeding every point once, in a single pass
+        expected = SimpleNamespace(count=0, mean=0.0, var=0.0)
+        detector = SpikeDetectionService().detector
+        for value in self.values[:24]:
+            detector.update(expected, value)
+        state = SpikeState.query.get(('en_A', 'daily'))
+        self.assertEqual(state.count, 24)
+        self.assertAlmostEqual(state.mean, expected.mean)
+        self.assertAlmostEqual(state.var, expected.var)
+        self.assertEqual(state.last_timestamp.date(), START + timedelta(days=23))
+
+    def test_repeated_ingest_of_the_same_days_is_a_no_op(self):
+        SpikeDetectionService().consume(self._frame(20))
+        self.assertEqual(SpikeDetectionService().consume(self._frame(20)), [])
+        self.assertEqual(SpikeEvent.query.count(), 1)
+        self.assertEqual(SpikeState.query.get(('en_A', 'daily')).count, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
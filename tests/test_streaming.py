@@ -0,0 +1,76 @@
+import os
+import sys
+import gzip
+import tempfile
+import unittest
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.streaming import gzip_chunks, parse_range, ExportSpoolCache
+
+
+class TestStreamingHelpers(unittest.TestCase):
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range('bytes=0-9', 100), (0, 9))
+        self.assertEqual(parse_range('bytes=90-', 100), (90, 99))
+        self.assertEqual(parse_range('bytes=-10', 100), (90, 99))
+        self.assertEqual(parse_range('bytes=50-500', 100), (50, 99))
+        self.assertIsNone(parse_range('bytes=100-', 100))
+        self.assertIsNone(parse_range('bytes=0-1,5-6', 100))
+        self.assertIsNone(parse_range(None, 100))
+
+    def test_gzip_chunks_round_trip(self):
+        chunks = [b'date,en_A\n', b'2024-01-01,1\n', b'2024-01-02,2\n']
+        self.assertEqual(gzip.decompress(b''.join(gzip_chunks(chunks))), b''.join(chunks))
+
+
+class TestExportSpoolCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ExportSpoolCache(self.tmp_dir.name, max_files=2)
+        self.generated = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _factory(self, body):
+        def chunks():
+            self.generated.append(body)
+            return iter([body[:3], body[3:]])
+        return chunks
+
+    def _read(self, version, body):
+        file, total = self.cache.open(version, self._factory(body))
+        with file:
+            return file.read(), total
+
+    def test_each_version_is_generated_once(self):
+        self.assertEqual(self._read('v1', b'date,en_A\n'), (b'date,en_A\n', 10))
+        self.assertEqual(self._read('v1', b'date,en_A\n'), (b'date,en_A\n', 10))
+        self.assertEqual(self._read('v2', b'date,en_B\n'), (b'date,en_B\n', 10))
+        self.assertEqual(self.generated, [b'date,en_A\n', b'date,en_B\n'])
+
+    def test_least_recently_used_versions_are_removed(self):
+        for version in ('v1', 'v2', 'v3'):
+            self._read(version, version.encode('utf-8') * 4)
+        self._read('v1', b'v1v1v1v1')
+        self.assertEqual(len(self.generated), 4)
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+
+    def test_failed_generation_leaves_nothing_behind(self):
+        def failing():
+            yield b'partial'
+            raise RuntimeError('export failed')
+
+        with self.assertRaises(RuntimeError):
+            self.cache.open('v1', failing)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.traffic_matrix import TrafficMatrix
+
+
+class TestTrafficMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=5).date,
+            'en_Some event': [10.0, 20.0, 30.0, 40.0, 50.0],
+            'ar_Some event': [np.nan, np.nan, 3.0, 4.0, 5.0],
+        })
+
+    def test_counts_are_stored_as_uint32_with_start_offsets(self):
+        matrix = TrafficMatrix.from_frame(self.df)
+
+        self.assertEqual(matrix.values.dtype, np.uint32)
+        self.assertEqual(matrix.starts.tolist(), [0, 2])
+        self.assertEqual(matrix.stops.tolist(), [5, 5])
+        self.assertEqual(matrix.padded('ar_Some event').tolist(), [0, 0, 3, 4, 5])
+        self.assertEqual(matrix.catalogue.languages, ('en', 'ar'))
+        self.assertLess(matrix.nbytes, self.df.memory_usage(deep=True).sum() / 2)
+
+    def test_series_are_read_only_views(self):
+        matrix = TrafficMatrix.from_frame(self.df)
+        dates, values = matrix.series('ar_Some event')
+
+        self.assertTrue(np.shares_memory(values, matrix.values))
+        self.assertEqual(values.tolist(), [3, 4, 5])
+        self.assertEqual(str(dates[0]), '2024-01-03')
+        with self.assertRaises(ValueError):
+            values[0] = 1
+
+    def test_fractional_values_fall_back_to_float32_and_round_trip(self):
+        self.df.loc[1, 'en_Some event'] = 20.5
+        matrix = TrafficMatrix.from_frame(self.df)
+
+        self.assertEqual(matrix.values.dtype, np.float32)
+        pd.testing.assert_frame_equal(matrix.to_frame(), self.df)
+
+    def test_interior_gaps_are_recorded(self):
+        self.df.loc[3, 'ar_Some event'] = np.nan
+        matrix = TrafficMatrix.from_frame(self.df)
+
+        self.assertEqual(list(matrix.gaps), [1])
+        self.assertEqual(matrix.gaps[1].tolist(), [3])
+        self.assertEqual(matrix.padded('ar_Some event').tolist(), [0, 0, 3, 0, 5])
+        dates, values = matrix.series('ar_Some event')
+        self.assertEqual(values.tolist(), [3, 5])
+        self.assertEqual([str(d) for d in dates], ['2024-01-03', '2024-01-05'])
+        pd.testing.assert_frame_equal(matrix.to_frame(), self.df)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.traffic_merge import merge_traffic_frames
+
+
+def _frame(column, start, values):
+    index = pd.date_range(start, periods=len(values), freq='D', name='timestamp')
+    return pd.DataFrame({column: values}, index=index, dtype=float)
+
+
+class TestMergeTrafficFrames(unittest.TestCase):
+
+    def test_aligns_frames_on_a_shared_daily_index(self):
+        merged = merge_traffic_frames([
+            _frame('en_A', '2024-01-01', [1, 2, 3]),
+            _frame('ar_A', '2024-01-02', [10, 20, 30]),
+        ])
+
+        self.assertEqual(list(merged.columns), ['en_A', 'ar_A', 'date'])
+        self.assertEqual(len(merged), 4)
+        np.testing.assert_array_equal(merged['en_A'].to_numpy(), [1, 2, 3, np.nan])
+        np.testing.assert_array_equal(merged['ar_A'].to_numpy(), [np.nan, 10, 20, 30])
+        self.assertEqual(str(merged['date'].iloc[0]), '2024-01-01')
+
+    def test_colliding_keys_are_summed_without_suffix_columns(self):
+        merged = merge_traffic_frames([
+            _frame('en_A', '2024-01-01', [1, 2]),
+            _frame('en_A', '2024-01-02', [5, 5]),
+        ])
+
+        self.assertEqual(list(merged.columns), ['en_A', 'date'])
+        np.testing.assert_array_equal(merged['en_A'].to_numpy(), [1, 7, 5])
+
+    def test_collision_policies_first_and_error(self):
+        frames = [_frame('en_A', '2024-01-01', [1, 2]), _frame('en_A', '2024-01-02', [5, 5])]
+
+        merged = merge_traffic_frames(frames, on_collision='first')
+        np.testing.assert_array_equal(merged['en_A'].to_numpy(), [1, 2, 5])
+
+        with self.assertRaises(ValueError):
+            merge_traffic_frames(frames, on_collision='error')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import text
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+# The routes run against a private in-memory database, whatever DATABASE_URI is set to
+with patch.dict(os.environ, {'DATABASE_URI': 'sqlite://'}):
+    from app import app
+
+from utils.database import db
+from repositories.wiki_traffic_repository import WikiTrafficRepository
+from services.wiki_traffic_service import WikiTrafficService
+
+START = date(2024, 1, 1)
+DAYS = 25
+
+
+class TestTrafficPaging(unittest.TestCase):
+
+    def setUp(self):
+        self.context = app.app_context()
+        self.context.push()
+        self.repo = WikiTrafficRepository()
+        self.repo.create_table(['en_A', 'ar_A'])
+        for i in range(DAYS):
+            # ar_A has no count on odd days
+            self.repo.insert_or_update(START + timedelta(days=i), {'en_A': float(i), 'ar_A': None if i % 2 else float(i * 10)})
+        self.repo.commit()
+        self.client = app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.session.execute(text('DROP TABLE IF EXISTS "wikiTraffic"'))
+        db.session.commit()
+        self.context.pop()
+
+    def test_page_limit_and_offset_bounds(self):
+        self.assertEqual([row[0] for row in self.repo.get_page(['en_A'], limit=3, offset=0)],
+                         [START, START + timedelta(days=1), START + timedelta(days=2)])
+        self.assertEqual(len(self.repo.get_page(['en_A'], limit=10, offset=20)), 5)
+        self.assertEqual(self.repo.get_page(['en_A'], limit=10, offset=DAYS), [])
+        self.assertEqual(self.repo.count(), DAYS)
+        self.assertEqual(self.repo.count(START + timedelta(days=20), None), 5)
+        self.assertEqual(self.repo.count(START, START + timedelta(days=4)), 5)
+
+    def test_keyset_batches_cover_every_row_once(self):
+        for batch_size in (1, 5, 7, DAYS, 100):
+            rows = list(self.repo.iter_rows(['en_A'], batch_size=batch_size))
+            self.assertEqual([row[1] for row in rows], [float(i) for i in range(DAYS)], batch_size)
+
+        window = list(self.repo.iter_rows(['en_A'], START + timedelta(days=3), START + timedelta(days=12), batch_size=5))
+        self.assertEqual([row[1] for row in window], [float(i) for i in range(3, 13)])
+
+    def test_csv_stream_splits_on_batches(self):
+        chunks = list(WikiTrafficService().iter_traffic_csv(['en_A'], batch_size=10))
+        self.assertEqual(chunks[0].splitlines()[0], 'date,en_A')
+        lines = ''.join(chunks).splitlines()
+        self.assertEqual(len(lines), DAYS + 1)
+        self.assertEqual(lines[1], '2024-01-01,0.0')
+        self.assertEqual(lines[-1], '2024-01-25,24.0')
+        # Header plus ten rows, ten rows, then the last five
+        self.assertEqual([len(chunk.splitlines()) for chunk in chunks], [11, 10, 5])
+
+    def test_paging_api(self):
+        data = self.client.get('/api/wiki_traffic?columns=ar_A&page=3&per_page=10').get_json()
+        self.assertEqual(data['columns'], ['date', 'ar_A'])
+        self.assertEqual((data['page'], data['per_page'], data['total'], data['pages']), (3, 10, DAYS, 3))
+        self.assertEqual(data['rows'], [['2024-01-21', 200.0], ['2024-01-22', None], ['2024-01-23', 220.0],
+                                        ['2024-01-24', None], ['2024-01-25', 240.0]])
+
+        clamped = self.client.get('/api/wiki_traffic?page=0&per_page=5000').get_json()
+        self.assertEqual((clamped['page'], clamped['per_page'], len(clamped['rows'])), (1, 1000, DAYS))
+        self.assertEqual(self.client.get('/api/wiki_traffic?page=9').get_json()['rows'], [])
+
+        window = self.client.get('/api/wiki_traffic?columns=en_A&start=2024-01-10&end=2024-01-11').get_json()
+        self.assertEqual(window['rows'], [['2024-01-10', 9.0], ['2024-01-11', 10.0]])
+
+    def test_paging_api_rejects_invalid_parameters(self):
+        for query in ('columns=xx_Missing', 'start=2024-13-01', 'end=yesterday'):
+            response = self.client.get(f'/api/wiki_traffic?{query}')
+            self.assertEqual(response.status_code, 400, query)
+            self.assertIn('error', response.get_json())
+
+
+if __name__ == '__main__':
+    unittest.main()
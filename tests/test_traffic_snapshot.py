@@ -0,0 +1,55 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Ensure the parent directory is in sys.path
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from utils.traffic_snapshot import publish_snapshot, TrafficSnapshot
+
+
+class TestTrafficSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.df = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=4).date,
+            'en_A': [1.0, 2.0, 3.0, 4.0],
+            'ar_A': [np.nan, 20.0, 30.0, 40.0],
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_frame_round_trips_through_a_shared_read_only_mapping(self):
+        publish_snapshot(self.df, self.directory)
+        snapshot = TrafficSnapshot(self.directory)
+
+        frame = snapshot.frame()
+        pd.testing.assert_frame_equal(frame, self.df)
+        self.assertTrue(np.shares_memory(frame['en_A'].to_numpy(), snapshot.frame()['en_A'].to_numpy()))
+        with self.assertRaises(ValueError):
+            frame['en_A'].to_numpy()[0] = 5.0
+
+    def test_readers_pick_up_a_newly_published_snapshot(self):
+        snapshot = TrafficSnapshot(self.directory)
+        self.assertIsNone(snapshot.frame())
+
+        publish_snapshot(self.df, self.directory)
+        first = snapshot.version
+        snapshot.frame()
+        publish_snapshot(self.df.assign(en_A=self.df['en_A'] * 10), self.directory)
+
+        self.assertEqual(snapshot.frame()['en_A'].tolist(), [10.0, 20.0, 30.0, 40.0])
+        self.assertNotEqual(snapshot.version, first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from utils.traffic_matrix import TrafficMatrix
+
+
+class AnalysisInput:
+    """
+    Immutable traffic input shared by the peaks, auto-correlation, cross-correlation and ARIMA stages.
+
+    Wraps a TrafficMatrix with its datetime index parsed once, so no stage reparses dates,
+    mutates the caller's data or copies the whole matrix. series() gives a float64 copy of
+    one series' observed days; padded() a read-only view of its zero-filled row in the
+    matrix's storage dtype (possibly uint32, which wraps around), to be cast before any
+    arithmetic that can go negative.
+    """
+
+    ndim = 2
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.index = pd.DatetimeIndex(matrix.dates, name='date')
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build an input from a traffic frame with a 'date' column; the frame is not modified."""
+        return cls(TrafficMatrix.from_frame(df))
+
+    @classmethod
+    def coerce(cls, data):
+        """Return data unchanged if it already is an AnalysisInput, else build one from the frame."""
+        return data if isinstance(data, cls) else cls.from_frame(data)
+
+    @property
+    def columns(self):
+        return self.matrix.columns
+
+    @property
+    def empty(self):
+        return len(self.matrix) == 0 or len(self.index) == 0
+
+    @property
+    def shape(self):
+        """(days, series), for the frame metrics."""
+        return len(self.index), len(self.matrix)
+
+    def __contains__(self, name):
+        return name in self.matrix
+
+    def series(self, name):
+        """
+        The days of one series that have a count, like dropna() on its frame column.
+
+        Returns:
+        pd.Series: float64 values indexed by date, from the first to the last day with a
+        count, without the days in between that have none.
+        """
+        start, stop, keep = self.matrix.observed(name)
+        values = self.matrix.values[self.matrix.catalogue.id(name), start:stop].astype(np.float64)
+        index = self.index[start:stop]
+        if keep is not None:
+            values, index = values[keep], index[keep]
+        return pd.Series(values, index=index, name=name, copy=False)
+
+    def padded(self, name):
+        """
+        One series over the whole shared index, zero on every day without a count.
+
+        Returns:
+        pd.Series: Read-only view indexed by date, in the matrix's storage dtype.
+        """
+        return pd.Series(self.matrix.padded(name), index=self.index, name=name, copy=False)
+
+    def to_frame(self):
+        """
+        Materialize the date-indexed float64 frame, NaN outside each series' span, for vectorized stages.
+
+        Returns:
+        pd.DataFrame: A new frame indexed by date with one column per series.
+        """
+        return self.matrix.to_frame().drop(columns=['date']).set_index(self.index)
@@ -1,17 +1,278 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
 import pandas as pd
 import requests
 
+from utils.metrics import timed, record_cache
+
+BASE_URL = "https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article"
+HEADERS = {'User-Agent': 'CoolBot/0.0 (https://example.org/coolbot/; coolbot@example.org)'}
+
+# Days that must pass after a chunk ends before its counts are treated as final.
+CACHE_SETTLE_DAYS = 2
+
+# Pandas frequency of each supported API granularity.
+GRANULARITY_FREQ = {'daily': 'd', 'hourly': 'h'}
+
+
+class PageviewCache:
+    """
+    Persistent LRU cache for pageview API responses.
+
+    Entries are keyed by (project, article, granularity, start, end) and stored
+    zlib-compressed in a small SQLite file. Only fully past date ranges are ever
+    written, since their counts no longer change.
+    """
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024):
+        """
+        Parameters:
+        path (str): Location of the SQLite cache file.
+        max_bytes (int): Size cap for the stored payloads; least recently used entries are evicted beyond it.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " project TEXT, article TEXT, granularity TEXT, start TEXT, end TEXT,"
+                " payload BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL,"
+                " PRIMARY KEY (project, article, granularity, start, end))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_last_access ON responses (last_access)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key):
+        """
+        Return the cached items for a key, or None on a miss.
+
+        Parameters:
+        key (tuple): (project, article, granularity, start, end).
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM responses WHERE project=? AND article=? AND granularity=? AND start=? AND end=?",
+                key
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE responses SET last_access=? WHERE project=? AND article=? AND granularity=? AND start=? AND end=?",
+                    (time.time(), *key)
+                )
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key, items):
+        """
+        Store the items for a key and evict old entries if the size cap is exceeded.
+
+        Parameters:
+        key (tuple): (project, article, granularity, start, end).
+        items (list): The raw "items" list returned by the API.
+        """
+        payload = zlib.compress(json.dumps(items).encode('utf-8'))
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, payload, len(payload), time.time())
+            )
+            self._evict(conn)
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT rowid, size FROM responses ORDER BY last_access ASC").fetchall()
+        to_delete = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            to_delete.append((rowid,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE rowid=?", to_delete)
+
+    def clear(self):
+        """Remove every cached entry and reset the statistics."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Return hit-rate and size statistics for the cache.
+
+        Returns:
+        dict: hits, misses, hit_rate, entries, size_bytes and max_bytes.
+        """
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': entries,
+                'size_bytes': size,
+                'max_bytes': self.max_bytes,
+            }
+
 
-def get_wikipedia_traffic_data(language, endpoint_page_title, start_date, end_date,page_title):
-    base_url = "https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article"
-    headers = {'User-Agent': 'CoolBot/0.0 (https://example.org/coolbot/; coolbot@example.org)'}
+_default_cache = None
+_default_cache_lock = threading.Lock()
 
-    api_url = f"{base_url}/{language}.wikipedia/all-access/all-agents/{endpoint_page_title}/daily/{start_date}/{end_date}"
 
-    response = requests.get(api_url, headers=headers)
+def get_pageview_cache():
+    """
+    Return the process-wide pageview cache, or None when caching is disabled.
+
+    Configured through PAGEVIEW_CACHE_ENABLED, PAGEVIEW_CACHE_PATH and PAGEVIEW_CACHE_MAX_BYTES.
+    """
+    global _default_cache
+    if os.environ.get('PAGEVIEW_CACHE_ENABLED', 'True').lower() != 'true':
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = PageviewCache(
+                os.environ.get('PAGEVIEW_CACHE_PATH', 'instance/pageview_cache.db'),
+                int(os.environ.get('PAGEVIEW_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+            )
+        return _default_cache
+
+
+def split_date_range(start_date, end_date, today=None):
+    """
+    Split an inclusive date range into calendar-month chunks.
+
+    Parameters:
+    start_date (date): First day of the range.
+    end_date (date): Last day of the range.
+    today (date): Reference day used to decide which chunks are final.
+
+    Returns:
+    list: (chunk_start, chunk_end, is_final) tuples, oldest first.
+    """
+    today = today or datetime.now().date()
+    settled = today - timedelta(days=CACHE_SETTLE_DAYS)
+    chunks = []
+    chunk_start = start_date
+    while chunk_start <= end_date:
+        next_month = (chunk_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        chunk_end = min(next_month - timedelta(days=1), end_date)
+        chunks.append((chunk_start, chunk_end, chunk_end <= settled))
+        chunk_start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def _fetch_items(project, article, granularity, start, end):
+    api_url = f"{BASE_URL}/{project}/all-access/all-agents/{article}/{granularity}/{start}/{end}"
+    response = requests.get(api_url, headers=HEADERS)
+    # The API answers 404 for ranges that hold no data, e.g. before the article existed
+    if response.status_code == 404:
+        return None
     response.raise_for_status()
+    return response.json()["items"]
+
+
+def _fetch_span(chunks, cache):
+    """
+    Fetch consecutive uncached month chunks with one request and cache the final ones.
+
+    Parameters:
+    chunks (list): (key, is_final) pairs of adjacent chunks, oldest first.
+    cache (PageviewCache): Cache for the final chunks, or None.
+
+    Returns:
+    list: The items of the whole span.
+    """
+    project, article, granularity, start, _ = chunks[0][0]
+    items = _fetch_items(project, article, granularity, start, chunks[-1][0][4])
+    if items is None:
+        # Not cached: a 404 may only mean the API has not caught up with the span yet
+        return []
+    if cache is not None:
+        for key, is_final in chunks:
+            if is_final:
+                cache.put(key, [item for item in items if key[3][:8] <= item['timestamp'][:8] <= key[4][:8]])
+    return items
+
+
+@timed('api_fetch')
+def fetch_pageview_items(language, endpoint_page_title, start_date, end_date, granularity='daily', cache=None):
+    """
+    Fetch raw pageview items, serving fully past month chunks from the response cache.
+
+    Each run of consecutive chunks missing from the cache is fetched with a single
+    request, whose items are then split into the month chunks that get cached.
+
+    Parameters:
+    language (str): Wikipedia language code.
+    endpoint_page_title (str): Article title as used in the API path.
+    start_date (str): First day, formatted YYYYMMDD.
+    end_date (str): Last day, formatted YYYYMMDD.
+    granularity (str): API granularity, 'daily' or 'hourly'.
+    cache (PageviewCache): Cache to use; None disables caching for this call.
+
+    Returns:
+    list: The items of every chunk, oldest first.
+    """
+    if granularity not in GRANULARITY_FREQ:
+        raise ValueError(f"Unsupported granularity '{granularity}'")
+
+    project = f"{language}.wikipedia"
+    # Hourly ranges address whole days, from hour 00 of the first to hour 23 of the last
+    start_hour, end_hour = ('00', '23') if granularity == 'hourly' else ('', '')
+    start = datetime.strptime(start_date[:8], '%Y%m%d').date()
+    end = datetime.strptime(end_date[:8], '%Y%m%d').date()
+
+    items = []
+    uncached = []
+    for chunk_start, chunk_end, is_final in split_date_range(start, end):
+        key = (project, endpoint_page_title, granularity,
+               chunk_start.strftime('%Y%m%d') + start_hour, chunk_end.strftime('%Y%m%d') + end_hour)
+        chunk_items = cache.get(key) if cache is not None and is_final else None
+        if cache is not None and is_final:
+            record_cache('pageview', chunk_items is not None)
+        if chunk_items is None:
+            uncached.append((key, is_final))
+            continue
+        if uncached:
+            items.extend(_fetch_span(uncached, cache))
+            uncached = []
+        items.extend(chunk_items)
+    if uncached:
+        items.extend(_fetch_span(uncached, cache))
+    return items
+
+
+def get_wikipedia_traffic_data(language, endpoint_page_title, start_date, end_date, page_title, use_cache=True, granularity='daily'):
+    cache = get_pageview_cache() if use_cache else None
+    response_data = fetch_pageview_items(language, endpoint_page_title, start_date, end_date, granularity=granularity, cache=cache)
+    if not response_data:
+        raise ValueError(f"No pageview data returned for {language}:{endpoint_page_title}")
 
-    response_data = response.json()["items"]
     df = pd.DataFrame(response_data)
 
     df = df.drop(columns=["project", "article", "granularity", "access", "agent"])
@@ -21,4 +282,4 @@ def get_wikipedia_traffic_data(language, endpoint_page_title, start_date, end_da
     df = df.drop_duplicates(subset=['timestamp'], keep='first')
     df.set_index('timestamp', inplace=True)
 
-    return df.asfreq('d')
+    return df.asfreq(GRANULARITY_FREQ[granularity])
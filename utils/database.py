@@ -1,36 +1,103 @@
 import os
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import inspect, text
+from sqlalchemy import event, inspect, text
+from sqlalchemy.pool import QueuePool
 
 db = SQLAlchemy()
 
-import logging
-import colorlog
+from utils.logging_config import get_logger
 
-# Initialize logging with colorlog
-log_colors = {
-    'DEBUG': 'cyan',
-    'INFO': 'green',
-    'WARNING': 'yellow',
-    'ERROR': 'red',
-    'CRITICAL': 'bold_red',
-}
+logger = get_logger(__name__)
 
-formatter = colorlog.ColoredFormatter(
-    "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)",
-    log_colors=log_colors
-)
 
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
+# Pragmas applied to every new SQLite connection when SQLITE_TUNING is on
+def sqlite_pragmas():
+    return {
+        'journal_mode': 'WAL',  # readers no longer block on the ingest writer
+        'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),  # durable in WAL mode, far fewer fsyncs than FULL
+        'cache_size': -int(os.environ.get('SQLITE_CACHE_KB', 65536)),  # negative values are KiB
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_BYTES', 256 * 1024 * 1024)),
+        'temp_store': 'MEMORY',
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+    }
+
+
+def _apply_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in sqlite_pragmas().items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def engine_options(uri, sqlite_tuning=False):
+    """
+    Build the pool settings for the configured database (DB_POOL_SIZE, DB_MAX_OVERFLOW).
+
+    SQLite files only get a pool with SQLITE_TUNING: a QueuePool instead of the NullPool
+    default, so the per-connection pragmas are paid once per pooled connection rather
+    than once per session. In-memory SQLite keeps Flask-SQLAlchemy's own setup.
+    """
+    if uri.startswith('sqlite'):
+        if not sqlite_tuning or uri in ('sqlite://', 'sqlite:///:memory:'):
+            return {}
+        options = {'poolclass': QueuePool, 'connect_args': {'check_same_thread': False}}
+    else:
+        options = {'pool_pre_ping': True, 'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 3600))}
+    options.update(pool_size=int(os.environ.get('DB_POOL_SIZE', 5)),
+                   max_overflow=int(os.environ.get('DB_MAX_OVERFLOW', 10)))
+    return options
+
+
+def sqlite_tuning_enabled(app):
+    return (os.environ.get('SQLITE_TUNING', 'False').lower() == 'true'
+            and app.config.get('SQLALCHEMY_DATABASE_URI', '').startswith('sqlite'))
+
+
+def ensure_indexes(app):
+    """Create the model indexes on tables that already existed before the indexes were declared."""
+    # Register the indexed lookup tables even when no service has imported them yet
+    from models import event, wikipedia_page  # noqa: F401
+
+    with app.app_context():
+        try:
+            existing_tables = set(inspect(db.engine).get_table_names())
+            for table in db.metadata.sorted_tables:
+                if table.name in existing_tables:
+                    for index in table.indexes:
+                        index.create(db.engine, checkfirst=True)
+        except Exception as e:
+            logger.warning(f"Could not ensure database indexes: {e}")
+
+
+def ensure_model_tables(app):
+    """Create the tables ingest and the API routes rely on, on databases that predate them."""
+    from models.data_version import DataVersion
+    from models.spike import SpikeState, SpikeEvent
+    from models.hourly_traffic import HourlyTrafficChunk
+    from models.traffic_rollup import TrafficRollup
+
+    with app.app_context():
+        for model in (DataVersion, SpikeState, SpikeEvent, HourlyTrafficChunk, TrafficRollup):
+            try:
+                model.__table__.create(db.engine, checkfirst=True)
+            except Exception as e:
+                logger.warning(f"Could not ensure table {model.__tablename__}: {e}")
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set the logging level
-logger.addHandler(handler)
-logger.propagate = False  # Disable propagation to avoid duplicate log messages
 
 def init_db(app):
+    tuned = sqlite_tuning_enabled(app)
+    options = engine_options(app.config['SQLALCHEMY_DATABASE_URI'], tuned)
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
     db.init_app(app)
+    if tuned:
+        with app.app_context():
+            event.listen(db.engine, 'connect', _apply_pragmas)
+            journal_mode = db.session.execute(text("PRAGMA journal_mode")).scalar()
+            db.session.remove()
+        logger.info(f"SQLite tuning enabled (journal_mode={journal_mode}).")
+    ensure_indexes(app)
+    ensure_model_tables(app)
 
 def create_tables(app):
     with app.app_context():
@@ -39,8 +106,9 @@ def create_tables(app):
 
         # Create all tables
         db.create_all()
-        logger.info("Created tables: events, wikipediaPages, wikiTraffic")
-        tables_to_clear = ['events', 'wikipediaPages', 'wikiTraffic']
+        tables_to_clear = ['events', 'wikipediaPages', 'wikiTraffic', 'wikiTrafficHourly', 'trafficRollups',
+                           'spikeStates', 'spikeEvents', 'dataVersions']
+        logger.info(f"Created tables: {', '.join(tables_to_clear)}")
         for table in tables_to_clear:
             if table in existing_tables:
                 logger.info(f"Clearing table: {table}")
@@ -49,7 +117,7 @@ def create_tables(app):
                 logger.info(f"Table {table} does not exist, skipping.")
 
         db.session.commit()
-        logger.info("Tables cleared: events, wikipediaPages, wikiTraffic")
+        logger.info(f"Tables cleared: {', '.join(tables_to_clear)}")
 
 def print_all_tables(app):
     with app.app_context():
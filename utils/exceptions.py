@@ -1,10 +1,9 @@
 import traceback
-import logging
 import sys
 
-# Ensure logger is configured
-logging.basicConfig(level=logging.ERROR)
-logger = logging.getLogger(__name__)
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 def handle_exception(e):
     """Handle exceptions by logging the error details."""
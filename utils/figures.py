@@ -0,0 +1,77 @@
+import os
+
+from PIL import Image
+
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Subdirectory of each figure directory holding the derived variants; the analyses only list *.png
+VARIANT_DIRECTORY = 'variants'
+# 'webp', or 'png' for palette-quantized, optimized PNGs
+VARIANT_FORMAT = os.environ.get('FIGURE_VARIANT_FORMAT', 'webp').lower()
+# Lossy WebP quality of the thumbnails; full-resolution WebP variants are lossless, which keeps
+# plot lines sharp and is still far smaller than Matplotlib's PNGs
+VARIANT_QUALITY = int(os.environ.get('FIGURE_VARIANT_QUALITY', 80))
+# Thumbnail widths in pixels, for srcset
+THUMBNAIL_WIDTHS = tuple(int(width) for width in os.environ.get('FIGURE_THUMBNAIL_WIDTHS', '640,1280').split(',') if width)
+
+
+def _save(image, path, lossless):
+    # Written next to the target and renamed, so a concurrent request never serves half a file
+    temporary = f"{path}.tmp"
+    if VARIANT_FORMAT == 'png':
+        image.convert('RGB').quantize(colors=256).save(temporary, format='PNG', optimize=True)
+    else:
+        image.save(temporary, format='WEBP', lossless=lossless, quality=VARIANT_QUALITY, method=4)
+    os.replace(temporary, path)
+
+
+def _is_fresh(path, source_mtime):
+    try:
+        return os.stat(path).st_mtime_ns >= source_mtime
+    except OSError:
+        return False
+
+
+def figure_variants(path):
+    """
+    Write the compressed full-resolution and thumbnail variants of a PNG figure.
+
+    Variants that already exist and are newer than the figure are kept, so this is cheap
+    to call for every figure a page shows.
+
+    Parameters:
+    path (str): Path of the figure, e.g. 'static/peaks_figures/peaks_en_X.png'.
+
+    Returns:
+    dict: 'full' and 'thumbnails' ([width, name] pairs, narrowest first), as names relative
+    to the figure's directory; None if the figure cannot be read.
+    """
+    directory, filename = os.path.split(path)
+    stem = os.path.splitext(filename)[0]
+    extension = 'png' if VARIANT_FORMAT == 'png' else 'webp'
+    variants = {'full': f"{VARIANT_DIRECTORY}/{stem}.{extension}", 'thumbnails': []}
+    try:
+        source_mtime = os.stat(path).st_mtime_ns
+        os.makedirs(os.path.join(directory, VARIANT_DIRECTORY), exist_ok=True)
+        with Image.open(path) as image:
+            width, height = image.size
+            targets = [(None, variants['full'])] + [
+                (w, f"{VARIANT_DIRECTORY}/{stem}.{w}w.{extension}") for w in sorted(THUMBNAIL_WIDTHS) if w < width]
+            for target_width, name in targets:
+                target = os.path.join(directory, name)
+                if target_width is not None:
+                    variants['thumbnails'].append([target_width, name])
+                if _is_fresh(target, source_mtime):
+                    continue
+                if target_width is None:
+                    _save(image, target, lossless=True)
+                else:
+                    size = (target_width, max(1, round(height * target_width / width)))
+                    _save(image.resize(size, Image.LANCZOS), target, lossless=False)
+                logger.debug("Wrote figure variant %s", target)
+    except OSError as e:
+        logger.warning("Could not write variants of %s: %s", path, e)
+        return None
+    return variants
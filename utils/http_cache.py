@@ -0,0 +1,119 @@
+import os
+import hashlib
+import threading
+from datetime import date, datetime
+
+from flask import request, url_for
+
+# Fingerprinted static files never change under the same URL, so browsers may keep them for a year
+STATIC_MAX_AGE = 365 * 24 * 3600
+
+# path -> ((mtime_ns, size), content hash)
+_fingerprints = {}
+_fingerprints_lock = threading.Lock()
+
+
+def make_etag(*parts):
+    """Hash the given version parts into a short strong ETag value (without quotes)."""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:20]
+
+
+def file_stamp(path):
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def directory_stamp(path):
+    """Sorted (name, mtime_ns, size) of every file in a directory; empty if it does not exist."""
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return ()
+    return tuple(sorted((entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                        for entry in entries if entry.is_file()))
+
+
+def file_fingerprint(path):
+    """
+    Content hash of a file, recomputed only when its modification time or size changes.
+
+    Raises:
+    OSError: If the file cannot be read.
+    """
+    stamp = file_stamp(path)
+    if stamp is None:
+        raise FileNotFoundError(path)
+    with _fingerprints_lock:
+        cached = _fingerprints.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 16), b''):
+            digest.update(chunk)
+    fingerprint = digest.hexdigest()[:12]
+    with _fingerprints_lock:
+        _fingerprints[path] = (stamp, fingerprint)
+    return fingerprint
+
+
+def is_not_modified(etag):
+    """Whether the request's If-None-Match already names this ETag, so a 304 can be sent."""
+    return request.method in ('GET', 'HEAD') and request.if_none_match.contains(etag)
+
+
+def set_cache_headers(response, etag, max_age=0):
+    """Attach the ETag and a Cache-Control that lets clients reuse the response after revalidating."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f"private, max-age={max_age}, must-revalidate"
+    return response
+
+
+def fingerprinted_url(app, filename):
+    """URL of a static file with its content hash as ?v=, or the plain URL if it cannot be read."""
+    try:
+        return url_for('static', filename=filename, v=file_fingerprint(os.path.join(app.static_folder, filename)))
+    except OSError:
+        return url_for('static', filename=filename)
+
+
+def init_static_fingerprints(app):
+    """
+    Add a static_url() template function that appends a content hash to static file URLs.
+
+    Responses for fingerprinted URLs (those carrying ?v=) are marked cacheable for a
+    year, since a changed file gets a new URL.
+    """
+    @app.template_global()
+    def static_url(filename):
+        return fingerprinted_url(app, filename)
+
+    @app.after_request
+    def _cache_fingerprinted_static(response):
+        if request.endpoint == 'static' and request.args.get('v') and response.status_code in (200, 304):
+            response.headers['Cache-Control'] = f"public, max-age={STATIC_MAX_AGE}, immutable"
+        return response
+
+
+def to_jsonable(value):
+    """Convert analysis results (NumPy values, DataFrames, timestamps) into plain JSON types."""
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_jsonable(item) for item in value]
+    if hasattr(value, 'to_dict') and hasattr(value, 'columns'):
+        return to_jsonable(value.to_dict(orient='records'))
+    if hasattr(value, 'tolist'):
+        return to_jsonable(value.tolist())
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, float) and value != value:
+        return None
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
@@ -0,0 +1,99 @@
+import os
+import queue
+import atexit
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+import colorlog
+
+LOG_FORMAT = "%(log_color)s%(levelname)s:%(name)s:%(message)s (%(filename)s:%(lineno)d)"
+LOG_COLORS = {
+    'DEBUG': 'cyan',
+    'INFO': 'green',
+    'WARNING': 'yellow',
+    'ERROR': 'red',
+    'CRITICAL': 'bold_red',
+}
+
+_configured = False
+_configure_lock = threading.Lock()
+_listener = None
+_queue_handler = None
+
+
+def parse_levels(spec):
+    """
+    Parse per-subsystem levels such as 'services.arima_service=DEBUG,utils=WARNING'.
+
+    Returns:
+    dict: Logger name to level name.
+    """
+    levels = {}
+    for item in (spec or '').split(','):
+        if '=' in item:
+            name, level = item.split('=', 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging():
+    """
+    Install the application's single console handler on the root logger, once per process.
+
+    Records are put on an in-memory queue by the calling thread and written to the
+    console by a background listener, so request threads never wait on stdout.
+    Configured through LOG_LEVEL (default INFO), LOG_LEVELS (per-logger overrides,
+    e.g. 'services.arima_service=DEBUG,werkzeug=WARNING') and LOG_ASYNC (default True).
+    Forked children (e.g. gunicorn workers of a preloading master) get their own listener.
+    """
+    global _configured, _listener, _queue_handler
+    with _configure_lock:
+        if _configured:
+            return
+        _configured = True
+
+        console = logging.StreamHandler()
+        console.setFormatter(colorlog.ColoredFormatter(LOG_FORMAT, log_colors=LOG_COLORS))
+
+        root = logging.getLogger()
+        root.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+        if os.environ.get('LOG_ASYNC', 'True').lower() == 'true':
+            records = queue.SimpleQueue()
+            _queue_handler = QueueHandler(records)
+            root.addHandler(_queue_handler)
+            _listener = QueueListener(records, console, respect_handler_level=True)
+            _listener.start()
+            atexit.register(_listener.stop)
+            if hasattr(os, 'register_at_fork'):
+                os.register_at_fork(after_in_child=restart_listener)
+        else:
+            root.addHandler(console)
+
+        for name, level in parse_levels(os.environ.get('LOG_LEVELS')).items():
+            logging.getLogger(name).setLevel(level)
+
+
+def restart_listener():
+    """
+    Give this process a fresh queue and listener thread.
+
+    Threads do not survive fork(), so a child of a process that configured logging would
+    otherwise queue its records with nobody writing them. Runs in the child right after
+    the fork, where no other thread exists, so it takes no lock.
+    """
+    global _listener
+    if _listener is None:
+        return
+    atexit.unregister(_listener.stop)
+    records = queue.SimpleQueue()
+    _queue_handler.queue = records
+    _listener = QueueListener(records, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name):
+    """Return a module logger that writes through the shared configuration."""
+    configure_logging()
+    return logging.getLogger(name)
@@ -0,0 +1,160 @@
+import os
+import time
+import bisect
+import threading
+import functools
+
+# Switched on with METRICS_ENABLED; while off every helper returns before touching the registry.
+ENABLED = os.environ.get('METRICS_ENABLED', 'False').lower() == 'true'
+
+# Upper bounds of the duration buckets, in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+# Upper bounds of the row and column count buckets
+SIZE_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000)
+
+
+class Histogram:
+    """Cumulative-bucket histogram with one series per label set, rendered in Prometheus text format."""
+
+    def __init__(self, name, documentation, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0}
+            series['counts'][bisect.bisect_left(self.buckets, value)] += 1
+            series['sum'] += value
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + ('+Inf',), series['counts']):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_labels(key + (('le', bound),))} {cumulative}")
+                lines.append(f"{self.name}_sum{_labels(key)} {series['sum']}")
+                lines.append(f"{self.name}_count{_labels(key)} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter with one value per label set."""
+
+    def __init__(self, name, documentation):
+        self.name = name
+        self.documentation = documentation
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(key)} {value}")
+        return lines
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+STAGE_SECONDS = Histogram('wikitraffic_stage_duration_seconds', 'Time spent in each pipeline stage.', DURATION_BUCKETS)
+FRAME_ROWS = Histogram('wikitraffic_stage_rows', 'Rows of the frames produced or consumed by a stage.', SIZE_BUCKETS)
+FRAME_COLUMNS = Histogram('wikitraffic_stage_columns', 'Columns of the frames produced or consumed by a stage.', SIZE_BUCKETS)
+CACHE_LOOKUPS = Counter('wikitraffic_cache_lookups_total', 'Cache lookups by cache and result.')
+
+_REGISTRY = (STAGE_SECONDS, FRAME_ROWS, FRAME_COLUMNS, CACHE_LOOKUPS)
+
+
+class _Stage:
+    """Context manager and decorator recording the duration of one pipeline stage."""
+
+    __slots__ = ('stage', '_started')
+
+    def __init__(self, stage):
+        self.stage = stage
+        self._started = None
+
+    def __enter__(self):
+        if ENABLED:
+            self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._started is not None:
+            STAGE_SECONDS.observe(time.perf_counter() - self._started, stage=self.stage)
+            self._started = None
+        return False
+
+    def __call__(self, func):
+        stage = self.stage
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            with _Stage(stage):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def timed(stage):
+    """
+    Time a block or a function as one observation of a pipeline stage.
+
+    Works both as ``with timed('peaks'):`` and as ``@timed('peaks')``.
+    """
+    return _Stage(stage)
+
+
+def observe_frame(stage, df):
+    """Record the row and column counts of a frame handled by a stage."""
+    if not ENABLED or df is None:
+        return
+    rows, columns = df.shape if df.ndim == 2 else (len(df), 1)
+    FRAME_ROWS.observe(rows, stage=stage)
+    FRAME_COLUMNS.observe(columns, stage=stage)
+
+
+def record_cache(cache, hit):
+    """Count one lookup of a named cache as a hit or a miss."""
+    if ENABLED:
+        CACHE_LOOKUPS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def reset():
+    """Drop every recorded observation."""
+    for metric in _REGISTRY:
+        metric.clear()
+
+
+def render_prometheus():
+    """Render every metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in _REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,197 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import joblib
+import pandas as pd
+
+from utils.metrics import record_cache
+
+
+# Sidecar keys a stored model cannot be used without
+REQUIRED_METADATA = {'series', 'order', 'fingerprint', 'last_date', 'step_seconds'}
+
+
+class ARIMAModelStore:
+    """
+    On-disk store of fitted ARIMA models with an in-memory LRU of hot models.
+
+    Each series is saved as a compressed joblib file next to a small JSON sidecar
+    holding its order, parameters, training-window fingerprint and the name of its
+    model file. The sidecar is checked first, so stale models are rejected without
+    unpickling them, and a model is only loaded from disk the first time it is requested.
+
+    Every save writes a new model file and then replaces the sidecar, which is the only
+    commit point: a crash at any step leaves either the old pair or the new one.
+    """
+
+    def __init__(self, directory, capacity=32):
+        """
+        Parameters:
+        directory (str): Directory for the model and metadata files.
+        capacity (int): Number of models kept loaded in memory.
+        """
+        self.directory = directory
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self._hot = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def _name(series):
+        return hashlib.sha1(series.encode('utf-8')).hexdigest()[:16]
+
+    def _meta_path(self, series):
+        return os.path.join(self.directory, f"{self._name(series)}.json")
+
+    def _model_path(self, series, metadata):
+        # Sidecars written before model files were versioned point at '<name>.joblib'
+        return os.path.join(self.directory, metadata.get('model_file') or f"{self._name(series)}.joblib")
+
+    def _remember(self, series, entry):
+        with self._lock:
+            self._hot[series] = entry
+            self._hot.move_to_end(series)
+            while len(self._hot) > self.capacity:
+                self._hot.popitem(last=False)
+
+    def save(self, series, model, fingerprint, last_date, step):
+        """
+        Persist a fitted model and keep it hot in memory.
+
+        Parameters:
+        series (str): Series (column) name.
+        model: Fitted pmdarima model.
+        fingerprint (str): Fingerprint of the training window.
+        last_date (pd.Timestamp): Last timestamp the model has seen.
+        step (pd.Timedelta): Spacing between observations.
+        """
+        name = self._name(series)
+        saved_at = datetime.utcnow().isoformat()
+        model_file = f"{name}.{hashlib.sha1(f'{fingerprint}:{saved_at}'.encode('utf-8')).hexdigest()[:8]}.joblib"
+        metadata = {
+            'series': series,
+            'model_file': model_file,
+            'order': list(model.order),
+            'params': [float(p) for p in model.params()],
+            'aic': float(model.aic()),
+            'fingerprint': fingerprint,
+            'last_date': pd.Timestamp(last_date).isoformat(),
+            'step_seconds': pd.Timedelta(step).total_seconds(),
+            'saved_at': saved_at,
+        }
+
+        # The model goes under a new name first; replacing the sidecar then switches to it atomically
+        model_path = os.path.join(self.directory, model_file)
+        meta_path = self._meta_path(series)
+        joblib.dump(model, f"{model_path}.tmp", compress=3)
+        os.replace(f"{model_path}.tmp", model_path)
+        with open(f"{meta_path}.tmp", 'w', encoding='utf-8') as file:
+            json.dump(metadata, file)
+        os.replace(f"{meta_path}.tmp", meta_path)
+        self._remove_stale_models(name, model_file)
+
+        self._remember(series, self._entry(model, metadata))
+
+    def _remove_stale_models(self, name, model_file):
+        for filename in os.listdir(self.directory):
+            if filename.startswith(f"{name}.") and filename.endswith('.joblib') and filename != model_file:
+                try:
+                    os.remove(os.path.join(self.directory, filename))
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _entry(model, metadata):
+        return {
+            'model': model,
+            'fingerprint': metadata['fingerprint'],
+            'order': tuple(metadata['order']),
+            'last_date': pd.Timestamp(metadata['last_date']),
+            'step': pd.Timedelta(seconds=metadata['step_seconds']),
+        }
+
+    def get(self, series, fingerprint=None):
+        """
+        Return the stored entry for a series, loading it from disk on first use.
+
+        Parameters:
+        series (str): Series (column) name.
+        fingerprint (str): When given, only a model trained on this exact window is returned.
+
+        Returns:
+        dict: {'model', 'fingerprint', 'order', 'last_date', 'step'}, or None.
+        """
+        with self._lock:
+            entry = self._hot.get(series)
+            if entry is not None and (fingerprint is None or entry['fingerprint'] == fingerprint):
+                self._hot.move_to_end(series)
+                self.hits += 1
+                record_cache('arima_model', True)
+                return entry
+
+        metadata = self.get_metadata(series)
+        model_path = self._model_path(series, metadata) if metadata is not None else None
+        if metadata is None or (fingerprint is not None and metadata['fingerprint'] != fingerprint) \
+                or not os.path.exists(model_path):
+            with self._lock:
+                self.misses += 1
+            record_cache('arima_model', False)
+            return None
+
+        entry = self._entry(joblib.load(model_path), metadata)
+        with self._lock:
+            self.loads += 1
+            self.hits += 1
+        record_cache('arima_model_disk', True)
+        self._remember(series, entry)
+        return entry
+
+    def get_metadata(self, series):
+        """Return the JSON metadata of a stored series without loading its model; None if missing or invalid."""
+        try:
+            with open(self._meta_path(series), 'r', encoding='utf-8') as file:
+                metadata = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(metadata, dict) or not REQUIRED_METADATA <= metadata.keys() or metadata['series'] != series:
+            return None
+        return metadata
+
+    def clear(self):
+        """Delete every stored model and empty the in-memory LRU."""
+        with self._lock:
+            self._hot.clear()
+        for filename in os.listdir(self.directory):
+            if filename.endswith(('.joblib', '.json', '.tmp')):
+                os.remove(os.path.join(self.directory, filename))
+
+    def stats(self):
+        """
+        Returns:
+        dict: hits, misses, disk loads and the number of hot models.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'loads': self.loads, 'hot': len(self._hot)}
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_model_store():
+    """Return the process-wide model store, configured through ARIMA_MODEL_DIR and ARIMA_MODEL_CACHE_SIZE."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ARIMAModelStore(
+                os.environ.get('ARIMA_MODEL_DIR', 'instance/arima_models'),
+                int(os.environ.get('ARIMA_MODEL_CACHE_SIZE', 32))
+            )
+        return _default_store
@@ -0,0 +1,142 @@
+import os
+import io
+import re
+import time
+import pstats
+import cProfile
+import hmac
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from flask import g, request, has_app_context
+
+# Directory holding the captured profiles
+PROFILE_DIR = os.environ.get('PROFILE_DIR', 'instance/profiles')
+# Oldest profiles are removed beyond this count or age
+PROFILE_MAX_FILES = int(os.environ.get('PROFILE_MAX_FILES', 50))
+PROFILE_MAX_AGE_DAYS = float(os.environ.get('PROFILE_MAX_AGE_DAYS', 7))
+# Number of functions listed in the text summary written next to each profile
+PROFILE_SUMMARY_LINES = 40
+
+_retention_lock = threading.Lock()
+
+
+def _safe_label(label):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', label).strip('_')[:60] or 'run'
+
+
+def save_profile(profiler, label):
+    """
+    Write a finished profile as a pstats file plus a readable summary, then apply retention.
+
+    Parameters:
+    profiler (cProfile.Profile): The disabled profiler.
+    label (str): Short description of the profiled run, used in the file name.
+
+    Returns:
+    str: Path of the .prof file (open it with pstats or snakeviz).
+    """
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}-{_safe_label(label)}"
+    path = os.path.join(PROFILE_DIR, f"{name}.prof")
+    profiler.dump_stats(path)
+
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(PROFILE_SUMMARY_LINES)
+    with open(os.path.join(PROFILE_DIR, f"{name}.txt"), 'w', encoding='utf-8') as file:
+        file.write(summary.getvalue())
+
+    apply_retention()
+    return path
+
+
+def apply_retention(max_files=None, max_age_days=None):
+    """Delete profiles older than PROFILE_MAX_AGE_DAYS and the oldest ones beyond PROFILE_MAX_FILES."""
+    max_files = PROFILE_MAX_FILES if max_files is None else max_files
+    max_age_days = PROFILE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    if not os.path.isdir(PROFILE_DIR):
+        return
+
+    with _retention_lock:
+        # File names start with a UTC timestamp, so they sort newest first in reverse
+        profiles = [os.path.join(PROFILE_DIR, f)
+                    for f in sorted(os.listdir(PROFILE_DIR), reverse=True) if f.endswith('.prof')]
+        cutoff = time.time() - max_age_days * 86400
+        for index, path in enumerate(profiles):
+            if index >= max_files or os.path.getmtime(path) < cutoff:
+                for stale in (path, path[:-len('.prof')] + '.txt'):
+                    if os.path.exists(stale):
+                        os.remove(stale)
+
+
+@contextmanager
+def profile_run(label, enabled=None):
+    """
+    Profile a block such as a background pipeline run.
+
+    Parameters:
+    label (str): Name used for the profile file.
+    enabled (bool): Force profiling on or off; defaults to PROFILE_BACKGROUND.
+    """
+    if enabled is None:
+        enabled = os.environ.get('PROFILE_BACKGROUND', 'False').lower() == 'true'
+    if not enabled:
+        yield None
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        save_profile(profiler, label)
+
+
+def _requested_token():
+    return request.headers.get('X-Profile') or request.args.get('profile')
+
+
+def _profiling_requested():
+    token = os.environ.get('PROFILE_ADMIN_TOKEN')
+    supplied = _requested_token()
+    return bool(token) and bool(supplied) and hmac.compare_digest(supplied.encode('utf-8'), token.encode('utf-8'))
+
+
+def init_request_profiling(app):
+    """
+    Let an admin profile a single request.
+
+    A request carrying the PROFILE_ADMIN_TOKEN in an 'X-Profile' header or a 'profile'
+    query parameter runs under cProfile; the profile path is returned in the
+    'X-Profile-Path' response header. Nothing happens while no token is configured.
+    A request that fails before its response is built still has its profiler disabled
+    and saved at teardown, so the profiler never outlives the request.
+    """
+    @app.before_request
+    def _start_request_profile():
+        if _profiling_requested():
+            g.profiler = cProfile.Profile()
+            g.profiler.enable()
+
+    @app.after_request
+    def _finish_request_profile(response):
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            path = save_profile(profiler, f"{request.method}-{request.path}")
+            response.headers['X-Profile-Path'] = path
+        return response
+
+    @app.teardown_request
+    def _stop_request_profile(exception):
+        # Streamed responses can tear the request down after the app context is gone,
+        # and after_request has already handled their profiler
+        if not has_app_context():
+            return
+        # Only still set when after_request did not run, e.g. for an unhandled exception
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            save_profile(profiler, f"{request.method}-{request.path}-failed")
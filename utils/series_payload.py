@@ -0,0 +1,76 @@
+import numpy as np
+
+# Values of float series are rounded to this many decimals in JSON payloads
+FLOAT_DECIMALS = 3
+
+
+def delta_encode(values):
+    """First value followed by the day-to-day differences; small numbers that compress well."""
+    values = np.asarray(values, dtype=np.int64)
+    if values.size == 0:
+        return []
+    return np.concatenate(([values[0]], np.diff(values))).tolist()
+
+
+def delta_decode(deltas):
+    """Inverse of delta_encode."""
+    return np.cumsum(np.asarray(deltas, dtype=np.int64)).tolist()
+
+
+def typed_array(values):
+    """
+    The values as little-endian bytes of the JavaScript typed array matching their dtype.
+
+    Returns:
+    tuple: (bytes, 'uint32' or 'float32').
+    """
+    values = np.asarray(values)
+    if _is_whole(values):
+        return values.astype('<u4').tobytes(), 'uint32'
+    return values.astype('<f4').tobytes(), 'float32'
+
+
+def _is_whole(values):
+    return values.size == 0 or (
+        np.isfinite(values).all() and (values >= 0).all() and (values <= np.iinfo(np.uint32).max).all()
+        and (values == np.floor(values)).all())
+
+
+def encode_series(name, start, values, peaks=None, forecast=None):
+    """
+    Build the compact JSON payload of one daily series for the client-side chart.
+
+    Whole-number series are delta-encoded; others are sent as values rounded to
+    FLOAT_DECIMALS decimals. Days are implied by the start date and the position.
+
+    Parameters:
+    name (str): Series name.
+    start (date): Date of the first value.
+    values (array-like): Daily values, gaps as 0.
+    peaks (list): Positions of detected peaks, if any.
+    forecast (list): {'date', 'mean', 'lower', 'upper'} records from ARIMAService.forecast, if any.
+
+    Returns:
+    dict: The payload.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    payload = {
+        'series': name,
+        'start': start.isoformat() if start is not None else None,
+        'step': 'day',
+        'length': int(values.size),
+    }
+    if _is_whole(values):
+        payload.update(encoding='delta', values=delta_encode(values))
+    else:
+        payload.update(encoding='plain', values=np.round(values, FLOAT_DECIMALS).tolist())
+    if peaks is not None:
+        payload['peaks'] = [int(position) for position in peaks]
+    if forecast is not None:
+        payload['forecast'] = {
+            'start': forecast[0]['date'][:10] if forecast else None,
+            'mean': [round(record['mean'], FLOAT_DECIMALS) for record in forecast],
+            'lower': [round(record['lower'], FLOAT_DECIMALS) for record in forecast],
+            'upper': [round(record['upper'], FLOAT_DECIMALS) for record in forecast],
+        }
+    return payload
@@ -0,0 +1,172 @@
+import os
+import re
+import json
+import zlib
+import hashlib
+import tempfile
+import threading
+
+from utils.metrics import record_cache
+
+_RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def encode_chunks(chunks, encoding='utf-8'):
+    """Encode a stream of text chunks to bytes, skipping empty ones."""
+    for chunk in chunks:
+        if chunk:
+            yield chunk.encode(encoding) if isinstance(chunk, str) else chunk
+
+
+def gzip_chunks(chunks, level=6):
+    """Compress a stream of byte chunks incrementally into one gzip stream."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class ExportSpoolCache:
+    """
+    Export bodies spooled to disk and keyed by their version, for Range requests.
+
+    A resumed or parallel download asks for one slice after another of the same body, so
+    each version is generated once and every slice is read back from its file. Files are
+    written under a temporary name and renamed into place, so workers sharing the directory
+    never see a partial body; the least recently used files beyond max_files are removed.
+    """
+
+    def __init__(self, directory, max_files=8):
+        """
+        Parameters:
+        directory (str): Directory for the spooled bodies.
+        max_files (int): Number of bodies kept.
+        """
+        self.directory = directory
+        self.max_files = max_files
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, version):
+        return os.path.join(self.directory, f"{hashlib.sha1(version.encode('utf-8')).hexdigest()}.spool")
+
+    def open(self, version, chunks):
+        """
+        Open the spooled body of a version, writing it from chunks() on a miss.
+
+        Parameters:
+        version (str): Identifies the exported content, e.g. the ETag value.
+        chunks (callable): Returns a fresh generator of the body's byte chunks.
+
+        Returns:
+        tuple: (binary file positioned at its start, total size); the caller closes the file.
+        """
+        path = self._path(version)
+        try:
+            file = open(path, 'rb')
+            os.utime(path)
+            record_cache('export_spool', True)
+        except FileNotFoundError:
+            record_cache('export_spool', False)
+            file = tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False)
+            try:
+                for chunk in chunks():
+                    file.write(chunk)
+                file.flush()
+                os.replace(file.name, path)
+            except BaseException:
+                file.close()
+                os.remove(file.name)
+                raise
+            self._evict()
+        total = file.seek(0, os.SEEK_END)
+        file.seek(0)
+        return file, total
+
+    def _evict(self):
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith('.spool')]
+        if len(paths) <= self.max_files:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_files]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+_export_spool_cache = None
+_export_spool_cache_lock = threading.Lock()
+
+
+def get_export_spool_cache():
+    """Return the process-wide export spool cache (EXPORT_SPOOL_DIR, EXPORT_SPOOL_MAX_FILES)."""
+    global _export_spool_cache
+    with _export_spool_cache_lock:
+        if _export_spool_cache is None:
+            _export_spool_cache = ExportSpoolCache(
+                os.environ.get('EXPORT_SPOOL_DIR', 'instance/export_spools'),
+                int(os.environ.get('EXPORT_SPOOL_MAX_FILES', 8))
+            )
+        return _export_spool_cache
+
+
+def iter_file_range(file, start, end, chunk_size=64 * 1024):
+    """Yield bytes start..end (inclusive) of an open file in chunks, closing it afterwards."""
+    try:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def parse_range(header, total):
+    """
+    Parse a single-range 'Range: bytes=a-b' header.
+
+    Parameters:
+    header (str): The Range header value.
+    total (int): Size of the full representation.
+
+    Returns:
+    tuple: (start, end) inclusive, or None if the header is missing, multi-range or unsatisfiable.
+    """
+    match = _RANGE_PATTERN.match((header or '').strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first == '':
+        start, end = max(total - int(last), 0), total - 1
+    else:
+        start = int(first)
+        end = min(int(last), total - 1) if last else total - 1
+    if start > end or start >= total:
+        return None
+    return start, end
+
+
+def iter_csv_file(path, chunk_size=64 * 1024):
+    """Yield a file's bytes in fixed-size chunks."""
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def iter_csv_as_ndjson(path, rows_per_chunk=5000):
+    """Convert a CSV file to newline-delimited JSON, reading it in row chunks."""
+    # Imported here so that loading the app does not pull in pandas
+    import pandas as pd
+
+    for frame in pd.read_csv(path, chunksize=rows_per_chunk):
+        records = frame.astype(object).where(frame.notna(), None).to_dict(orient='records')
+        yield ''.join(json.dumps(record, default=str) + '\n' for record in records)
@@ -0,0 +1,181 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Largest count stored exactly in the uint32 layout
+UINT32_MAX = np.iinfo(np.uint32).max
+
+
+class SeriesCatalogue:
+    """
+    Interned '{language}_{title}' series names and their integer ids.
+
+    Every name is stored once and split into language and title once, so consumers
+    pass small ids around instead of re-hashing and re-parsing long strings.
+    """
+
+    def __init__(self, names):
+        self.names = tuple(sys.intern(str(name)) for name in names)
+        self.ids = {name: index for index, name in enumerate(self.names)}
+        if len(self.ids) != len(self.names):
+            raise ValueError("Series names must be unique")
+        parts = [name.split('_', 1) for name in self.names]
+        self.languages = tuple(sys.intern(p[0]) if len(p) > 1 else 'unknown' for p in parts)
+        self.titles = tuple(p[1] if len(p) > 1 else p[0] for p in parts)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def id(self, name):
+        """Return the id of a series name; raises KeyError for unknown names."""
+        return self.ids[name]
+
+
+class TrafficMatrix:
+    """
+    Read-mostly layout of the daily traffic frame in a narrower dtype.
+
+    Values live in one dense (series x days) array, uint32 when every count is a whole
+    number that fits and float32 otherwise, over a single shared datetime index. The
+    array still spans the full date range for every series, so the saving over the
+    float64 frame comes from the 4-byte values alone (about half the size); a series
+    that starts late takes a full row all the same. Each series records the offsets of
+    its first observed day and of the day after its last one; days outside that span
+    are stored as 0, as are gaps inside it, which is what the analyses fill NaN with.
+    The offsets of those interior gaps are kept per series (only for series that have
+    any), so the observed days can be recovered.
+    Each series is a contiguous row, so padded() returns a view, as does series() for a
+    series without interior gaps. Views keep the storage dtype: cast before arithmetic
+    that can go negative, since uint32 wraps around.
+    """
+
+    def __init__(self, values, dates, starts, stops, catalogue, gaps=None):
+        if values.shape != (len(catalogue), len(dates)) or not len(starts) == len(stops) == len(catalogue):
+            raise ValueError("values must be shaped (series, dates) and have one start and stop offset per series")
+        self.values = values
+        self.dates = dates
+        self.starts = starts
+        self.stops = stops
+        self.catalogue = catalogue
+        # Series id to the sorted int32 offsets of days without a count inside its span
+        self.gaps = gaps or {}
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Build a matrix from a frame shaped like get_traffic_data_as_dataframe output.
+
+        Parameters:
+        df (pd.DataFrame): A 'date' column followed by one float column per series.
+
+        Returns:
+        TrafficMatrix: The compact copy; the frame itself is left untouched.
+        """
+        columns = [column for column in df.columns if column != 'date']
+        if 'date' not in df.columns:
+            return cls(np.zeros((0, 0), dtype=np.uint32), np.array([], dtype='datetime64[D]'),
+                       np.array([], dtype=np.int32), np.array([], dtype=np.int32), SeriesCatalogue([]))
+        dates = pd.to_datetime(df['date']).to_numpy()
+        order = np.argsort(dates, kind='stable')
+        dates = dates[order]
+        if (dates == dates.astype('datetime64[D]')).all():
+            dates = dates.astype('datetime64[D]')
+
+        raw = df[columns].to_numpy(dtype=np.float64)[order].T
+        observed = ~np.isnan(raw)
+        # A series that never has a count starts past the last day
+        starts = np.where(observed.any(axis=1), observed.argmax(axis=1), raw.shape[1]).astype(np.int32)
+        stops = np.where(observed.any(axis=1), raw.shape[1] - observed[:, ::-1].argmax(axis=1), raw.shape[1]).astype(np.int32)
+        days = np.arange(raw.shape[1])
+        rows, offsets = np.nonzero(~observed & (days >= starts[:, None]) & (days < stops[:, None]))
+        boundaries = np.flatnonzero(np.diff(rows)) + 1
+        gaps = {int(group_rows[0]): group_offsets.astype(np.int32)
+                for group_rows, group_offsets in zip(np.split(rows, boundaries), np.split(offsets, boundaries))
+                if group_rows.size}
+
+        filled = np.where(observed, raw, 0.0)
+        whole = (filled >= 0).all() and (filled <= UINT32_MAX).all() and (filled == np.floor(filled)).all()
+        values = np.ascontiguousarray(filled, dtype=np.uint32 if whole else np.float32)
+        # Views handed out are shared, so nobody may write through them
+        values.setflags(write=False)
+        return cls(values, dates, starts, stops, SeriesCatalogue(columns), gaps)
+
+    @property
+    def columns(self):
+        return list(self.catalogue.names)
+
+    @property
+    def nbytes(self):
+        return (self.values.nbytes + self.dates.nbytes + self.starts.nbytes + self.stops.nbytes
+                + sum(offsets.nbytes for offsets in self.gaps.values()))
+
+    def __len__(self):
+        return len(self.catalogue)
+
+    def __contains__(self, name):
+        return name in self.catalogue
+
+    def padded(self, name):
+        """The whole row of a series, zeros outside its span and in its gaps, as a view over the shared dates."""
+        return self.values[self.catalogue.id(name)]
+
+    def observed(self, name):
+        """
+        Locate the observed days of a series.
+
+        Returns:
+        tuple: (start, stop, keep) where keep is a boolean mask over start:stop that is
+        False on interior gaps, or None if the series has none.
+        """
+        index = self.catalogue.id(name)
+        start, stop = int(self.starts[index]), int(self.stops[index])
+        gaps = self.gaps.get(index)
+        if gaps is None:
+            return start, stop, None
+        keep = np.ones(stop - start, dtype=bool)
+        keep[gaps - start] = False
+        return start, stop, keep
+
+    def series(self, name):
+        """
+        The observed days of a series.
+
+        Returns:
+        tuple: (dates, values) from the series' first to its last observed day, without the
+        days in between that have no count; views unless the series has such gaps.
+        """
+        start, stop, keep = self.observed(name)
+        dates, values = self.dates[start:stop], self.values[self.catalogue.id(name), start:stop]
+        if keep is None:
+            return dates, values
+        return dates[keep], values[keep]
+
+    def to_frame(self, columns=None):
+        """
+        Expand back to the float64 frame layout, with NaN on every day a series has no count.
+
+        Parameters:
+        columns (list): Series to include; defaults to all.
+
+        Returns:
+        pd.DataFrame: A 'date' column followed by one column per series (a copy).
+        """
+        columns = self.columns if columns is None else list(columns)
+        dates = pd.DatetimeIndex(self.dates)
+        data = {'date': dates.date if self.dates.dtype == 'datetime64[D]' else dates}
+        for name in columns:
+            index = self.catalogue.id(name)
+            column = self.values[index].astype(np.float64)
+            column[:self.starts[index]] = np.nan
+            column[self.stops[index]:] = np.nan
+            if index in self.gaps:
+                column[self.gaps[index]] = np.nan
+            data[name] = column
+        return pd.DataFrame(data)
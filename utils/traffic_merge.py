@@ -0,0 +1,99 @@
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+COLLISION_POLICIES = ('sum', 'first', 'error')
+
+
+def merge_traffic_frames(frames, on_collision='sum', freq='D'):
+    """
+    Merge per-article traffic frames into one wide frame in a single pass.
+
+    Every frame is indexed by timestamp (as returned by get_wikipedia_traffic_data)
+    and holds one or more series columns. The union of all timestamps becomes one
+    aligned index and each frame is written straight into a preallocated 2-D array,
+    so the cost is linear in the number of pages.
+
+    Parameters:
+    frames (list): Timestamp-indexed DataFrames.
+    on_collision (str): What to do when two frames carry the same column key:
+        'sum' adds the views of both pages, 'first' keeps the first page seen,
+        'error' raises a ValueError.
+    freq (str): Frequency of the aligned index.
+
+    Returns:
+    pd.DataFrame: One column per unique key plus a trailing 'date' column, sorted by date.
+    For daily data 'date' holds datetime.date values, otherwise timestamps.
+    """
+    if on_collision not in COLLISION_POLICIES:
+        raise ValueError(f"Unknown collision policy '{on_collision}', expected one of {COLLISION_POLICIES}")
+
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    # First pass over the (cheap) metadata: column keys and the overall date span
+    keys = {}
+    for frame in frames:
+        for column in frame.columns:
+            if column in keys:
+                if on_collision == 'error':
+                    raise ValueError(f"Duplicate traffic column '{column}'")
+                logger.warning(f"Duplicate traffic column '{column}', applying '{on_collision}' policy")
+            else:
+                keys[column] = len(keys)
+
+    start = min(frame.index.min() for frame in frames)
+    end = max(frame.index.max() for frame in frames)
+    index = pd.date_range(start, end, freq=freq)
+    step = pd.Timedelta(pd.tseries.frequencies.to_offset(freq))
+
+    values = np.full((len(index), len(keys)), np.nan)
+    filled = np.zeros(len(keys), dtype=bool)
+
+    for frame in frames:
+        rows = _row_positions(frame.index, start, step, index)
+        frame_values = frame.to_numpy(dtype=float)
+        for j, column in enumerate(frame.columns):
+            target = keys[column]
+            incoming = frame_values[:, j]
+            if not filled[target]:
+                values[rows, target] = incoming
+                filled[target] = True
+                continue
+
+            existing = values[rows, target]
+            if on_collision == 'sum':
+                both_missing = np.isnan(existing) & np.isnan(incoming)
+                merged = np.nan_to_num(existing) + np.nan_to_num(incoming)
+                merged[both_missing] = np.nan
+            else:
+                merged = np.where(np.isnan(existing), incoming, existing)
+            values[rows, target] = merged
+
+    merged_df = pd.DataFrame(values, columns=list(keys))
+    # Daily frames keep plain dates; finer granularities keep the full timestamp
+    merged_df['date'] = index.date if step == pd.Timedelta(days=1) else index
+    return merged_df
+
+
+def _row_positions(frame_index, start, step, index):
+    """
+    Map a frame's timestamps onto rows of the aligned index.
+
+    Regular frames (the common case after asfreq) map to a contiguous slice;
+    anything else falls back to a hash lookup.
+    """
+    span = frame_index[-1] - frame_index[0]
+    offset = frame_index[0] - start
+    if frame_index.is_monotonic_increasing and frame_index.is_unique \
+            and span == step * (len(frame_index) - 1) and offset % step == pd.Timedelta(0):
+        first = offset // step
+        return slice(first, first + len(frame_index))
+
+    positions = index.get_indexer(frame_index)
+    if (positions < 0).any():
+        raise ValueError("Traffic frame timestamps do not align with the merged index")
+    return positions
@@ -0,0 +1,137 @@
+import os
+import json
+import shutil
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# File naming the published snapshot; replaced atomically on every publish
+POINTER_FILE = 'CURRENT'
+# Published snapshots kept on disk, so workers still mapping an older one can finish with it
+KEEP_SNAPSHOTS = 3
+
+
+def snapshot_enabled():
+    """Whether analyses read the traffic matrix from the shared snapshot (TRAFFIC_SNAPSHOT)."""
+    return os.environ.get('TRAFFIC_SNAPSHOT', 'False').lower() == 'true'
+
+
+def snapshot_directory():
+    return os.environ.get('TRAFFIC_SNAPSHOT_DIR', 'instance/traffic_snapshot')
+
+
+def publish_snapshot(df, directory=None):
+    """
+    Write a traffic frame as a memory-mappable snapshot and make it the current one.
+
+    The values go to a float64 .npy matrix and the dates and column names to side
+    files inside a fresh version directory; the CURRENT pointer is then swapped with
+    os.replace, so readers see either the old or the new snapshot, never a partial one.
+
+    Parameters:
+    df (pd.DataFrame): Frame with a 'date' column and one column per series.
+    directory (str): Snapshot root; defaults to TRAFFIC_SNAPSHOT_DIR.
+
+    Returns:
+    str: The published version.
+    """
+    directory = directory or snapshot_directory()
+    columns = [column for column in df.columns if column != 'date']
+    version = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+    target = os.path.join(directory, version)
+    os.makedirs(target)
+
+    np.save(os.path.join(target, 'values.npy'), df[columns].to_numpy(dtype=np.float64))
+    np.save(os.path.join(target, 'dates.npy'), pd.to_datetime(df['date']).to_numpy(dtype='datetime64[D]'))
+    with open(os.path.join(target, 'columns.json'), 'w', encoding='utf-8') as file:
+        json.dump(columns, file)
+
+    pointer = os.path.join(directory, POINTER_FILE)
+    with open(f"{pointer}.tmp", 'w', encoding='utf-8') as file:
+        file.write(version)
+    os.replace(f"{pointer}.tmp", pointer)
+
+    _prune(directory)
+    return version
+
+
+def _prune(directory):
+    versions = sorted(entry for entry in os.listdir(directory) if os.path.isdir(os.path.join(directory, entry)))
+    for stale in versions[:-KEEP_SNAPSHOTS]:
+        # Unlinking is safe on POSIX even while another process still maps the files
+        shutil.rmtree(os.path.join(directory, stale), ignore_errors=True)
+
+
+class TrafficSnapshot:
+    """
+    Read-only view of the published traffic matrix, shared between processes through mmap.
+
+    The matrix is mapped rather than read, so every worker forked from a master that
+    opened it, or that maps the same file later, shares the same physical pages.
+    Each call to frame() checks the CURRENT pointer and remaps when a newer snapshot
+    has been published.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or snapshot_directory()
+        self.version = None
+        self._values = None
+        self._dates = None
+        self._columns = None
+        self._lock = threading.Lock()
+
+    def _current_version(self):
+        try:
+            with open(os.path.join(self.directory, POINTER_FILE), 'r', encoding='utf-8') as file:
+                return file.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def refresh(self):
+        """Map the current snapshot if it differs from the mapped one. Returns False when none is published."""
+        version = self._current_version()
+        if version is None:
+            return False
+        if version == self.version:
+            return True
+        with self._lock:
+            if version != self.version:
+                path = os.path.join(self.directory, version)
+                values = np.load(os.path.join(path, 'values.npy'), mmap_mode='r')
+                dates = np.load(os.path.join(path, 'dates.npy'))
+                with open(os.path.join(path, 'columns.json'), 'r', encoding='utf-8') as file:
+                    columns = json.load(file)
+                self._values, self._dates, self._columns = values, pd.DatetimeIndex(dates).date, columns
+                self.version = version
+        return True
+
+    def frame(self):
+        """
+        Build a DataFrame over the mapped matrix, or None when no snapshot is published.
+
+        The series columns are views of the shared read-only pages; only the frame
+        object and its 'date' column are per call, so callers may reindex or drop
+        columns freely but must copy before writing values in place.
+        """
+        if not self.refresh():
+            return None
+        with self._lock:
+            values, dates, columns = self._values, self._dates, self._columns
+        df = pd.DataFrame(values, columns=columns, copy=False)
+        df.insert(0, 'date', dates)
+        return df
+
+
+_default_snapshot = None
+_default_snapshot_lock = threading.Lock()
+
+
+def get_traffic_snapshot():
+    """Return the process-wide snapshot reader for TRAFFIC_SNAPSHOT_DIR."""
+    global _default_snapshot
+    with _default_snapshot_lock:
+        if _default_snapshot is None:
+            _default_snapshot = TrafficSnapshot()
+        return _default_snapshot